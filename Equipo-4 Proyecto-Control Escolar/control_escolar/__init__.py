@@ -0,0 +1,20 @@
+"""
+Núcleo del Sistema de Control Escolar
+
+Contiene el modelo de datos y el sistema con persistencia. No depende de
+tkinter, por lo que puede usarse desde scripts, procesos por lotes o
+servidores sin pantalla.
+"""
+
+from .modelos import Persona, Alumno, Docente, Materia, Calificacion, Horario
+from .sistema import SistemaControlEscolar
+
+__all__ = [
+    'Persona',
+    'Alumno',
+    'Docente',
+    'Materia',
+    'Calificacion',
+    'Horario',
+    'SistemaControlEscolar',
+]
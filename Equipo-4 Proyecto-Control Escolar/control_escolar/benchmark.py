@@ -0,0 +1,554 @@
+"""
+Pruebas de rendimiento con datos sintéticos
+Genera archivos datos_escuela.json de tamaño configurable y mide las operaciones del sistema
+
+Uso:
+    python -m control_escolar.benchmark generar datos_grandes.json --alumnos 100000 --calificaciones 5000000
+    python -m control_escolar.benchmark ejecutar --tamanos pequeno mediano --guardar-base base.json
+    python -m control_escolar.benchmark ejecutar --tamanos pequeno mediano --comparar base.json
+    python -m control_escolar.benchmark memoria --tamano grande --muestra 200000
+    python -m control_escolar.benchmark carga --tamano mediano
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import List, Dict, Iterable, Iterator
+
+from .modelos import (Alumno, Docente, Materia, Calificacion, Horario, internar_campos,
+                      hidratar_alumnos, hidratar_docentes, hidratar_materias, hidratar_horarios)
+from .columnar import AlmacenCalificaciones
+from .sistema import SistemaControlEscolar
+from .reportes import percentil
+
+
+# Cantidad de registros de cada colección por tamaño predefinido
+TAMANOS = {
+    'pequeno': {'alumnos': 1000, 'docentes': 50, 'materias': 60, 'calificaciones': 50000,
+                'horarios': 1000},
+    'mediano': {'alumnos': 10000, 'docentes': 200, 'materias': 200, 'calificaciones': 500000,
+                'horarios': 5000},
+    'grande': {'alumnos': 100000, 'docentes': 1000, 'materias': 500, 'calificaciones': 5000000,
+               'horarios': 20000},
+}
+
+GRADOS = [str(g) for g in range(1, 7)]
+GRUPOS = ['A', 'B', 'C', 'D', 'E']
+SEMESTRES = [f"{anio}-{periodo}" for anio in range(2015, 2031) for periodo in (1, 2)]
+DIAS = ["LUNES", "MARTES", "MIÉRCOLES", "JUEVES", "VIERNES", "SÁBADO", "DOMINGO"]
+NOMBRES = ["Ana", "Luis", "María", "José", "Sofía", "Carlos", "Valeria", "Diego", "Fernanda", "Jorge"]
+APELLIDOS = ["García", "Hernández", "López", "Martínez", "González", "Pérez", "Rodríguez", "Sánchez"]
+ESPECIALIDADES = ["Matemáticas", "Español", "Ciencias", "Historia", "Inglés", "Educación Física"]
+
+# Diferencia (proporción) a partir de la cual se marca una regresión contra la base
+UMBRAL_REGRESION = 0.20
+
+
+# ---------------------------------------------------------------------------
+# Generación de datos
+# ---------------------------------------------------------------------------
+
+def _alumnos(n: int, rnd: random.Random) -> Iterator[Dict]:
+    for i in range(n):
+        matricula = f"A{i:07d}"
+        yield {
+            'id': matricula,
+            'nombre': rnd.choice(NOMBRES),
+            'apellido': rnd.choice(APELLIDOS),
+            'fecha_nacimiento': f"{rnd.randint(2005, 2018)}-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}",
+            'telefono': f"55{rnd.randint(10000000, 99999999)}",
+            'matricula': matricula,
+            'grado': GRADOS[i % len(GRADOS)],
+            'grupo': GRUPOS[(i // len(GRADOS)) % len(GRUPOS)],
+            'activo': rnd.random() > 0.05,
+            'fecha_alta': "2024-08-19 08:00:00",
+            'fecha_baja': None
+        }
+
+
+def _docentes(n: int, rnd: random.Random) -> Iterator[Dict]:
+    for i in range(n):
+        num_empleado = f"E{i:05d}"
+        yield {
+            'id': num_empleado,
+            'nombre': rnd.choice(NOMBRES),
+            'apellido': rnd.choice(APELLIDOS),
+            'fecha_nacimiento': f"{rnd.randint(1960, 1998)}-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}",
+            'telefono': f"55{rnd.randint(10000000, 99999999)}",
+            'num_empleado': num_empleado,
+            'especialidad': rnd.choice(ESPECIALIDADES),
+            'email': f"{num_empleado.lower()}@escuela.edu.mx"
+        }
+
+
+def _materias(n: int) -> Iterator[Dict]:
+    for i in range(n):
+        yield {
+            'id': f"M{i:04d}",
+            'nombre': f"{ESPECIALIDADES[i % len(ESPECIALIDADES)]} {i // len(ESPECIALIDADES) + 1}",
+            'grado': GRADOS[i % len(GRADOS)],
+            'descripcion': ""
+        }
+
+
+def _calificaciones(n: int, num_alumnos: int, num_materias: int, rnd: random.Random) -> Iterator[Dict]:
+    """Reparte n calificaciones entre los alumnos sin repetir (alumno, materia, semestre)"""
+    materias_por_grado = {g: [f"M{i:04d}" for i in range(num_materias) if GRADOS[i % len(GRADOS)] == g]
+                          for g in GRADOS}
+    generadas = 0
+    siguiente_id = 1
+    for i in range(num_alumnos):
+        if generadas >= n:
+            break
+        materias = materias_por_grado[GRADOS[i % len(GRADOS)]]
+        if not materias:
+            continue
+        cuota = min(n // num_alumnos + (1 if i < n % num_alumnos else 0),
+                    len(materias) * len(SEMESTRES), n - generadas)
+        matricula = f"A{i:07d}"
+        for k in range(cuota):
+            materia_id = materias[k % len(materias)]
+            semestre = SEMESTRES[k // len(materias)]
+            yield {
+                'id': siguiente_id,
+                'matricula_alumno': matricula,
+                'materia_id': materia_id,
+                'semestre': semestre,
+                'calificacion': round(min(100.0, max(0.0, rnd.gauss(78, 12))), 1),
+                'fecha_registro': "2024-08-19 08:00:00"
+            }
+            siguiente_id += 1
+        generadas += cuota
+
+
+def _horarios(n: int, num_docentes: int, num_materias: int) -> Iterator[Dict]:
+    """Horarios de una hora repartidos por grupo; cada grupo usa su propia aula"""
+    grupos = [(g, gr) for g in GRADOS for gr in GRUPOS]
+    franjas_semana = len(DIAS) * 14
+    for k in range(min(n, len(grupos) * franjas_semana)):
+        grado, grupo = grupos[k % len(grupos)]
+        periodo = k // len(grupos)
+        hora = 7 + periodo % 14
+        materias = [i for i in range(num_materias) if GRADOS[i % len(GRADOS)] == grado] or [0]
+        yield {
+            'id': f"H{k:06d}",
+            'materia_id': f"M{materias[periodo % len(materias)]:04d}",
+            'docente_id': f"E{(k % len(grupos) + periodo) % max(num_docentes, 1):05d}",
+            'grado': grado,
+            'grupo': grupo,
+            'dia': DIAS[periodo // 14],
+            'hora_inicio': f"{hora:02d}:00",
+            'hora_fin': f"{hora + 1:02d}:00",
+            'aula': f"AULA-{grado}{grupo}"
+        }
+
+
+def generar_datos(ruta: str, alumnos: int = 1000, docentes: int = 50, materias: int = 60,
+                  calificaciones: int = 50000, horarios: int = 1000, semilla: int = 0) -> Dict[str, int]:
+    """Escribir un archivo de datos sintético con el formato de guardar_datos
+
+    Los registros se escriben uno a uno, sin armar las listas completas en
+    memoria. Devuelve cuántos registros se escribieron de cada colección.
+    """
+    rnd = random.Random(semilla)
+    colecciones = [
+        ('alumnos', _alumnos(alumnos, rnd)),
+        ('docentes', _docentes(docentes, rnd)),
+        ('materias', _materias(materias)),
+        ('calificaciones', _calificaciones(calificaciones, alumnos, materias, rnd)),
+        ('horarios', _horarios(horarios, docentes, materias)),
+    ]
+    conteo = {}
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write('{')
+        for i, (nombre, registros) in enumerate(colecciones):
+            f.write(f'{"," if i else ""}\n    "{nombre}": [')
+            total = 0
+            for registro in registros:
+                f.write((',\n        ' if total else '\n        ') + json.dumps(registro, ensure_ascii=False))
+                total += 1
+            f.write('\n    ]' if total else ']')
+            conteo[nombre] = total
+        f.write('\n}\n')
+    return conteo
+
+
+# ---------------------------------------------------------------------------
+# Medición
+# ---------------------------------------------------------------------------
+
+def _medir(funcion, repeticiones: int, antes=None) -> Dict:
+    """Latencias de varias llamadas; antes() se ejecuta fuera del tiempo medido
+
+    Con más de una repetición se hace primero una llamada de calentamiento sin medir.
+    """
+    if repeticiones > 1:
+        if antes:
+            antes()
+        funcion()
+    latencias = []
+    for _ in range(repeticiones):
+        if antes:
+            antes()
+        inicio = time.perf_counter()
+        funcion()
+        latencias.append(time.perf_counter() - inicio)
+    return _resumir(latencias)
+
+
+def _resumir(latencias: List[float]) -> Dict:
+    ordenadas = sorted(latencias)
+    total = sum(ordenadas)
+    return {
+        'llamadas': len(ordenadas),
+        'total_s': total,
+        'ops_por_s': len(ordenadas) / total if total else 0.0,
+        'p50_ms': percentil(ordenadas, 50) * 1000,
+        'p95_ms': percentil(ordenadas, 95) * 1000,
+        'p99_ms': percentil(ordenadas, 99) * 1000,
+    }
+
+
+def medir_tamano(ruta_datos: str, repeticiones: int = 20, medir_memoria: bool = True) -> Dict:
+    """Medir las operaciones del sistema sobre un archivo de datos
+
+    Las consultas se miden sin caché (se vacía antes de cada llamada) para
+    reflejar el costo real del método. registrar_calificacion se mide dentro
+    de escritura_diferida: la escritura del archivo se mide aparte en
+    guardar_datos.
+    """
+    resultados = {}
+
+    # Carga (sin tracemalloc, que la haría más lenta)
+    sistema = SistemaControlEscolar(ruta_datos, cargar=False)
+    resultados['cargar_datos'] = _medir(sistema.cargar_datos, 1)
+    registros = (len(sistema.alumnos) + len(sistema.docentes) + len(sistema.materias)
+                 + len(sistema.calificaciones) + len(sistema.horarios))
+    resultados['cargar_datos']['registros_por_s'] = registros / resultados['cargar_datos']['total_s']
+
+    if medir_memoria:
+        tracemalloc.start()
+        SistemaControlEscolar(ruta_datos)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        resultados['memoria_pico_mb'] = pico / (1024 * 1024)
+
+    # Consultas, con argumentos tomados de los propios datos
+    limpiar = sistema.cache_consultas.limpiar
+    alumno = next(iter(sistema.alumnos.values()), None)
+    docente_id = next(iter(sistema.docentes), "")
+    grado, grupo = (alumno.grado, alumno.grupo) if alumno else ("1", "A")
+    matricula = alumno.matricula if alumno else ""
+    consultas = {
+        'buscar_alumnos': lambda: sistema.buscar_alumnos(""),
+        'buscar_alumnos_termino': lambda: sistema.buscar_alumnos("garcía"),
+        'buscar_docentes': lambda: sistema.buscar_docentes("mate"),
+        'buscar_materias': lambda: sistema.buscar_materias("1"),
+        'obtener_grupos_disponibles': sistema.obtener_grupos_disponibles,
+        'obtener_alumnos_por_grupo': lambda: sistema.obtener_alumnos_por_grupo(grado, grupo),
+        'obtener_horarios_por_grupo': lambda: sistema.obtener_horarios_por_grupo(grado, grupo),
+        'obtener_horarios_por_docente': lambda: sistema.obtener_horarios_por_docente(docente_id),
+        'obtener_calificaciones_alumno': lambda: sistema.obtener_calificaciones_alumno(matricula),
+        'obtener_promedio_alumno': lambda: sistema.obtener_promedio_alumno(matricula),
+    }
+    for nombre, consulta in consultas.items():
+        resultados[nombre] = _medir(consulta, repeticiones, antes=limpiar)
+
+    # Registro de calificaciones nuevas (semestre sin calificaciones previas)
+    activos = [a for a in sistema.alumnos.values() if a.activo][:repeticiones]
+    materias_grado = {}
+    for materia in sistema.materias.values():
+        materias_grado.setdefault(materia.grado, materia.id)
+    pendientes = iter([(a.matricula, materias_grado[a.grado]) for a in activos if a.grado in materias_grado])
+    latencias = []
+    with sistema.escritura_diferida():
+        for matricula_nueva, materia_id in pendientes:
+            inicio = time.perf_counter()
+            sistema.registrar_calificacion(matricula_nueva, materia_id, "BENCH-1", 85.0)
+            latencias.append(time.perf_counter() - inicio)
+        # Que la escritura diferida no toque el archivo de datos original
+        sistema.archivo_datos = os.devnull
+    resultados['registrar_calificacion'] = _resumir(latencias)
+
+    # Escritura completa del archivo
+    with tempfile.TemporaryDirectory() as directorio:
+        sistema.archivo_datos = os.path.join(directorio, "guardado.json")
+        resultados['guardar_datos'] = _medir(sistema.guardar_datos, 1)
+
+    return resultados
+
+
+def ejecutar_benchmark(tamanos: Iterable[str], repeticiones: int = 20,
+                       medir_memoria: bool = True, semilla: int = 0) -> Dict:
+    """Generar los datos de cada tamaño en un directorio temporal y medirlos"""
+    resultados = {}
+    with tempfile.TemporaryDirectory() as directorio:
+        for tamano in tamanos:
+            ruta = os.path.join(directorio, f"datos_{tamano}.json")
+            conteo = generar_datos(ruta, semilla=semilla, **TAMANOS[tamano])
+            resultados[tamano] = {'registros': conteo,
+                                  **medir_tamano(ruta, repeticiones, medir_memoria)}
+            os.remove(ruta)
+    return resultados
+
+
+def comparar(resultados: Dict, base: Dict, umbral: float = UMBRAL_REGRESION) -> List[Dict]:
+    """Comparar p50 (ms) y memoria contra una ejecución base; cambio > 0 es más lento"""
+    comparacion = []
+    for tamano, operaciones in resultados.items():
+        for operacion, medida in operaciones.items():
+            anterior = base.get(tamano, {}).get(operacion)
+            if anterior is None or operacion == 'registros':
+                continue
+            if isinstance(medida, dict):
+                actual, referencia = medida['p50_ms'], anterior['p50_ms']
+            else:
+                actual, referencia = medida, anterior
+            cambio = (actual - referencia) / referencia if referencia else 0.0
+            comparacion.append({
+                'tamano': tamano,
+                'operacion': operacion,
+                'base': referencia,
+                'actual': actual,
+                'cambio': cambio,
+                'regresion': cambio > umbral
+            })
+    return comparacion
+
+
+class _RegistroConDict:
+    """Registro con __dict__ propio y cadenas sin internar (representación sin __slots__)"""
+
+    def __init__(self, data: Dict):
+        self.__dict__.update(data)
+
+
+CLASES = {'alumnos': Alumno, 'docentes': Docente, 'materias': Materia,
+          'calificaciones': Calificacion, 'horarios': Horario}
+
+
+def _bytes_retenidos(texto: str, construir) -> int:
+    """Memoria que queda ocupada tras decodificar los registros y construir(registros)"""
+    gc.collect()
+    tracemalloc.start()
+    registros = json.loads(texto)
+    objetos = construir(registros)
+    del registros
+    gc.collect()
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objetos
+    return actual
+
+
+def _tabla_calificaciones(registros: List[Dict]) -> AlmacenCalificaciones:
+    almacen = AlmacenCalificaciones()
+    almacen.cargar(registros)
+    return almacen
+
+
+def reporte_memoria(ruta_datos: str, muestra: int = 100000) -> Dict:
+    """Bytes por registro de cada colección con __dict__ sin internar contra __slots__ internados
+
+    Se toman hasta `muestra` registros de cada colección; cada uno se decodifica
+    desde JSON dentro de la medición para contar también sus cadenas. Para las
+    calificaciones se mide además la tabla columnar que usa el sistema.
+    """
+    with open(ruta_datos, 'r', encoding='utf-8') as f:
+        datos = json.load(f)
+
+    reporte = {}
+    for nombre, clase in CLASES.items():
+        registros = datos.get(nombre, [])[:muestra]
+        if not registros:
+            continue
+        texto = json.dumps(registros, ensure_ascii=False)
+        antes = _bytes_retenidos(texto, lambda rs: [_RegistroConDict(data) for data in rs])
+        despues = _bytes_retenidos(texto, lambda rs: [internar_campos(clase.from_dict(data)) for data in rs])
+        reporte[nombre] = {
+            'registros': len(registros),
+            'antes_bytes_por_registro': antes / len(registros),
+            'despues_bytes_por_registro': despues / len(registros),
+            'ahorro': 1 - despues / antes if antes else 0.0
+        }
+        if nombre == 'calificaciones':
+            tabla = _bytes_retenidos(texto, _tabla_calificaciones)
+            reporte['calificaciones (tabla)'] = {
+                'registros': len(registros),
+                'antes_bytes_por_registro': antes / len(registros),
+                'despues_bytes_por_registro': tabla / len(registros),
+                'ahorro': 1 - tabla / antes if antes else 0.0
+            }
+    return reporte
+
+
+# ---------------------------------------------------------------------------
+# Velocidad de carga
+# ---------------------------------------------------------------------------
+
+def _tabla_por_registro(registros: List[Dict]) -> AlmacenCalificaciones:
+    almacen = AlmacenCalificaciones()
+    for data in registros:
+        almacen.agregar(data['id'], data['matricula_alumno'], data['materia_id'], data['semestre'],
+                        data['calificacion'], data.get('fecha_registro'))
+    return almacen
+
+
+# Construcción de cada colección registro por registro (from_dict, internar y
+# normalizar la clave, como hacía cargar_datos) y en bloque (la ruta actual)
+CARGA_POR_REGISTRO = {
+    'alumnos': lambda rs: {str(a.matricula).strip(): a
+                           for a in (internar_campos(Alumno.from_dict(d)) for d in rs)},
+    'docentes': lambda rs: {str(d.num_empleado).strip(): d
+                            for d in (internar_campos(Docente.from_dict(d)) for d in rs)},
+    'materias': lambda rs: {m.id: m for m in (internar_campos(Materia.from_dict(d)) for d in rs)},
+    'calificaciones': _tabla_por_registro,
+    'horarios': lambda rs: {h.id: h for h in (internar_campos(Horario.from_dict(d)) for d in rs)},
+}
+CARGA_EN_BLOQUE = {
+    'alumnos': hidratar_alumnos,
+    'docentes': hidratar_docentes,
+    'materias': hidratar_materias,
+    'calificaciones': _tabla_calificaciones,
+    'horarios': hidratar_horarios,
+}
+
+
+def comparar_carga(ruta_datos: str, repeticiones: int = 3) -> Dict:
+    """Registros por segundo al construir cada colección ya decodificada, por registro y en bloque
+
+    Se toma el mejor tiempo de las repeticiones de cada ruta; la lectura del
+    JSON queda fuera porque es la misma para ambas.
+    """
+    with open(ruta_datos, 'r', encoding='utf-8') as f:
+        datos = json.load(f)
+
+    def mejor_tiempo(construir, registros):
+        mejor = float('inf')
+        for _ in range(repeticiones):
+            gc.collect()
+            inicio = time.perf_counter()
+            construir(registros)
+            mejor = min(mejor, time.perf_counter() - inicio)
+        return mejor
+
+    reporte = {}
+    for nombre in CARGA_EN_BLOQUE:
+        registros = datos.get(nombre, [])
+        if not registros:
+            continue
+        por_registro = mejor_tiempo(CARGA_POR_REGISTRO[nombre], registros)
+        en_bloque = mejor_tiempo(CARGA_EN_BLOQUE[nombre], registros)
+        reporte[nombre] = {
+            'registros': len(registros),
+            'por_registro_por_s': len(registros) / por_registro,
+            'en_bloque_por_s': len(registros) / en_bloque,
+            'aceleracion': por_registro / en_bloque
+        }
+    return reporte
+
+
+def _imprimir(resultados: Dict):
+    for tamano, operaciones in resultados.items():
+        registros = ", ".join(f"{n} {c}" for c, n in operaciones['registros'].items())
+        print(f"\n=== {tamano}: {registros} ===")
+        if 'memoria_pico_mb' in operaciones:
+            print(f"Memoria pico al cargar: {operaciones['memoria_pico_mb']:.1f} MB")
+        print(f"{'Operación':<32}{'ops/s':>12}{'p50 ms':>12}{'p95 ms':>12}{'p99 ms':>12}")
+        for operacion, medida in operaciones.items():
+            if not isinstance(medida, dict) or operacion == 'registros':
+                continue
+            print(f"{operacion:<32}{medida['ops_por_s']:>12.1f}{medida['p50_ms']:>12.3f}"
+                  f"{medida['p95_ms']:>12.3f}{medida['p99_ms']:>12.3f}")
+        if 'registros_por_s' in operaciones.get('cargar_datos', {}):
+            print(f"Carga: {operaciones['cargar_datos']['registros_por_s']:.0f} registros/s")
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Pruebas de rendimiento con datos sintéticos")
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    p_generar = subparsers.add_parser('generar', help="Generar un archivo de datos sintético")
+    p_generar.add_argument('archivo')
+    for coleccion, cantidad in TAMANOS['pequeno'].items():
+        p_generar.add_argument(f'--{coleccion}', type=int, default=cantidad)
+    p_generar.add_argument('--semilla', type=int, default=0)
+
+    p_ejecutar = subparsers.add_parser('ejecutar', help="Medir las operaciones en varios tamaños")
+    p_ejecutar.add_argument('--tamanos', nargs='+', choices=list(TAMANOS), default=['pequeno'])
+    p_ejecutar.add_argument('--repeticiones', type=int, default=20)
+    p_ejecutar.add_argument('--sin-memoria', action='store_true', help="No medir la memoria pico")
+    p_ejecutar.add_argument('--guardar-base', help="Guardar los resultados como base en este archivo")
+    p_ejecutar.add_argument('--comparar', help="Comparar contra un archivo base")
+
+    p_memoria = subparsers.add_parser('memoria', help="Bytes por registro antes y después de __slots__")
+    p_memoria.add_argument('archivo', nargs='?', help="Archivo de datos (por defecto se genera uno)")
+    p_memoria.add_argument('--tamano', choices=list(TAMANOS), default='mediano')
+    p_memoria.add_argument('--muestra', type=int, default=100000, help="Registros por colección")
+
+    p_carga = subparsers.add_parser('carga', help="Registros/s al cargar, por registro contra en bloque")
+    p_carga.add_argument('archivo', nargs='?', help="Archivo de datos (por defecto se genera uno)")
+    p_carga.add_argument('--tamano', choices=list(TAMANOS), default='mediano')
+    p_carga.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.comando == 'generar':
+        inicio = time.perf_counter()
+        conteo = generar_datos(args.archivo, args.alumnos, args.docentes, args.materias,
+                               args.calificaciones, args.horarios, args.semilla)
+        print(f"Generado {args.archivo}: " + ", ".join(f"{n} {c}" for c, n in conteo.items())
+              + f" en {time.perf_counter() - inicio:.1f} s")
+        return
+
+    if args.comando == 'memoria':
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = args.archivo
+            if ruta is None:
+                ruta = os.path.join(directorio, f"datos_{args.tamano}.json")
+                generar_datos(ruta, **TAMANOS[args.tamano])
+            reporte = reporte_memoria(ruta, args.muestra)
+        print(f"{'Colección':<24}{'Registros':>10}{'Antes (B)':>12}{'Después (B)':>13}{'Ahorro':>9}")
+        for nombre, fila in reporte.items():
+            print(f"{nombre:<24}{fila['registros']:>10}{fila['antes_bytes_por_registro']:>12.0f}"
+                  f"{fila['despues_bytes_por_registro']:>13.0f}{fila['ahorro'] * 100:>8.1f}%")
+        return
+
+    if args.comando == 'carga':
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = args.archivo
+            if ruta is None:
+                ruta = os.path.join(directorio, f"datos_{args.tamano}.json")
+                generar_datos(ruta, **TAMANOS[args.tamano])
+            reporte = comparar_carga(ruta, args.repeticiones)
+        print(f"{'Colección':<16}{'Registros':>10}{'Por registro/s':>16}{'En bloque/s':>14}{'Aceleración':>13}")
+        for nombre, fila in reporte.items():
+            print(f"{nombre:<16}{fila['registros']:>10}{fila['por_registro_por_s']:>16.0f}"
+                  f"{fila['en_bloque_por_s']:>14.0f}{fila['aceleracion']:>12.2f}x")
+        return
+
+    resultados = ejecutar_benchmark(args.tamanos, args.repeticiones, not args.sin_memoria)
+    _imprimir(resultados)
+
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            base = json.load(f)
+        print(f"\n=== Comparación contra {args.comparar} (p50 / memoria) ===")
+        for fila in comparar(resultados, base):
+            marca = "  REGRESIÓN" if fila['regresion'] else ""
+            print(f"{fila['tamano']:<10}{fila['operacion']:<32}{fila['base']:>12.3f}"
+                  f"{fila['actual']:>12.3f}{fila['cambio'] * 100:>+9.1f}%{marca}")
+
+    if args.guardar_base:
+        with open(args.guardar_base, 'w', encoding='utf-8') as f:
+            json.dump(resultados, f, indent=2, ensure_ascii=False)
+        print(f"\nBase guardada en {args.guardar_base}")
+
+
+if __name__ == "__main__":
+    main()
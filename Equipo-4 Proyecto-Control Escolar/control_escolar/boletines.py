@@ -0,0 +1,223 @@
+"""
+Exportación por lotes de boletines de calificaciones
+Genera un archivo HTML y/o CSV por alumno sin necesidad de la interfaz gráfica
+
+Uso:
+    python -m control_escolar.boletines --salida boletines
+    python -m control_escolar.boletines --grado 1 --grupo A --formatos html --procesos 4
+"""
+
+import argparse
+import csv
+import html
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from typing import List, Dict, Optional, Iterable
+
+from .columnar import CALIFICACION_APROBATORIA
+from .sistema import SistemaControlEscolar, datos_boletin
+
+
+FORMATOS = ('html', 'csv')
+
+# Datos de la escuela en cada proceso del pool (alumnos, materias, calificaciones)
+_DATOS_PROCESO: Optional[tuple] = None
+
+
+def _estado(calificacion: float) -> str:
+    return "Aprobado" if calificacion >= CALIFICACION_APROBATORIA else "Reprobado"
+
+
+def escribir_boletin_html(boletin: Dict, ruta: str, fecha_emision: str):
+    """Escribir un boletín en formato HTML"""
+    e = html.escape
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write('<!DOCTYPE html>\n<html lang="es">\n<head>\n<meta charset="utf-8">\n')
+        f.write(f'<title>Boletín {e(boletin["matricula"])}</title>\n</head>\n<body>\n')
+        f.write('<h1>BOLETÍN DE CALIFICACIONES</h1>\n')
+        f.write(f'<p>Alumno: {e(boletin["nombre"])}<br>\n'
+                f'Matrícula: {e(boletin["matricula"])}<br>\n'
+                f'Grado: {e(boletin["grado"])}° Grupo: {e(boletin["grupo"])}<br>\n'
+                f'Fecha de emisión: {e(fecha_emision)}</p>\n')
+
+        if not boletin['materias']:
+            f.write('<p>No hay calificaciones registradas para este alumno</p>\n')
+
+        for materia in boletin['materias']:
+            f.write(f'<h2>{e(materia["nombre"])}</h2>\n<table border="1">\n')
+            f.write('<tr><th>Semestre</th><th>Calificación</th><th>Estado</th></tr>\n')
+            for semestre, calificacion in materia['calificaciones']:
+                f.write(f'<tr><td>{e(semestre)}</td><td>{calificacion:.1f}</td>'
+                        f'<td>{_estado(calificacion)}</td></tr>\n')
+            f.write(f'</table>\n<p>Promedio: {materia["promedio"]:.1f}</p>\n')
+
+        if boletin['materias']:
+            f.write(f'<h2>PROMEDIO GENERAL: {boletin["promedio"]:.1f}</h2>\n')
+            f.write(f'<p>ESTADO: {_estado(boletin["promedio"]).upper()}</p>\n')
+        f.write('</body>\n</html>\n')
+
+
+def escribir_boletin_csv(boletin: Dict, ruta: str, fecha_emision: str):
+    """Escribir un boletín en formato CSV (una fila por calificación)"""
+    with open(ruta, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['matricula', 'nombre', 'grado', 'grupo', 'materia_id', 'materia',
+                         'semestre', 'calificacion', 'estado', 'promedio_materia', 'fecha_emision'])
+        for materia in boletin['materias']:
+            for semestre, calificacion in materia['calificaciones']:
+                writer.writerow([boletin['matricula'], boletin['nombre'], boletin['grado'],
+                                 boletin['grupo'], materia['id'], materia['nombre'], semestre,
+                                 f"{calificacion:.1f}", _estado(calificacion),
+                                 f"{materia['promedio']:.1f}", fecha_emision])
+        writer.writerow([boletin['matricula'], boletin['nombre'], boletin['grado'], boletin['grupo'],
+                         '', 'PROMEDIO GENERAL', '', f"{boletin['promedio']:.1f}",
+                         _estado(boletin['promedio']), '', fecha_emision])
+
+
+def _nombre_archivo(matricula: str) -> str:
+    """Nombre de archivo seguro a partir de la matrícula"""
+    return "boletin_" + re.sub(r'[^A-Za-z0-9_.-]', '_', str(matricula))
+
+
+def _nombres_archivo(matriculas: Iterable[str]) -> Dict[str, str]:
+    """Asignar a cada matrícula un nombre de archivo único
+
+    Si dos matrículas dan el mismo nombre (p. ej. "A/1" y "A_1", o "a1" y "A1"
+    en sistemas de archivos que no distinguen mayúsculas) se agrega un sufijo
+    numérico. Las matrículas que no necesitan reemplazos conservan su nombre.
+    """
+    nombres = {}
+    usados = set()
+    # Primero las matrículas que ya son seguras, para que no reciban sufijo
+    for matricula in sorted(matriculas, key=lambda m: _nombre_archivo(m) != f"boletin_{m}"):
+        base = nombre = _nombre_archivo(matricula)
+        sufijo = 2
+        while nombre.lower() in usados:
+            nombre = f"{base}_{sufijo}"
+            sufijo += 1
+        usados.add(nombre.lower())
+        nombres[matricula] = nombre
+    return nombres
+
+
+def _iniciar_proceso(alumnos: Dict, materias: Dict, calificaciones):
+    """Recibir una sola vez por proceso los datos para armar los boletines"""
+    global _DATOS_PROCESO
+    _DATOS_PROCESO = (alumnos, materias, calificaciones)
+
+
+def _exportar_particion(particion: List[tuple], directorio: str, formatos: List[str],
+                        fecha_emision: str) -> tuple:
+    """Armar y escribir los boletines de una partición; se ejecuta en un proceso del pool
+
+    particion: lista de pares (matrícula, nombre de archivo sin extensión)
+    """
+    alumnos, materias, calificaciones = _DATOS_PROCESO
+    archivos = 0
+    bytes_escritos = 0
+    for matricula, nombre in particion:
+        boletin = datos_boletin(alumnos[matricula], calificaciones.de_alumno(matricula), materias)
+        base = os.path.join(directorio, nombre)
+        for formato in formatos:
+            ruta = f"{base}.{formato}"
+            if formato == 'html':
+                escribir_boletin_html(boletin, ruta, fecha_emision)
+            else:
+                escribir_boletin_csv(boletin, ruta, fecha_emision)
+            archivos += 1
+            bytes_escritos += os.path.getsize(ruta)
+    return len(particion), archivos, bytes_escritos
+
+
+def exportar_boletines(sistema: SistemaControlEscolar, directorio: str,
+                       formatos: Iterable[str] = FORMATOS, grado: Optional[str] = None,
+                       grupo: Optional[str] = None, procesos: Optional[int] = None,
+                       tamano_particion: int = 200) -> Dict:
+    """Exportar los boletines de los alumnos activos (opcionalmente de un grado/grupo)
+
+    Cada proceso del pool recibe al iniciar una instantánea de alumnos, materias
+    y calificaciones; después solo se le envían listas de matrículas, y el
+    proceso arma y escribe los boletines de cada una. Se mantiene un número
+    limitado de particiones en vuelo. Devuelve un resumen con totales y
+    rendimiento.
+    """
+    formatos = [f for f in formatos if f in FORMATOS]
+    if not formatos:
+        raise ValueError(f"Formatos válidos: {', '.join(FORMATOS)}")
+
+    os.makedirs(directorio, exist_ok=True)
+    inicio = time.perf_counter()
+    fecha_emision = datetime.now().strftime("%d/%m/%Y %H:%M")
+
+    # La instantánea aísla la exportación de cambios hechos mientras corre
+    datos = sistema.instantanea()
+    matriculas = sorted(a.matricula for a in datos.alumnos.values()
+                        if a.activo
+                        and (grado is None or a.grado == grado)
+                        and (grupo is None or a.grupo == grupo))
+    nombres = _nombres_archivo(matriculas)
+
+    total_alumnos = total_archivos = total_bytes = 0
+    procesos = procesos or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_proceso,
+                             initargs=(dict(datos.alumnos), dict(datos.materias),
+                                       datos.almacen_calificaciones)) as pool:
+        pendientes = set()
+        for inicio_particion in range(0, len(matriculas), tamano_particion):
+            particion = [(matricula, nombres[matricula]) for matricula in
+                         matriculas[inicio_particion:inicio_particion + tamano_particion]]
+            pendientes.add(pool.submit(_exportar_particion, particion, directorio,
+                                       formatos, fecha_emision))
+            # Limitar las particiones en vuelo para no acumular todo en memoria
+            if len(pendientes) >= procesos * 2:
+                terminados, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                for futuro in terminados:
+                    n_alumnos, n_archivos, n_bytes = futuro.result()
+                    total_alumnos += n_alumnos
+                    total_archivos += n_archivos
+                    total_bytes += n_bytes
+
+        for futuro in pendientes:
+            n_alumnos, n_archivos, n_bytes = futuro.result()
+            total_alumnos += n_alumnos
+            total_archivos += n_archivos
+            total_bytes += n_bytes
+
+    segundos = time.perf_counter() - inicio
+    return {
+        'alumnos': total_alumnos,
+        'archivos': total_archivos,
+        'bytes': total_bytes,
+        'segundos': segundos,
+        'alumnos_por_segundo': total_alumnos / segundos if segundos else 0.0,
+        'archivos_por_segundo': total_archivos / segundos if segundos else 0.0
+    }
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Exportar boletines de calificaciones por lotes")
+    parser.add_argument('--datos', default="datos_escuela.json", help="Archivo JSON de datos")
+    parser.add_argument('--salida', default="boletines", help="Directorio de salida")
+    parser.add_argument('--formatos', nargs='+', choices=FORMATOS, default=list(FORMATOS))
+    parser.add_argument('--grado', help="Exportar solo este grado")
+    parser.add_argument('--grupo', help="Exportar solo este grupo")
+    parser.add_argument('--procesos', type=int, help="Número de procesos (por defecto, núcleos)")
+    args = parser.parse_args(argv)
+
+    sistema = SistemaControlEscolar(args.datos)
+    resumen = exportar_boletines(sistema, args.salida, args.formatos,
+                                 grado=args.grado, grupo=args.grupo, procesos=args.procesos)
+
+    print(f"Boletines generados: {resumen['alumnos']} alumnos, {resumen['archivos']} archivos "
+          f"({resumen['bytes'] / 1024:.1f} KB) en {resumen['segundos']:.2f} s")
+    print(f"Rendimiento: {resumen['alumnos_por_segundo']:.1f} alumnos/s, "
+          f"{resumen['archivos_por_segundo']:.1f} archivos/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Caché de consultas
+Resultados de los métodos de lectura en un LRU acotado, invalidados por generación de entidad
+
+Cada tipo de entidad (alumnos, docentes, ...) tiene un contador de generación
+que se incrementa con cada modificación. Una entrada guarda las generaciones
+de las entidades de las que depende al momento de calcularse y solo se
+reutiliza si siguen siendo las mismas, así nunca se devuelve un resultado
+viejo aunque no se recorra la caché para borrar entradas.
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from types import MappingProxyType
+from typing import Dict, Callable, Hashable, Iterable
+
+
+class CacheConsultas:
+    """LRU de resultados de consultas con contadores de generación por tipo de entidad"""
+
+    def __init__(self, tipos: Iterable[str], capacidad: int = 256):
+        self.capacidad = capacidad
+        self.generaciones: Dict[str, int] = {tipo: 0 for tipo in tipos}
+        self._entradas: OrderedDict = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def invalidar(self, *tipos: str):
+        """Marcar como modificados los tipos de entidad indicados"""
+        for tipo in tipos:
+            self.generaciones[tipo] += 1
+
+    def obtener(self, clave: Hashable, dependencias: tuple, calcular: Callable):
+        """Resultado guardado para la clave, o calcularlo y guardarlo si falta o está viejo"""
+        # La firma se toma antes de calcular: si otro hilo modifica los datos
+        # mientras tanto, la entrada queda vieja y no se reutiliza
+        firma = tuple(self.generaciones[tipo] for tipo in dependencias)
+        entrada = self._entradas.get(clave)
+        if entrada is not None and entrada[0] == firma:
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return entrada[1]
+
+        self.fallos += 1
+        valor = calcular()
+        self._entradas[clave] = (firma, valor)
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.capacidad:
+            self._entradas.popitem(last=False)
+        return valor
+
+    def limpiar(self):
+        self._entradas.clear()
+
+    def estadisticas(self) -> Dict:
+        consultas = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+            'entradas': len(self._entradas),
+            'capacidad': self.capacidad,
+            'generaciones': dict(self.generaciones)
+        }
+
+
+def solo_lectura(valor):
+    """Diccionario (y sus diccionarios anidados) como vista de solo lectura"""
+    if isinstance(valor, dict):
+        return MappingProxyType({clave: solo_lectura(v) for clave, v in valor.items()})
+    return valor
+
+
+def consulta_cacheada(*dependencias: str):
+    """Decorador para métodos de lectura del sistema que dependen de los tipos indicados
+
+    La clave es el nombre del método con sus argumentos. Para que quien
+    llama no altere la entrada guardada, las listas (de entidades) se
+    devuelven en copia superficial y los diccionarios (estadísticas
+    anidadas) se guardan ya como vistas de solo lectura, así que un
+    acierto los devuelve sin copiarlos; modificarlos lanza TypeError.
+    """
+    def decorador(metodo):
+        @wraps(metodo)
+        def envoltura(self, *args, **kwargs):
+            clave = (metodo.__name__, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(clave)
+            except TypeError:
+                return metodo(self, *args, **kwargs)
+            valor = self.cache_consultas.obtener(clave, dependencias,
+                                                 lambda: solo_lectura(metodo(self, *args, **kwargs)))
+            if isinstance(valor, list):
+                return list(valor)
+            return valor
+        return envoltura
+    return decorador
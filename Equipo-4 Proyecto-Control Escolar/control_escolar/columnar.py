@@ -0,0 +1,462 @@
+"""
+Almacén columnar de calificaciones
+Columnas tipadas (array) con claves codificadas como enteros para estadísticas agregadas
+
+Es el almacenamiento principal de las calificaciones: alumno, materia y
+semestre se guardan como enteros densos, la calificación como double y la
+fecha de registro como entero AAAAMMDDhhmmss. Los objetos Calificacion se
+crean solo al consultarlos (vistas de una fila).
+
+Cada calificación tiene un ID entero tomado de un contador que solo avanza
+(siguiente_id) y que se guarda junto con los datos. Las calificaciones con
+el ID de texto anterior (matrícula_materia_semestre_fecha) reciben un ID
+entero al cargarse y conservan el de texto como id_externo, por el que
+también se pueden buscar.
+
+Como las filas solo se agregan al final, una instantánea de la tabla es la
+misma tabla con un límite de filas visibles: instantanea() no copia columnas
+y las consultas sobre ella no ven lo que se agregue después.
+
+Las agregaciones usan NumPy (bincount sobre los mismos búferes, sin copia)
+cuando está instalado y un recorrido único en Python puro cuando no lo está.
+"""
+
+import copy
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, ValuesView, ItemsView
+from datetime import datetime
+from itertools import islice
+from typing import List, Dict, Optional, Hashable, Iterable, Iterator
+
+from .modelos import Calificacion
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+
+CALIFICACION_APROBATORIA = 70
+
+# Columnas por las que se puede agrupar
+AGRUPACIONES = ('materia', 'semestre', 'alumno', 'grupo')
+
+
+class CodificadorCategorias:
+    """Asigna un entero denso a cada valor distinto de una columna categórica"""
+
+    def __init__(self):
+        self.codigos: Dict[Hashable, int] = {}
+        self.valores: List[Hashable] = []
+
+    def codificar(self, valor: Hashable) -> int:
+        codigo = self.codigos.get(valor)
+        if codigo is None:
+            codigo = len(self.valores)
+            self.codigos[valor] = codigo
+            self.valores.append(valor)
+        return codigo
+
+    def __len__(self):
+        return len(self.valores)
+
+
+def fecha_a_entero(fecha: str) -> int:
+    """'AAAA-MM-DD hh:mm:ss' -> AAAAMMDDhhmmss; -1 si no tiene ese formato"""
+    digitos = fecha.replace('-', '').replace(' ', '').replace(':', '')
+    if len(digitos) != 14 or not digitos.isdigit():
+        return -1
+    return int(digitos)
+
+
+def entero_a_fecha(valor: int) -> str:
+    return (f"{valor // 10**10:04d}-{valor // 10**8 % 100:02d}-{valor // 10**6 % 100:02d} "
+            f"{valor // 10**4 % 100:02d}:{valor // 100 % 100:02d}:{valor % 100:02d}")
+
+
+class _ValoresCalificaciones(ValuesView):
+    def __iter__(self):
+        tabla = self._mapping
+        return (tabla.vista(fila) for fila in range(len(tabla)))
+
+
+class _ParesCalificaciones(ItemsView):
+    def __iter__(self):
+        tabla = self._mapping
+        return ((tabla.ids[fila], tabla.vista(fila)) for fila in range(len(tabla)))
+
+
+class AlmacenCalificaciones(Mapping):
+    """Calificaciones en columnas paralelas: alumno, materia, semestre, calificación y fecha
+
+    Se comporta como un diccionario de solo lectura id -> Calificacion (el ID
+    entero o el id_externo de texto). Las calificaciones se agregan con
+    agregar() y nunca se modifican ni se borran, así que el número de fila
+    identifica a cada una de forma estable.
+    """
+
+    def __init__(self):
+        self.alumnos = CodificadorCategorias()
+        self.materias = CodificadorCategorias()
+        self.semestres = CodificadorCategorias()
+
+        self.col_alumno = array('i')
+        self.col_materia = array('i')
+        self.col_semestre = array('i')
+        self.col_calificacion = array('d')
+        self.col_fecha = array('q')
+        self.ids = array('q')
+        # Próximo ID a asignar; siempre mayor que cualquier ID de la tabla
+        self.siguiente_id = 1
+
+        # Filas de cada alumno (por código) y fechas que no siguen el formato estándar
+        self._filas_alumno: List[array] = []
+        self._fechas_texto: Dict[int, str] = {}
+        # ID de texto anterior de las filas migradas: fila -> id_externo
+        self._ids_externos: Dict[int, str] = {}
+        # Índices id -> fila e id_externo -> fila; se arman la primera vez que se buscan
+        self._filas: Optional[Dict[int, int]] = None
+        self._filas_externas: Optional[Dict[str, int]] = None
+        # En una instantánea, número de filas visibles (None en la tabla viva)
+        self.limite: Optional[int] = None
+
+    def __len__(self):
+        return len(self.col_calificacion) if self.limite is None else self.limite
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.ids) if self.limite is None else islice(self.ids, self.limite)
+
+    def __contains__(self, id) -> bool:
+        return self._fila_de(id) is not None
+
+    def __getitem__(self, id) -> Calificacion:
+        fila = self._fila_de(id)
+        if fila is None:
+            raise KeyError(id)
+        return self.vista(fila)
+
+    def values(self):
+        return _ValoresCalificaciones(self)
+
+    def items(self):
+        return _ParesCalificaciones(self)
+
+    def _fila_de(self, id) -> Optional[int]:
+        """Fila de un ID entero o de un id_externo de texto; None si no existe"""
+        if isinstance(id, str):
+            if self._filas_externas is None:
+                self._filas_externas = {externo: fila for fila, externo in self._ids_externos.items()}
+            fila = self._filas_externas.get(id)
+        else:
+            if self._filas is None:
+                self._filas = {id: fila for fila, id in enumerate(self)}
+            fila = self._filas.get(id)
+        return fila if fila is not None and fila < len(self) else None
+
+    def instantanea(self) -> 'AlmacenCalificaciones':
+        """Vista de solo lectura de las filas actuales, sin copiar las columnas"""
+        copia = copy.copy(self)
+        copia.limite = len(self)
+        copia._filas = None
+        copia._filas_externas = None
+        return copia
+
+    def _solo_lectura(self):
+        if self.limite is not None:
+            raise TypeError("No se pueden agregar calificaciones a una instantánea")
+
+    def nuevo_id(self) -> int:
+        """Tomar el siguiente ID del contador"""
+        id = self.siguiente_id
+        self.siguiente_id += 1
+        return id
+
+    def agregar(self, id: Optional[int], matricula: str, materia_id: str, semestre: str,
+                calificacion: float, fecha_registro: Optional[str] = None,
+                id_externo: Optional[str] = None) -> int:
+        """Agregar una calificación al final de las columnas; devuelve su número de fila
+
+        Con id None se le asigna el siguiente del contador. Los valores se
+        convierten antes de tocar cualquier columna: si uno es inválido
+        (ValueError o TypeError) la tabla queda sin cambios.
+        """
+        self._solo_lectura()
+        valor = float(calificacion)
+        if fecha_registro is None:
+            fecha_registro = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        fecha = fecha_a_entero(str(fecha_registro))
+        if id is not None:
+            id = int(id)
+
+        if id is None:
+            id = self.nuevo_id()
+        elif id >= self.siguiente_id:
+            self.siguiente_id = id + 1
+        fila = len(self.col_calificacion)
+        cod_alumno = self.alumnos.codificar(matricula)
+        if cod_alumno == len(self._filas_alumno):
+            self._filas_alumno.append(array('i'))
+        self._filas_alumno[cod_alumno].append(fila)
+        if fecha < 0:
+            self._fechas_texto[fila] = fecha_registro
+
+        self.col_alumno.append(cod_alumno)
+        self.col_materia.append(self.materias.codificar(materia_id))
+        self.col_semestre.append(self.semestres.codificar(semestre))
+        self.col_calificacion.append(valor)
+        self.col_fecha.append(fecha)
+        self.ids.append(id)
+        if self._filas is not None:
+            self._filas[id] = fila
+        if id_externo is not None:
+            self._ids_externos[fila] = id_externo
+            if self._filas_externas is not None:
+                self._filas_externas[id_externo] = fila
+        return fila
+
+    def cargar(self, registros: Iterable[Dict]):
+        """Agregar en bloque calificaciones guardadas (dicts de Calificacion.to_dict)
+
+        Equivale a llamar agregar() por registro, pero con las columnas y los
+        diccionarios de códigos en variables locales y la conversión de cada
+        fecha distinta hecha una sola vez. Las fechas faltantes toman un único
+        "ahora" para todo el bloque. Los registros con ID de texto (formato
+        anterior) reciben IDs nuevos al final, mayores que todos los del
+        bloque, y conservan el de texto como id_externo.
+        """
+        self._solo_lectura()
+        cod_alumnos = self.alumnos.codigos
+        cod_materias = self.materias.codigos
+        cod_semestres = self.semestres.codigos
+        codificar_alumno = self.alumnos.codificar
+        codificar_materia = self.materias.codificar
+        codificar_semestre = self.semestres.codificar
+        filas_alumno = self._filas_alumno
+        fechas_texto = self._fechas_texto
+        agregar_alumno = self.col_alumno.append
+        agregar_materia = self.col_materia.append
+        agregar_semestre = self.col_semestre.append
+        agregar_calificacion = self.col_calificacion.append
+        agregar_fecha = self.col_fecha.append
+        agregar_id = self.ids.append
+        ids_externos = self._ids_externos
+        fechas: Dict[Optional[str], int] = {}
+        sin_id = []
+        mayor_id = self.siguiente_id - 1
+
+        fila = len(self.col_calificacion)
+        for data in registros:
+            # Se leen y convierten todos los campos antes de agregar nada a las columnas
+            matricula = data['matricula_alumno']
+            materia_id = data['materia_id']
+            semestre = data['semestre']
+            valor = float(data['calificacion'])
+            id = data['id']
+            texto = data.get('fecha_registro')
+            fecha = fechas.get(texto)
+            if fecha is None:
+                if texto is None:
+                    fechas[None] = fecha = fecha_a_entero(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                else:
+                    fechas[texto] = fecha = fecha_a_entero(str(texto))
+
+            cod_alumno = cod_alumnos.get(matricula)
+            if cod_alumno is None:
+                cod_alumno = codificar_alumno(matricula)
+                filas_alumno.append(array('i'))
+            filas_alumno[cod_alumno].append(fila)
+
+            cod_materia = cod_materias.get(materia_id)
+            if cod_materia is None:
+                cod_materia = codificar_materia(materia_id)
+            cod_semestre = cod_semestres.get(semestre)
+            if cod_semestre is None:
+                cod_semestre = codificar_semestre(semestre)
+
+            if fecha < 0:
+                fechas_texto[fila] = texto
+
+            agregar_alumno(cod_alumno)
+            agregar_materia(cod_materia)
+            agregar_semestre(cod_semestre)
+            agregar_calificacion(valor)
+            agregar_fecha(fecha)
+            if type(id) is int:
+                if id > mayor_id:
+                    mayor_id = id
+                externo = data.get('id_externo')
+                if externo is not None:
+                    ids_externos[fila] = externo
+            else:
+                ids_externos[fila] = id
+                sin_id.append(fila)
+                id = 0
+            agregar_id(id)
+            fila += 1
+
+        self.siguiente_id = mayor_id + 1
+        ids = self.ids
+        for fila in sin_id:
+            ids[fila] = self.nuevo_id()
+        self._filas = None
+        self._filas_externas = None
+
+    def fecha_registro(self, fila: int) -> str:
+        fecha = self.col_fecha[fila]
+        return entero_a_fecha(fecha) if fecha >= 0 else self._fechas_texto[fila]
+
+    def vista(self, fila: int) -> Calificacion:
+        """Objeto Calificacion con los datos de una fila (una copia: modificarlo no altera la tabla)"""
+        return Calificacion(self.ids[fila],
+                            self.alumnos.valores[self.col_alumno[fila]],
+                            self.materias.valores[self.col_materia[fila]],
+                            self.semestres.valores[self.col_semestre[fila]],
+                            self.col_calificacion[fila],
+                            self.fecha_registro(fila),
+                            self._ids_externos.get(fila))
+
+    def filas_de_alumno(self, matricula: str):
+        """Números de fila de las calificaciones de un alumno, en orden de registro"""
+        codigo = self.alumnos.codigos.get(matricula)
+        if codigo is None or codigo >= len(self._filas_alumno):
+            return ()
+        filas = self._filas_alumno[codigo]
+        if self.limite is not None and filas and filas[-1] >= self.limite:
+            filas = filas[:bisect_left(filas, self.limite)]
+        return filas
+
+    def de_alumno(self, matricula: str) -> List[Calificacion]:
+        return [self.vista(fila) for fila in self.filas_de_alumno(matricula)]
+
+    def existe(self, matricula: str, materia_id: str, semestre: str) -> bool:
+        """Si el alumno ya tiene calificación en esa materia y semestre"""
+        cod_materia = self.materias.codigos.get(materia_id)
+        cod_semestre = self.semestres.codigos.get(semestre)
+        if cod_materia is None or cod_semestre is None:
+            return False
+        col_materia, col_semestre = self.col_materia, self.col_semestre
+        return any(col_materia[fila] == cod_materia and col_semestre[fila] == cod_semestre
+                   for fila in self.filas_de_alumno(matricula))
+
+    def a_dicts(self) -> Iterator[Dict]:
+        """Filas como diccionarios con el formato de Calificacion.to_dict (para guardar)"""
+        alumnos, materias, semestres = self.alumnos.valores, self.materias.valores, self.semestres.valores
+        ids_externos = self._ids_externos
+        for fila, (id, cod_alumno, cod_materia, cod_semestre, valor) in enumerate(islice(
+                zip(self.ids, self.col_alumno, self.col_materia, self.col_semestre, self.col_calificacion),
+                len(self))):
+            data = {
+                'id': id,
+                'matricula_alumno': alumnos[cod_alumno],
+                'materia_id': materias[cod_materia],
+                'semestre': semestres[cod_semestre],
+                'calificacion': valor,
+                'fecha_registro': self.fecha_registro(fila)
+            }
+            if fila in ids_externos:
+                data['id_externo'] = ids_externos[fila]
+            yield data
+
+    def _codigos_grupo(self, grupos_alumnos: Dict[str, tuple]):
+        """Columna alumno -> código de (grado, grupo), construida al momento de consultar"""
+        grupos = CodificadorCategorias()
+        por_alumno = array('i', (grupos.codificar(grupos_alumnos.get(matricula, ('', '')))
+                                 for matricula in self.alumnos.valores))
+        return grupos, por_alumno
+
+    def estadisticas_por(self, por: str, semestre: Optional[str] = None,
+                         materia_id: Optional[str] = None,
+                         grupos_alumnos: Optional[Dict[str, tuple]] = None) -> Dict[Hashable, Dict]:
+        """Promedio, cantidad y tasa de aprobación agrupados por una columna
+
+        por: 'materia', 'semestre', 'alumno' o 'grupo'. Para 'grupo' se requiere
+        grupos_alumnos, un diccionario matrícula -> (grado, grupo).
+        semestre y materia_id filtran las filas consideradas.
+        """
+        if por not in AGRUPACIONES:
+            raise ValueError(f"Agrupación no válida: {por}. Válidas: {', '.join(AGRUPACIONES)}")
+
+        if por == 'grupo':
+            categorias, por_alumno = self._codigos_grupo(grupos_alumnos or {})
+        else:
+            categorias = {'materia': self.materias, 'semestre': self.semestres,
+                          'alumno': self.alumnos}[por]
+            por_alumno = None
+
+        filtro_semestre = self.semestres.codigos.get(semestre, -1) if semestre is not None else None
+        filtro_materia = self.materias.codigos.get(materia_id, -1) if materia_id is not None else None
+
+        # Las categorías pueden crecer mientras se consulta una instantánea
+        total = len(categorias)
+        if np is not None:
+            suma, cantidad, aprobados = self._agregar_numpy(por, total, por_alumno,
+                                                            filtro_semestre, filtro_materia)
+        else:
+            suma, cantidad, aprobados = self._agregar_python(por, total, por_alumno,
+                                                             filtro_semestre, filtro_materia)
+
+        resultado = {}
+        for codigo, valor in enumerate(categorias.valores[:total]):
+            n = int(cantidad[codigo])
+            if n:
+                resultado[valor] = {
+                    'cantidad': n,
+                    'promedio': float(suma[codigo]) / n,
+                    'aprobados': int(aprobados[codigo]),
+                    'tasa_aprobacion': int(aprobados[codigo]) / n
+                }
+        return resultado
+
+    def _columna_clave(self, por: str):
+        return {'materia': self.col_materia, 'semestre': self.col_semestre,
+                'alumno': self.col_alumno, 'grupo': self.col_alumno}[por]
+
+    def _agregar_python(self, por, n, por_alumno, filtro_semestre, filtro_materia):
+        suma = [0.0] * n
+        cantidad = [0] * n
+        aprobados = [0] * n
+        claves = self._columna_clave(por)
+
+        for i, (clave, valor) in enumerate(islice(zip(claves, self.col_calificacion), len(self))):
+            if filtro_semestre is not None and self.col_semestre[i] != filtro_semestre:
+                continue
+            if filtro_materia is not None and self.col_materia[i] != filtro_materia:
+                continue
+            if por_alumno is not None:
+                clave = por_alumno[clave]
+            suma[clave] += valor
+            cantidad[clave] += 1
+            if valor >= CALIFICACION_APROBATORIA:
+                aprobados[clave] += 1
+        return suma, cantidad, aprobados
+
+    def _columna_numpy(self, columna: array, tipo):
+        """Copia de la columna (en una instantánea, del prefijo visible) como arreglo de NumPy
+
+        Se copia en lugar de usar np.frombuffer: mientras exista una vista del
+        búfer, un agregar que necesite agrandar la columna lanzaría BufferError.
+        """
+        if self.limite is not None:
+            columna = columna[:self.limite]
+        return np.array(columna, dtype=tipo)
+
+    def _agregar_numpy(self, por, n, por_alumno, filtro_semestre, filtro_materia):
+        claves = self._columna_numpy(self._columna_clave(por), np.intc)
+        valores = self._columna_numpy(self.col_calificacion, np.float64)
+
+        mascara = np.ones(len(valores), dtype=bool)
+        if filtro_semestre is not None:
+            mascara &= self._columna_numpy(self.col_semestre, np.intc) == filtro_semestre
+        if filtro_materia is not None:
+            mascara &= self._columna_numpy(self.col_materia, np.intc) == filtro_materia
+
+        claves = claves[mascara]
+        valores = valores[mascara]
+        if por_alumno is not None:
+            claves = np.frombuffer(por_alumno, dtype=np.intc)[claves]
+
+        suma = np.bincount(claves, weights=valores, minlength=n)
+        cantidad = np.bincount(claves, minlength=n)
+        aprobados = np.bincount(claves, weights=valores >= CALIFICACION_APROBATORIA, minlength=n)
+        return suma, cantidad, aprobados
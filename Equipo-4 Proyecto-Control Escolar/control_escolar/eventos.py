@@ -0,0 +1,67 @@
+"""
+Eventos de cambio
+Avisos tipados (entidad, clave, antes y después) que el sistema publica en cada modificación
+
+La caché de consultas, los boletines, los índices de horarios y las
+pantallas de la interfaz se suscriben al bus del sistema en lugar de que
+cada operación tenga que actualizarlos uno por uno. Los suscriptores se
+llaman en el mismo hilo que hizo el cambio y en el orden en que se
+suscribieron.
+"""
+
+from typing import Callable, Dict, Hashable, Iterable, Optional
+
+
+AGREGADO = 'agregado'
+MODIFICADO = 'modificado'
+LOTE = 'lote'  # varias entidades agregadas de una vez; despues es la lista de ellas
+RECARGA = 'recarga'  # la colección completa se reemplazó (cargar_datos)
+
+
+class EventoCambio:
+    """Cambio en una entidad: antes es None al agregarla; en una recarga clave, antes y después son None"""
+
+    __slots__ = ('entidad', 'accion', 'clave', 'antes', 'despues')
+
+    def __init__(self, entidad: str, clave: Hashable = None, antes=None, despues=None,
+                 accion: Optional[str] = None):
+        self.entidad = entidad
+        self.clave = clave
+        self.antes = antes
+        self.despues = despues
+        self.accion = accion or (AGREGADO if antes is None else MODIFICADO)
+
+    @classmethod
+    def recarga(cls, entidad: str) -> 'EventoCambio':
+        return cls(entidad, accion=RECARGA)
+
+    def __repr__(self):
+        return f"EventoCambio({self.entidad!r}, {self.accion!r}, {self.clave!r})"
+
+
+class BusEventos:
+    """Lista de suscriptores a los que se entrega cada evento publicado"""
+
+    def __init__(self):
+        self._suscriptores: Dict[int, tuple] = {}
+        self._siguiente = 0
+
+    def suscribir(self, funcion: Callable[[EventoCambio], None],
+                  entidades: Optional[Iterable[str]] = None) -> int:
+        """Registrar funcion(evento), opcionalmente solo para ciertas entidades; devuelve un número para cancelar"""
+        self._siguiente += 1
+        self._suscriptores[self._siguiente] = (funcion, frozenset(entidades) if entidades else None)
+        return self._siguiente
+
+    def cancelar(self, suscripcion: int):
+        self._suscriptores.pop(suscripcion, None)
+
+    def publicar(self, evento: EventoCambio):
+        """Entregar el evento; el error de un suscriptor se reporta sin detener a los demás"""
+        for funcion, entidades in list(self._suscriptores.values()):
+            if entidades is not None and evento.entidad not in entidades:
+                continue
+            try:
+                funcion(evento)
+            except Exception as e:
+                print(f"Error al procesar {evento}: {e}")
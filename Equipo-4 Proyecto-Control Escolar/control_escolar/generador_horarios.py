@@ -0,0 +1,323 @@
+"""
+Generador automático de horarios
+Asigna día, hora y aula a cada sesión semanal de cada grupo sin empalmes
+
+Cada sesión (grupo, materia) se asigna a una franja de la semana mediante
+búsqueda con retroceso: se elige primero la sesión con menos franjas posibles
+(MRV) y, al asignarla, se eliminan esa franja de las sesiones que comparten
+grupo o docente (forward checking). Si el tiempo se agota se devuelve la
+asignación parcial más completa encontrada con el detalle de lo pendiente.
+
+Uso:
+    python -m control_escolar.generador_horarios config.json [--aplicar]
+
+config.json:
+    {
+        "aulas": ["A1", "A2"],
+        "horas": {"MAT1": 5, "ESP1": 4},
+        "docentes": {"MAT1": "E001", "1|A|ESP1": "E002"},
+        "dias": ["LUNES", "MARTES", "MIÉRCOLES", "JUEVES", "VIERNES"],
+        "franjas": [["07:00", "08:00"], ["08:00", "09:00"]],
+        "tiempo_limite": 10
+    }
+    En "docentes" la clave puede ser el ID de materia o "grado|grupo|materia".
+"""
+
+import argparse
+import json
+import time
+from typing import List, Dict, Optional, Sequence
+
+from .modelos import Horario
+from .horarios import hora_a_minutos, normalizar_dia
+
+
+DIAS_HABILES = ["LUNES", "MARTES", "MIÉRCOLES", "JUEVES", "VIERNES"]
+FRANJAS_POR_DEFECTO = [(f"{h:02d}:00", f"{h + 1:02d}:00") for h in range(7, 14)]
+
+
+class Sesion:
+    """Una hora semanal de una materia para un grupo"""
+
+    __slots__ = ('grado', 'grupo', 'materia_id', 'docente_id', 'numero')
+
+    def __init__(self, grado, grupo, materia_id, docente_id, numero):
+        self.grado = grado
+        self.grupo = grupo
+        self.materia_id = materia_id
+        self.docente_id = docente_id
+        self.numero = numero
+
+
+class ResultadoGenerador:
+    """Horarios generados y sesiones que no se pudieron asignar"""
+
+    def __init__(self):
+        self.horarios: List[Horario] = []
+        self.no_asignadas: List[tuple] = []
+        self.completo = False
+        self.segundos = 0.0
+        self.nodos = 0
+
+    def resumen(self) -> str:
+        estado = "completo" if self.completo else "incompleto"
+        return (f"Horario {estado}: {len(self.horarios)} sesión(es) asignada(s), "
+                f"{len(self.no_asignadas)} sin asignar, {self.nodos} nodos en {self.segundos:.2f} s")
+
+    def aplicar(self, sistema) -> List[str]:
+        """Agregar los horarios generados al sistema con una sola escritura; devuelve los errores"""
+        errores = []
+        with sistema.escritura_diferida():
+            for h in self.horarios:
+                exito, mensaje = sistema.agregar_horario(h.id, h.materia_id, h.docente_id, h.grado,
+                                                         h.grupo, h.dia, h.hora_inicio, h.hora_fin, h.aula)
+                if not exito:
+                    errores.append(f"{h.id}: {mensaje}")
+        return errores
+
+
+def _se_traslapan(inicio_a, fin_a, inicio_b, fin_b) -> bool:
+    return inicio_a < fin_b and inicio_b < fin_a
+
+
+def generar_horarios(sistema, horas: Dict[str, int], docentes: Dict[str, str],
+                     aulas: Sequence[str], dias: Optional[Sequence[str]] = None,
+                     franjas: Optional[Sequence[tuple]] = None,
+                     tiempo_limite: float = 10.0, prefijo_id: str = "GEN") -> ResultadoGenerador:
+    """Generar horarios para todos los grupos con alumnos activos
+
+    horas: horas semanales por ID de materia (las materias sin horas se omiten)
+    docentes: docente por materia o por "grado|grupo|materia"
+    aulas: aulas disponibles; dias y franjas definen la cuadrícula semanal
+    Los horarios ya registrados en el sistema se respetan como ocupados y
+    cuentan para las horas de su grupo y materia, así que generar otra vez
+    solo agrega las sesiones que faltan, con IDs que no se repiten.
+    """
+    inicio_reloj = time.perf_counter()
+    limite = inicio_reloj + tiempo_limite
+    # Los días de los horarios existentes se comparan normalizados
+    dias = [normalizar_dia(d) for d in (dias or DIAS_HABILES)]
+    franjas = [tuple(f) for f in (franjas or FRANJAS_POR_DEFECTO)]
+    aulas = list(aulas)
+    resultado = ResultadoGenerador()
+
+    minutos_franjas = [(hora_a_minutos(a), hora_a_minutos(b)) for a, b in franjas]
+    num_franjas = len(franjas)
+    num_slots = len(dias) * num_franjas
+
+    # --- Ocupación previa a partir de los horarios existentes ---
+    ocupado_grupo = {}
+    ocupado_docente = {}
+    ocupado_aula = {slot: set() for slot in range(num_slots)}
+    # (grado, grupo, materia) -> sesiones ya registradas (franjas que cubren; al menos 1)
+    programadas: Dict[tuple, int] = {}
+    for h in sistema.horarios.values():
+        clave = (h.grado, h.grupo, h.materia_id)
+        cubiertas = 0
+        dia = normalizar_dia(h.dia)
+        try:
+            h_inicio, h_fin = hora_a_minutos(h.hora_inicio), hora_a_minutos(h.hora_fin)
+        except ValueError:
+            dia = None
+        if dia in dias:
+            for f, (f_inicio, f_fin) in enumerate(minutos_franjas):
+                if _se_traslapan(h_inicio, h_fin, f_inicio, f_fin):
+                    slot = dias.index(dia) * num_franjas + f
+                    ocupado_grupo.setdefault((h.grado, h.grupo), set()).add(slot)
+                    ocupado_docente.setdefault(h.docente_id, set()).add(slot)
+                    ocupado_aula[slot].add(h.aula.strip().upper())
+                    cubiertas += 1
+        programadas[clave] = programadas.get(clave, 0) + max(cubiertas, 1)
+
+    # --- Sesiones a programar (las horas que faltan por grupo y materia) ---
+    sesiones: List[Sesion] = []
+    for grado, grupo in sistema.obtener_grupos_disponibles():
+        for materia in sorted(sistema.materias.values(), key=lambda m: m.id):
+            faltantes = (horas.get(materia.id) or 0) - programadas.get((grado, grupo, materia.id), 0)
+            if materia.grado != grado or faltantes <= 0:
+                continue
+            docente_id = docentes.get(f"{grado}|{grupo}|{materia.id}", docentes.get(materia.id))
+            if docente_id not in sistema.docentes:
+                resultado.no_asignadas.append((grado, grupo, materia.id, "Sin docente asignado"))
+                continue
+            for numero in range(faltantes):
+                sesiones.append(Sesion(grado, grupo, materia.id, docente_id, numero))
+
+    def aula_libre(slot):
+        for aula in aulas:
+            if aula.strip().upper() not in ocupado_aula[slot]:
+                return aula
+        return None
+
+    # --- Dominios iniciales ---
+    dominios = []
+    for s in sesiones:
+        bloqueados = (ocupado_grupo.get((s.grado, s.grupo), set())
+                      | ocupado_docente.get(s.docente_id, set()))
+        dominios.append({slot for slot in range(num_slots)
+                         if slot not in bloqueados and aula_libre(slot) is not None})
+
+    # Sesiones que comparten grupo o docente (se afectan al asignarse)
+    por_grupo = {}
+    por_docente = {}
+    for i, s in enumerate(sesiones):
+        por_grupo.setdefault((s.grado, s.grupo), []).append(i)
+        por_docente.setdefault(s.docente_id, []).append(i)
+    vecinos = [set(por_grupo[(s.grado, s.grupo)]) | set(por_docente[s.docente_id])
+               for s in sesiones]
+    for i in range(len(sesiones)):
+        vecinos[i].discard(i)
+
+    asignacion: Dict[int, tuple] = {}
+    dias_materia = {}  # (grado, grupo, materia) -> días ya usados
+    mejor: Dict[int, tuple] = {}
+
+    def ordenar_candidatos(i):
+        """Preferir días en que el grupo aún no tiene esa materia y horas tempranas"""
+        s = sesiones[i]
+        usados = dias_materia.get((s.grado, s.grupo, s.materia_id), {})
+        return sorted(dominios[i], key=lambda slot: (usados.get(slot // num_franjas, 0), slot % num_franjas,
+                                                     slot // num_franjas))
+
+    def asignar(i, slot):
+        """Asignar y propagar; devuelve los cambios para deshacer o None si deja un dominio vacío"""
+        aula = aula_libre(slot)
+        if aula is None:
+            return None
+        s = sesiones[i]
+        ocupado_aula[slot].add(aula.strip().upper())
+        asignacion[i] = (slot, aula)
+        clave = (s.grado, s.grupo, s.materia_id)
+        dia = slot // num_franjas
+        dias_materia.setdefault(clave, {})
+        dias_materia[clave][dia] = dias_materia[clave].get(dia, 0) + 1
+
+        quitados = []
+        afectados = vecinos[i]
+        if aula_libre(slot) is None:
+            # Sin aulas libres en esa franja: deja de servir para cualquier sesión
+            afectados = range(len(sesiones))
+        vacio = False
+        for j in afectados:
+            if j not in asignacion and slot in dominios[j]:
+                dominios[j].discard(slot)
+                quitados.append(j)
+                if not dominios[j]:
+                    vacio = True
+        cambios = (i, slot, aula, quitados)
+        if vacio:
+            deshacer(cambios)
+            return None
+        return cambios
+
+    def deshacer(cambios):
+        i, slot, aula, quitados = cambios
+        s = sesiones[i]
+        for j in quitados:
+            dominios[j].add(slot)
+        ocupado_aula[slot].discard(aula.strip().upper())
+        del asignacion[i]
+        clave = (s.grado, s.grupo, s.materia_id)
+        dias_materia[clave][slot // num_franjas] -= 1
+
+    def siguiente_sesion():
+        pendientes = [i for i in range(len(sesiones)) if i not in asignacion]
+        return min(pendientes, key=lambda i: (len(dominios[i]), -len(vecinos[i])))
+
+    # --- Búsqueda con retroceso (iterativa) ---
+    # Cada marco: [sesión, candidatos, siguiente índice, cambios aplicados]
+    pila = []
+
+    def avanzar(marco):
+        i, candidatos = marco[0], marco[1]
+        while marco[2] < len(candidatos):
+            slot = candidatos[marco[2]]
+            marco[2] += 1
+            resultado.nodos += 1
+            cambios = asignar(i, slot)
+            if cambios is not None:
+                marco[3] = cambios
+                return True
+        return False
+
+    agotado = False
+    while len(asignacion) < len(sesiones):
+        if time.perf_counter() > limite:
+            agotado = True
+            break
+
+        i = siguiente_sesion()
+        marco = [i, ordenar_candidatos(i), 0, None]
+        if avanzar(marco):
+            pila.append(marco)
+            if len(asignacion) > len(mejor):
+                mejor = dict(asignacion)
+            continue
+
+        # Retroceder hasta un marco con otra alternativa
+        while pila:
+            deshacer(pila[-1][3])
+            if avanzar(pila[-1]):
+                break
+            pila.pop()
+        if not pila:
+            break
+
+    if len(asignacion) == len(sesiones):
+        mejor = asignacion
+        resultado.completo = True
+
+    # --- Construir los horarios ---
+    # Los IDs continúan después del mayor "prefijo-NNNN" ya registrado
+    previos = [int(id[len(prefijo_id) + 1:]) for id in sistema.horarios
+               if id.startswith(prefijo_id + "-") and id[len(prefijo_id) + 1:].isdigit()]
+    primero = max(previos, default=0) + 1
+    for n, i in enumerate(sorted(mejor, key=lambda i: mejor[i][0]), start=primero):
+        slot, aula = mejor[i]
+        s = sesiones[i]
+        hora_inicio, hora_fin = franjas[slot % num_franjas]
+        resultado.horarios.append(Horario(f"{prefijo_id}-{n:04d}", s.materia_id, s.docente_id,
+                                          s.grado, s.grupo, dias[slot // num_franjas],
+                                          hora_inicio, hora_fin, aula))
+    motivo = "Tiempo agotado" if agotado else "Sin franjas compatibles"
+    for i, s in enumerate(sesiones):
+        if i not in mejor:
+            resultado.no_asignadas.append((s.grado, s.grupo, s.materia_id, motivo))
+
+    resultado.segundos = time.perf_counter() - inicio_reloj
+    return resultado
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Generar horarios sin empalmes")
+    parser.add_argument('config', help="Archivo JSON con aulas, horas y docentes")
+    parser.add_argument('--datos', default="datos_escuela.json", help="Archivo JSON de datos")
+    parser.add_argument('--aplicar', action='store_true', help="Guardar los horarios generados")
+    args = parser.parse_args(argv)
+
+    from .sistema import SistemaControlEscolar
+
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    sistema = SistemaControlEscolar(args.datos)
+    resultado = generar_horarios(sistema, config.get('horas', {}), config.get('docentes', {}),
+                                 config.get('aulas', []), dias=config.get('dias'),
+                                 franjas=config.get('franjas'),
+                                 tiempo_limite=config.get('tiempo_limite', 10.0))
+
+    for h in resultado.horarios:
+        print(f"{h.id}: {h.grado}° {h.grupo} {h.materia_id} {h.dia} {h.hora_inicio}-{h.hora_fin} "
+              f"aula {h.aula} docente {h.docente_id}")
+    for grado, grupo, materia_id, motivo in resultado.no_asignadas:
+        print(f"Sin asignar: {grado}° {grupo} {materia_id} - {motivo}")
+    print(resultado.resumen())
+
+    if args.aplicar:
+        for error in resultado.aplicar(sistema):
+            print(f"Error: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Índices de horarios
+Detección de empalmes por docente, aula y grupo con intervalos ordenados por día
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Optional
+
+
+_HORA = re.compile(r'(\d{1,2}):(\d{2})')
+
+DIAS_SEMANA = ["LUNES", "MARTES", "MIÉRCOLES", "JUEVES", "VIERNES", "SÁBADO", "DOMINGO"]
+
+
+def _sin_acentos(texto: str) -> str:
+    return ''.join(c for c in unicodedata.normalize('NFD', texto) if not unicodedata.combining(c))
+
+
+# Nombre sin acentos -> nombre como se guarda ("MIERCOLES" -> "MIÉRCOLES")
+_DIAS_SIN_ACENTOS = {_sin_acentos(dia): dia for dia in DIAS_SEMANA}
+
+
+def normalizar_dia(dia: str) -> str:
+    """Día en mayúsculas y con acentos ('miercoles' -> 'MIÉRCOLES'); lo que no es un día solo pasa a mayúsculas"""
+    dia = str(dia).strip().upper()
+    return _DIAS_SIN_ACENTOS.get(_sin_acentos(dia), dia)
+
+
+def hora_a_minutos(hora: str) -> int:
+    """Convertir 'HH:MM' a minutos desde la medianoche; ValueError si no es válida"""
+    coincidencia = _HORA.fullmatch(str(hora).strip())
+    if not coincidencia:
+        raise ValueError(f"Hora no válida: {hora}")
+    horas, minutos = int(coincidencia.group(1)), int(coincidencia.group(2))
+    if horas > 24 or minutos > 59 or horas * 60 + minutos > 24 * 60:
+        raise ValueError(f"Hora no válida: {hora}")
+    return horas * 60 + minutos
+
+
+def claves_horario(horario) -> List[tuple]:
+    """Recursos que ocupa un horario: docente, aula y grupo, cada uno en su día"""
+    dia = normalizar_dia(horario.dia)
+    return [
+        ('docente', horario.docente_id, dia),
+        ('aula', horario.aula.strip().upper(), dia),
+        ('grupo', (horario.grado, horario.grupo), dia),
+    ]
+
+
+class IndiceHorarios:
+    """Intervalos [inicio, fin) ordenados por inicio para cada recurso y día
+
+    Junto a cada lista se guarda el mayor fin hasta cada posición. Con la
+    búsqueda binaria del punto de inserción basta revisar el siguiente
+    intervalo y ese máximo de los anteriores, aunque el archivo de datos
+    traiga intervalos ya empalmados (que auditar() reporta).
+
+    Insertar es O(n) en la lista del recurso y día (list.insert), no
+    logarítmico: cada lista tiene a lo sumo las clases de un día de un
+    docente, aula o grupo, y para esos tamaños el memmove de list.insert
+    cuesta menos que mantener un árbol balanceado en Python. De los máximos
+    solo se actualizan los siguientes que sean menores que el nuevo fin; si
+    el horario no se empalma con nada, ninguno.
+    """
+
+    def __init__(self):
+        self.intervalos: Dict[tuple, List[tuple]] = {}
+        self.fines_maximos: Dict[tuple, List[int]] = {}
+
+    def agregar(self, horario):
+        """Registrar un horario en los índices de sus tres recursos"""
+        inicio = hora_a_minutos(horario.hora_inicio)
+        fin = hora_a_minutos(horario.hora_fin)
+        for clave in claves_horario(horario):
+            lista = self.intervalos.setdefault(clave, [])
+            maximos = self.fines_maximos.setdefault(clave, [])
+            intervalo = (inicio, fin, horario.id)
+            posicion = bisect_right(lista, intervalo)
+            lista.insert(posicion, intervalo)
+            maximos.insert(posicion, max(fin, maximos[posicion - 1]) if posicion else fin)
+            # Los máximos siguientes son no decrecientes: cambian solo mientras sean menores que fin
+            for i in range(posicion + 1, len(lista)):
+                if maximos[i] >= fin:
+                    break
+                maximos[i] = fin
+
+    def conflictos(self, horario) -> List[tuple]:
+        """Empalmes de un horario nuevo como (tipo, recurso, id del horario existente)"""
+        inicio = hora_a_minutos(horario.hora_inicio)
+        fin = hora_a_minutos(horario.hora_fin)
+        encontrados = []
+
+        for clave in claves_horario(horario):
+            lista = self.intervalos.get(clave)
+            if not lista:
+                continue
+            posicion = bisect_left(lista, (inicio,))
+            if posicion < len(lista) and lista[posicion][0] < fin:
+                encontrados.append((clave[0], clave[1], lista[posicion][2]))
+            elif posicion > 0 and self.fines_maximos[clave][posicion - 1] > inicio:
+                # Algún intervalo anterior termina después del inicio: buscar cuál
+                for otro_inicio, otro_fin, otro_id in reversed(lista[:posicion]):
+                    if otro_fin > inicio:
+                        encontrados.append((clave[0], clave[1], otro_id))
+                        break
+
+        return encontrados
+
+    def auditar(self) -> List[tuple]:
+        """Todos los pares de horarios empalmados: (tipo, recurso, día, id1, id2)"""
+        empalmes = []
+        for (tipo, recurso, dia), lista in self.intervalos.items():
+            activos = []
+            for inicio, fin, horario_id in lista:
+                # Descartar los que terminaron antes de que empiece este
+                activos = [(f, h) for f, h in activos if f > inicio]
+                for _, otro_id in activos:
+                    empalmes.append((tipo, recurso, dia, otro_id, horario_id))
+                activos.append((fin, horario_id))
+        return empalmes
+
+
+def describir_conflicto(tipo: str, recurso, horario_existente: Optional[object]) -> str:
+    """Mensaje legible para un empalme"""
+    if tipo == 'grupo':
+        recurso_texto = f"el grupo {recurso[0]}° {recurso[1]} ya está ocupado"
+    elif tipo == 'docente':
+        recurso_texto = f"el docente {recurso} ya está ocupado"
+    else:
+        recurso_texto = f"el aula {recurso} ya está ocupada"
+
+    if horario_existente is None:
+        return f"{recurso_texto} en ese horario"
+    return (f"{recurso_texto} el {horario_existente.dia} de "
+            f"{horario_existente.hora_inicio} a {horario_existente.hora_fin} "
+            f"(horario {horario_existente.id})")
@@ -0,0 +1,226 @@
+"""
+Importación masiva desde archivos CSV
+Alumnos, docentes, materias y calificaciones con validación por lote y una sola escritura
+
+Uso:
+    python -m control_escolar.importacion alumnos alumnos.csv
+    python -m control_escolar.importacion calificaciones califs.csv --solo-validar
+
+Columnas esperadas (primera fila como encabezado):
+    alumnos:        nombre, apellido, fecha_nacimiento, telefono, matricula, grado, grupo
+    docentes:       nombre, apellido, fecha_nacimiento, telefono, num_empleado, especialidad, email
+    materias:       id, nombre, grado, descripcion (opcional)
+    calificaciones: matricula, materia_id, semestre, calificacion
+"""
+
+import argparse
+import csv
+from typing import List, Dict, Iterator, Tuple
+
+from .sistema import SistemaControlEscolar
+
+
+COLUMNAS = {
+    'alumnos': ('nombre', 'apellido', 'fecha_nacimiento', 'telefono', 'matricula', 'grado', 'grupo'),
+    'docentes': ('nombre', 'apellido', 'fecha_nacimiento', 'telefono', 'num_empleado',
+                 'especialidad', 'email'),
+    'materias': ('id', 'nombre', 'grado'),
+    'calificaciones': ('matricula', 'materia_id', 'semestre', 'calificacion'),
+}
+
+
+class ResultadoImportacion:
+    """Resultado de una importación: filas aceptadas y errores con número de línea"""
+
+    def __init__(self, tipo: str):
+        self.tipo = tipo
+        self.importados = 0
+        self.errores: List[Tuple[int, str]] = []
+
+    def agregar_error(self, linea: int, mensaje: str):
+        self.errores.append((linea, mensaje))
+
+    def resumen(self) -> str:
+        return (f"{self.tipo}: {self.importados} fila(s) importada(s), "
+                f"{len(self.errores)} error(es)")
+
+
+def leer_filas(ruta: str) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """Leer un CSV fila por fila, devolviendo (número de línea, fila sin espacios)"""
+    with open(ruta, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        yield 1, {c: c for c in (reader.fieldnames or [])}
+        for fila in reader:
+            yield reader.line_num, {k: (v or '').strip() for k, v in fila.items() if k}
+
+
+def _validar_alumno(sistema, fila, vistos) -> str:
+    matricula = fila['matricula']
+    if matricula in vistos:
+        return f"Matrícula {matricula} repetida en el archivo (línea {vistos[matricula]})"
+    if matricula in sistema.alumnos:
+        return f"Ya existe un alumno con matrícula {matricula}"
+    return ""
+
+
+def _validar_docente(sistema, fila, vistos) -> str:
+    num_empleado = fila['num_empleado']
+    if num_empleado in vistos:
+        return f"Número de empleado {num_empleado} repetido en el archivo (línea {vistos[num_empleado]})"
+    if num_empleado in sistema.docentes:
+        return f"Ya existe un docente con número de empleado {num_empleado}"
+    return ""
+
+
+def _validar_materia(sistema, fila, vistos) -> str:
+    materia_id = fila['id']
+    if materia_id in vistos:
+        return f"Materia {materia_id} repetida en el archivo (línea {vistos[materia_id]})"
+    if materia_id in sistema.materias:
+        return f"Ya existe una materia con ID {materia_id}"
+    return ""
+
+
+def _validar_calificacion(sistema, fila, vistos) -> str:
+    alumno = sistema.alumnos.get(fila['matricula'])
+    if alumno is None:
+        return f"No existe alumno con matrícula {fila['matricula']}"
+    if not alumno.activo:
+        return f"El alumno {fila['matricula']} está dado de baja"
+    if fila['materia_id'] not in sistema.materias:
+        return f"No existe materia con ID {fila['materia_id']}"
+    try:
+        valor = float(fila['calificacion'])
+    except ValueError:
+        return f"Calificación no numérica: {fila['calificacion']}"
+    if not 0 <= valor <= 100:
+        return "La calificación debe estar entre 0 y 100"
+    clave = (fila['matricula'], fila['materia_id'], fila['semestre'])
+    if clave in vistos:
+        return f"Calificación repetida para este alumno en {fila['semestre']} (línea {vistos[clave]})"
+    if sistema.almacen_calificaciones.existe(*clave):
+        return f"Ya existe una calificación para este alumno en {fila['semestre']}"
+    return ""
+
+
+def _clave(tipo: str, fila: Dict[str, str]):
+    if tipo == 'alumnos':
+        return fila['matricula']
+    if tipo == 'docentes':
+        return fila['num_empleado']
+    if tipo == 'materias':
+        return fila['id']
+    return (fila['matricula'], fila['materia_id'], fila['semestre'])
+
+
+def _aplicar(sistema: SistemaControlEscolar, tipo: str, fila: Dict[str, str]):
+    if tipo == 'docentes':
+        return sistema.agregar_docente(fila['nombre'], fila['apellido'], fila['fecha_nacimiento'],
+                                       fila['telefono'], fila['num_empleado'], fila['especialidad'],
+                                       fila['email'])
+    return sistema.agregar_materia(fila['id'], fila['nombre'], fila['grado'],
+                                   fila.get('descripcion', ''))
+
+
+VALIDADORES = {
+    'alumnos': _validar_alumno,
+    'docentes': _validar_docente,
+    'materias': _validar_materia,
+    'calificaciones': _validar_calificacion,
+}
+
+
+def importar_csv(sistema: SistemaControlEscolar, tipo: str, ruta: str,
+                 solo_validar: bool = False) -> ResultadoImportacion:
+    """Importar un archivo CSV de alumnos, docentes, materias o calificaciones
+
+    Las filas se leen una a una y se validan contra los datos existentes y
+    contra las filas anteriores del mismo archivo. Se reportan todos los
+    errores y las filas válidas se aplican con una sola escritura del archivo
+    de datos (ninguna si solo_validar es True).
+    """
+    if tipo not in COLUMNAS:
+        raise ValueError(f"Tipo desconocido: {tipo}. Válidos: {', '.join(COLUMNAS)}")
+
+    resultado = ResultadoImportacion(tipo)
+    validar = VALIDADORES[tipo]
+    requeridas = COLUMNAS[tipo]
+
+    # Claves ya vistas en el archivo -> línea donde aparecieron
+    vistos: Dict = {}
+
+    filas = leer_filas(ruta)
+    _, encabezado = next(filas, (1, {}))
+    faltantes = [c for c in requeridas if c not in encabezado]
+    if faltantes:
+        resultado.agregar_error(1, f"Faltan columnas: {', '.join(faltantes)}")
+        return resultado
+
+    def validas():
+        for linea, fila in filas:
+            vacias = [c for c in requeridas if not fila.get(c)]
+            if vacias:
+                resultado.agregar_error(linea, f"Campos vacíos: {', '.join(vacias)}")
+                continue
+
+            mensaje = validar(sistema, fila, vistos)
+            if mensaje:
+                resultado.agregar_error(linea, mensaje)
+                continue
+
+            vistos[_clave(tipo, fila)] = linea
+            yield linea, fila
+
+    with sistema.escritura_diferida():
+        if solo_validar:
+            for _ in validas():
+                resultado.importados += 1
+        elif tipo == 'alumnos':
+            # Los alumnos se agregan en bloque conforme se leen, con un solo evento de cambio;
+            # lineas traduce el número de registro de dar_alta_alumnos a la línea del archivo
+            lineas = []
+
+            def filas_alumnos():
+                for linea, fila in validas():
+                    lineas.append(linea)
+                    yield fila
+
+            importados, errores = sistema.dar_alta_alumnos(filas_alumnos())
+            resultado.importados += importados
+            for numero, mensaje in errores.items():
+                resultado.agregar_error(lineas[numero - 1], mensaje)
+        elif tipo == 'calificaciones':
+            # Ya se validaron (incluida la duplicidad); se evita repetir la validación de registrar_calificacion
+            resultado.importados += sistema.registrar_calificaciones_validadas(
+                fila for _, fila in validas())
+        else:
+            for linea, fila in validas():
+                exito, mensaje = _aplicar(sistema, tipo, fila)
+                if exito:
+                    resultado.importados += 1
+                else:
+                    resultado.agregar_error(linea, mensaje)
+
+    return resultado
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Importar datos escolares desde CSV")
+    parser.add_argument('tipo', choices=list(COLUMNAS))
+    parser.add_argument('archivo', help="Archivo CSV con encabezado")
+    parser.add_argument('--datos', default="datos_escuela.json", help="Archivo JSON de datos")
+    parser.add_argument('--solo-validar', action='store_true',
+                        help="Validar sin modificar el archivo de datos")
+    args = parser.parse_args(argv)
+
+    sistema = SistemaControlEscolar(args.datos)
+    resultado = importar_csv(sistema, args.tipo, args.archivo, solo_validar=args.solo_validar)
+
+    for linea, mensaje in resultado.errores:
+        print(f"Línea {linea}: {mensaje}")
+    print(resultado.resumen())
+
+
+if __name__ == "__main__":
+    main()
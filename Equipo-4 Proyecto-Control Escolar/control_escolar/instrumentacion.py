@@ -0,0 +1,136 @@
+"""
+Instrumentación de tiempos
+Conteo de llamadas e histograma de latencias por operación, con volcado a JSON
+
+La medición está apagada por defecto: cada método instrumentado solo revisa
+una bandera antes de llamar al original. Se enciende con REGISTRO.activar()
+o con la variable de entorno CONTROL_ESCOLAR_METRICAS=1.
+"""
+
+import json
+import os
+import threading
+from bisect import bisect_left
+from datetime import datetime
+from functools import wraps
+from time import perf_counter
+from typing import List, Dict, Iterable
+
+
+# Límite superior (ms) de cada cubeta del histograma; la última es abierta
+LIMITES_MS = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class MetricaOperacion:
+    """Llamadas, tiempo total, máximo e histograma de una operación"""
+
+    def __init__(self):
+        self.llamadas = 0
+        self.total_ms = 0.0
+        self.maximo_ms = 0.0
+        self.cubetas = [0] * (len(LIMITES_MS) + 1)
+
+    def registrar(self, ms: float):
+        self.llamadas += 1
+        self.total_ms += ms
+        if ms > self.maximo_ms:
+            self.maximo_ms = ms
+        self.cubetas[bisect_left(LIMITES_MS, ms)] += 1
+
+    def percentil(self, p: float) -> float:
+        """Cota superior (ms) de la cubeta donde cae el percentil p"""
+        objetivo = self.llamadas * p / 100
+        acumulado = 0
+        for i, n in enumerate(self.cubetas):
+            acumulado += n
+            if n and acumulado >= objetivo:
+                return LIMITES_MS[i] if i < len(LIMITES_MS) else self.maximo_ms
+        return 0.0
+
+    def a_dict(self) -> Dict:
+        return {
+            'llamadas': self.llamadas,
+            'total_ms': self.total_ms,
+            'promedio_ms': self.total_ms / self.llamadas if self.llamadas else 0.0,
+            'maximo_ms': self.maximo_ms,
+            'p50_ms': self.percentil(50),
+            'p95_ms': self.percentil(95),
+            'histograma': [{'hasta_ms': LIMITES_MS[i] if i < len(LIMITES_MS) else None, 'llamadas': n}
+                           for i, n in enumerate(self.cubetas)]
+        }
+
+
+class Instrumentacion:
+    """Registro de métricas por nombre de operación"""
+
+    def __init__(self, activo: bool = False):
+        self.activo = activo
+        self.metricas: Dict[str, MetricaOperacion] = {}
+        self._candado = threading.Lock()
+
+    def activar(self):
+        self.activo = True
+
+    def desactivar(self):
+        self.activo = False
+
+    def reiniciar(self):
+        with self._candado:
+            self.metricas = {}
+
+    def registrar(self, nombre: str, segundos: float):
+        with self._candado:
+            metrica = self.metricas.get(nombre)
+            if metrica is None:
+                metrica = self.metricas[nombre] = MetricaOperacion()
+            metrica.registrar(segundos * 1000)
+
+    def resumen(self) -> List[Dict]:
+        """Métricas por operación, de mayor a menor tiempo total"""
+        with self._candado:
+            filas = [dict(operacion=nombre, **m.a_dict()) for nombre, m in self.metricas.items()]
+        filas.sort(key=lambda f: f['total_ms'], reverse=True)
+        return filas
+
+    def volcar_json(self, ruta: str):
+        """Guardar el resumen en un archivo JSON para analizarlo después"""
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump({
+                'generado': datetime.now().isoformat(),
+                'limites_ms': LIMITES_MS,
+                'operaciones': self.resumen()
+            }, f, indent=2, ensure_ascii=False)
+
+
+REGISTRO = Instrumentacion(activo=os.environ.get('CONTROL_ESCOLAR_METRICAS') == '1')
+
+
+def _envolver(nombre: str, funcion):
+    @wraps(funcion)
+    def envoltura(*args, **kwargs):
+        if not REGISTRO.activo:
+            return funcion(*args, **kwargs)
+        inicio = perf_counter()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            REGISTRO.registrar(nombre, perf_counter() - inicio)
+    return envoltura
+
+
+def instrumentada(prefijo: str, incluir: Iterable[str] = ('',), excluir: Iterable[str] = ()):
+    """Decorador de clase: instrumenta los métodos públicos cuyo nombre empieza con incluir
+
+    Cada operación se registra como "prefijo.metodo".
+    """
+    incluir = tuple(incluir)
+    excluir = set(excluir)
+
+    def decorador(cls):
+        for nombre, valor in list(vars(cls).items()):
+            if (nombre.startswith('_') or nombre in excluir or not nombre.startswith(incluir)
+                    or not callable(valor) or isinstance(valor, (staticmethod, classmethod, type))):
+                continue
+            setattr(cls, nombre, _envolver(f"{prefijo}.{nombre}", valor))
+        return cls
+    return decorador
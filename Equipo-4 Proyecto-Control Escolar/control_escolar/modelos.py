@@ -0,0 +1,356 @@
+"""
+Modelo de datos del Sistema de Control Escolar
+Clases de entidades: personas, alumnos, docentes, materias, calificaciones y horarios
+
+Las entidades usan __slots__ (sin __dict__ por instancia). CATEGORICOS lista
+los campos de texto que se repiten entre registros (grado, grupo, semestre,
+fechas, ...) y las claves a las que otros registros hacen referencia
+(matrícula, número de empleado, ID de materia); internar_campos hace que
+todos los registros compartan una sola copia de cada valor.
+"""
+
+from datetime import datetime
+from sys import intern
+from typing import Dict, Iterable, Optional
+
+
+def internar_campos(entidad):
+    """Reemplazar los campos categóricos de una entidad por su cadena internada"""
+    for campo in type(entidad).CATEGORICOS:
+        valor = getattr(entidad, campo)
+        if type(valor) is str:
+            setattr(entidad, campo, intern(valor))
+    return entidad
+
+
+def _texto(valor):
+    """Cadena internada; otros valores (None, números) se dejan igual"""
+    return intern(valor) if type(valor) is str else valor
+
+
+class Persona:
+    """Clase base para Alumno y Docente"""
+    
+    __slots__ = ('id', 'nombre', 'apellido', 'fecha_nacimiento', 'telefono')
+    CATEGORICOS = ('nombre', 'apellido')
+    
+    def __init__(self, id: str, nombre: str, apellido: str, fecha_nacimiento: str, telefono: str):
+        self.id = id
+        self.nombre = nombre
+        self.apellido = apellido
+        self.fecha_nacimiento = fecha_nacimiento
+        self.telefono = telefono
+    
+    def get_nombre_completo(self) -> str:
+        return f"{self.nombre} {self.apellido}"
+    
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'nombre': self.nombre,
+            'apellido': self.apellido,
+            'fecha_nacimiento': self.fecha_nacimiento,
+            'telefono': self.telefono
+        }
+
+
+class Alumno(Persona):
+    """Clase Alumno que hereda de Persona"""
+    
+    __slots__ = ('matricula', 'grado', 'grupo', 'activo', 'fecha_alta', 'fecha_baja')
+    CATEGORICOS = Persona.CATEGORICOS + ('id', 'matricula', 'grado', 'grupo', 'fecha_alta', 'fecha_baja')
+    
+    def __init__(self, id: str, nombre: str, apellido: str, fecha_nacimiento: str, 
+                 telefono: str, matricula: str, grado: str, grupo: str, activo: bool = True):
+        super().__init__(id, nombre, apellido, fecha_nacimiento, telefono)
+        self.matricula = matricula
+        self.grado = grado
+        self.grupo = grupo
+        self.activo = activo
+        self.fecha_alta = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.fecha_baja = None
+    
+    def dar_de_baja(self):
+        """Dar de baja al alumno"""
+        self.activo = False
+        self.fecha_baja = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    def coincide(self, termino: str) -> bool:
+        """Si el término (en minúsculas) aparece en la matrícula, el nombre o el apellido"""
+        return (termino in self.matricula.lower() or
+                termino in self.nombre.lower() or
+                termino in self.apellido.lower() or
+                termino in self.get_nombre_completo().lower())
+    
+    def to_dict(self) -> Dict:
+        data = super().to_dict()
+        data.update({
+            'matricula': self.matricula,
+            'grado': self.grado,
+            'grupo': self.grupo,
+            'activo': self.activo,
+            'fecha_alta': self.fecha_alta,
+            'fecha_baja': self.fecha_baja
+        })
+        return data
+    
+    @staticmethod
+    def from_dict(data: Dict) -> 'Alumno':
+        alumno = Alumno(
+            data['id'],
+            data['nombre'],
+            data['apellido'],
+            data['fecha_nacimiento'],
+            data['telefono'],
+            data['matricula'],
+            data['grado'],
+            data['grupo'],
+            data['activo']
+        )
+        alumno.fecha_alta = data.get('fecha_alta', alumno.fecha_alta)
+        alumno.fecha_baja = data.get('fecha_baja')
+        return alumno
+
+
+class Docente(Persona):
+    """Clase Docente que hereda de Persona"""
+    
+    __slots__ = ('num_empleado', 'especialidad', 'email')
+    CATEGORICOS = Persona.CATEGORICOS + ('id', 'num_empleado', 'especialidad')
+    
+    def __init__(self, id: str, nombre: str, apellido: str, fecha_nacimiento: str,
+                 telefono: str, num_empleado: str, especialidad: str, email: str):
+        super().__init__(id, nombre, apellido, fecha_nacimiento, telefono)
+        self.num_empleado = num_empleado
+        self.especialidad = especialidad
+        self.email = email
+    
+    def to_dict(self) -> Dict:
+        data = super().to_dict()
+        data.update({
+            'num_empleado': self.num_empleado,
+            'especialidad': self.especialidad,
+            'email': self.email
+        })
+        return data
+    
+    @staticmethod
+    def from_dict(data: Dict) -> 'Docente':
+        return Docente(
+            data['id'],
+            data['nombre'],
+            data['apellido'],
+            data['fecha_nacimiento'],
+            data['telefono'],
+            data['num_empleado'],
+            data['especialidad'],
+            data['email']
+        )
+
+
+class Materia:
+    """Clase para gestionar materias"""
+    
+    __slots__ = ('id', 'nombre', 'grado', 'descripcion')
+    CATEGORICOS = ('id', 'grado')
+    
+    def __init__(self, id: str, nombre: str, grado: str, descripcion: str = ""):
+        self.id = id
+        self.nombre = nombre
+        self.grado = grado
+        self.descripcion = descripcion
+    
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'nombre': self.nombre,
+            'grado': self.grado,
+            'descripcion': self.descripcion
+        }
+    
+    @staticmethod
+    def from_dict(data: Dict) -> 'Materia':
+        return Materia(
+            data['id'],
+            data['nombre'],
+            data['grado'],
+            data.get('descripcion', '')
+        )
+
+
+class Calificacion:
+    """Clase para gestionar calificaciones de alumnos
+    
+    id es un entero asignado en orden por el almacén de calificaciones.
+    id_externo conserva el ID de texto de las calificaciones registradas
+    antes de los IDs numéricos (None en las nuevas).
+    """
+    
+    __slots__ = ('id', 'matricula_alumno', 'materia_id', 'semestre', 'calificacion', 'fecha_registro',
+                 'id_externo')
+    CATEGORICOS = ('matricula_alumno', 'materia_id', 'semestre', 'fecha_registro')
+    
+    def __init__(self, id: int, matricula_alumno: str, materia_id: str, 
+                 semestre: str, calificacion: float, fecha_registro: str = None,
+                 id_externo: Optional[str] = None):
+        self.id = id
+        self.matricula_alumno = matricula_alumno
+        self.materia_id = materia_id
+        self.semestre = semestre
+        self.calificacion = calificacion
+        self.fecha_registro = fecha_registro or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.id_externo = id_externo
+    
+    def to_dict(self) -> Dict:
+        data = {
+            'id': self.id,
+            'matricula_alumno': self.matricula_alumno,
+            'materia_id': self.materia_id,
+            'semestre': self.semestre,
+            'calificacion': self.calificacion,
+            'fecha_registro': self.fecha_registro
+        }
+        if self.id_externo is not None:
+            data['id_externo'] = self.id_externo
+        return data
+    
+    @staticmethod
+    def from_dict(data: Dict) -> 'Calificacion':
+        return Calificacion(
+            data['id'],
+            data['matricula_alumno'],
+            data['materia_id'],
+            data['semestre'],
+            data['calificacion'],
+            data.get('fecha_registro'),
+            data.get('id_externo')
+        )
+
+
+class Horario:
+    """Clase para gestionar horarios de clases"""
+    
+    __slots__ = ('id', 'materia_id', 'docente_id', 'grado', 'grupo', 'dia',
+                 'hora_inicio', 'hora_fin', 'aula')
+    CATEGORICOS = ('materia_id', 'docente_id', 'grado', 'grupo', 'dia', 'hora_inicio', 'hora_fin', 'aula')
+    
+    def __init__(self, id: str, materia_id: str, docente_id: str, grado: str, 
+                 grupo: str, dia: str, hora_inicio: str, hora_fin: str, aula: str):
+        self.id = id
+        self.materia_id = materia_id
+        self.docente_id = docente_id
+        self.grado = grado
+        self.grupo = grupo
+        self.dia = dia
+        self.hora_inicio = hora_inicio
+        self.hora_fin = hora_fin
+        self.aula = aula
+    
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'materia_id': self.materia_id,
+            'docente_id': self.docente_id,
+            'grado': self.grado,
+            'grupo': self.grupo,
+            'dia': self.dia,
+            'hora_inicio': self.hora_inicio,
+            'hora_fin': self.hora_fin,
+            'aula': self.aula
+        }
+    
+    @staticmethod
+    def from_dict(data: Dict) -> 'Horario':
+        return Horario(
+            data['id'],
+            data['materia_id'],
+            data['docente_id'],
+            data['grado'],
+            data['grupo'],
+            data['dia'],
+            data['hora_inicio'],
+            data['hora_fin'],
+            data['aula']
+        )
+
+
+# Construcción masiva para cargar_datos: las entidades se crean directamente
+# desde los registros guardados, sin pasar por __init__ (que calcula fechas
+# que luego se sobrescriben) y con los campos categóricos ya internados. Las
+# claves (matrícula, número de empleado, ID) se usan tal como se guardaron,
+# pues las altas ya las normalizan.
+
+def hidratar_alumnos(registros: Iterable[Dict]) -> Dict[str, Alumno]:
+    alumnos = {}
+    nuevo = object.__new__
+    fecha_alta_por_defecto = None
+    for data in registros:
+        alumno = nuevo(Alumno)
+        matricula = _texto(data['matricula'])
+        alumno.id = _texto(data['id'])
+        alumno.nombre = _texto(data['nombre'])
+        alumno.apellido = _texto(data['apellido'])
+        alumno.fecha_nacimiento = data['fecha_nacimiento']
+        alumno.telefono = data['telefono']
+        alumno.matricula = matricula
+        alumno.grado = _texto(data['grado'])
+        alumno.grupo = _texto(data['grupo'])
+        alumno.activo = data['activo']
+        if 'fecha_alta' in data:
+            alumno.fecha_alta = _texto(data['fecha_alta'])
+        else:
+            if fecha_alta_por_defecto is None:
+                fecha_alta_por_defecto = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            alumno.fecha_alta = fecha_alta_por_defecto
+        alumno.fecha_baja = _texto(data.get('fecha_baja'))
+        alumnos[matricula] = alumno
+    return alumnos
+
+
+def hidratar_docentes(registros: Iterable[Dict]) -> Dict[str, Docente]:
+    docentes = {}
+    nuevo = object.__new__
+    for data in registros:
+        docente = nuevo(Docente)
+        num_empleado = _texto(data['num_empleado'])
+        docente.id = _texto(data['id'])
+        docente.nombre = _texto(data['nombre'])
+        docente.apellido = _texto(data['apellido'])
+        docente.fecha_nacimiento = data['fecha_nacimiento']
+        docente.telefono = data['telefono']
+        docente.num_empleado = num_empleado
+        docente.especialidad = _texto(data['especialidad'])
+        docente.email = data['email']
+        docentes[num_empleado] = docente
+    return docentes
+
+
+def hidratar_materias(registros: Iterable[Dict]) -> Dict[str, Materia]:
+    materias = {}
+    nuevo = object.__new__
+    for data in registros:
+        materia = nuevo(Materia)
+        materia.id = _texto(data['id'])
+        materia.nombre = data['nombre']
+        materia.grado = _texto(data['grado'])
+        materia.descripcion = data.get('descripcion', '')
+        materias[materia.id] = materia
+    return materias
+
+
+def hidratar_horarios(registros: Iterable[Dict]) -> Dict[str, Horario]:
+    horarios = {}
+    nuevo = object.__new__
+    for data in registros:
+        horario = nuevo(Horario)
+        horario.id = data['id']
+        horario.materia_id = _texto(data['materia_id'])
+        horario.docente_id = _texto(data['docente_id'])
+        horario.grado = _texto(data['grado'])
+        horario.grupo = _texto(data['grupo'])
+        horario.dia = _texto(data['dia'])
+        horario.hora_inicio = _texto(data['hora_inicio'])
+        horario.hora_fin = _texto(data['hora_fin'])
+        horario.aula = _texto(data['aula'])
+        horarios[horario.id] = horario
+    return horarios
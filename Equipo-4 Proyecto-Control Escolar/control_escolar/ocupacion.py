@@ -0,0 +1,99 @@
+"""
+Mapa de ocupación semanal
+Un entero por aula, docente y grupo cuyos bits marcan las franjas ocupadas de la semana
+
+Cada día se divide en franjas fijas de MINUTOS_FRANJA minutos; el bit
+dia * FRANJAS_POR_DIA + franja vale 1 si el recurso está ocupado. Las
+consultas de disponibilidad se resuelven con AND/OR sobre esos enteros en
+lugar de recorrer los horarios. Las horas que no caen en el límite de una
+franja se redondean hacia afuera, de modo que una franja parcialmente
+ocupada cuenta como ocupada.
+"""
+
+from typing import List, Dict, Iterable, Optional, Tuple
+
+from .horarios import DIAS_SEMANA, hora_a_minutos, claves_horario, normalizar_dia
+
+
+MINUTOS_FRANJA = 15
+FRANJAS_POR_DIA = 24 * 60 // MINUTOS_FRANJA
+
+
+def minutos_a_hora(minutos: int) -> str:
+    """Convertir minutos desde la medianoche a 'HH:MM'"""
+    return f"{minutos // 60:02d}:{minutos % 60:02d}"
+
+
+def indice_dia(dia: str) -> int:
+    """Posición del día en la semana (acepta minúsculas y falta de acentos); ValueError si no es un día"""
+    dia = normalizar_dia(dia)
+    if dia not in DIAS_SEMANA:
+        raise ValueError(f"Día no válido: {dia}")
+    return DIAS_SEMANA.index(dia)
+
+
+def mascara_intervalo(dia: str, hora_inicio: str, hora_fin: str) -> int:
+    """Bits de las franjas que toca [hora_inicio, hora_fin) en un día; ValueError si el día o las horas no son válidos"""
+    base = indice_dia(dia) * FRANJAS_POR_DIA
+    primera = hora_a_minutos(hora_inicio) // MINUTOS_FRANJA
+    ultima = -(-hora_a_minutos(hora_fin) // MINUTOS_FRANJA)  # techo
+    if ultima <= primera:
+        return 0
+    return ((1 << (ultima - primera)) - 1) << (base + primera)
+
+
+class MapaOcupacion:
+    """Ocupación semanal por recurso: ('aula', AULA), ('docente', id) y ('grupo', (grado, grupo))"""
+
+    def __init__(self):
+        self.ocupacion: Dict[tuple, int] = {}
+
+    def agregar(self, horario):
+        """Marcar las franjas de un horario en sus tres recursos"""
+        for tipo, recurso, dia in claves_horario(horario):
+            mascara = mascara_intervalo(dia, horario.hora_inicio, horario.hora_fin)
+            clave = (tipo, recurso)
+            self.ocupacion[clave] = self.ocupacion.get(clave, 0) | mascara
+
+    def esta_libre(self, tipo: str, recurso, mascara: int) -> bool:
+        return not self.ocupacion.get((tipo, recurso), 0) & mascara
+
+    def aulas(self) -> List[str]:
+        """Aulas que aparecen en algún horario"""
+        return sorted(recurso for tipo, recurso in self.ocupacion if tipo == 'aula')
+
+    def libres(self, tipo: str, recursos: Iterable, dia: str,
+               hora_inicio: str, hora_fin: str) -> List:
+        """Recursos de un tipo sin ninguna franja ocupada en el intervalo dado"""
+        mascara = mascara_intervalo(dia, hora_inicio, hora_fin)
+        return [r for r in recursos if self.esta_libre(tipo, r, mascara)]
+
+    def franjas_libres_comunes(self, recursos: Iterable[tuple], dias: Optional[Iterable[str]] = None,
+                               desde: str = "07:00", hasta: str = "20:00") -> List[Tuple[str, str, str]]:
+        """Intervalos en que todos los recursos están libres: [(día, inicio, fin)]
+
+        recursos: claves (tipo, recurso). Se unen sus ocupaciones con OR y se
+        recorren los bits en cero entre desde y hasta de cada día. ValueError
+        si algún día no es válido.
+        """
+        ocupado = 0
+        for clave in recursos:
+            ocupado |= self.ocupacion.get(clave, 0)
+
+        primera = hora_a_minutos(desde) // MINUTOS_FRANJA
+        ultima = hora_a_minutos(hasta) // MINUTOS_FRANJA
+        resultado = []
+        for dia in (dias or DIAS_SEMANA):
+            numero = indice_dia(dia)
+            dia = DIAS_SEMANA[numero]
+            bits = ocupado >> (numero * FRANJAS_POR_DIA)
+            inicio_libre = None
+            for franja in range(primera, ultima + 1):
+                libre = franja < ultima and not (bits >> franja) & 1
+                if libre and inicio_libre is None:
+                    inicio_libre = franja
+                elif not libre and inicio_libre is not None:
+                    resultado.append((dia, minutos_a_hora(inicio_libre * MINUTOS_FRANJA),
+                                      minutos_a_hora(franja * MINUTOS_FRANJA)))
+                    inicio_libre = None
+        return resultado
@@ -0,0 +1,93 @@
+"""
+Reportes de rendimiento académico
+Distribución, percentiles y aprobación por grupo, materia y semestre
+"""
+
+import math
+from itertools import islice
+from typing import List, Dict, Optional
+
+from .columnar import CALIFICACION_APROBATORIA
+
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def percentil(valores_ordenados: List[float], p: float) -> float:
+    """Percentil p (0-100) con interpolación lineal sobre una lista ya ordenada"""
+    if not valores_ordenados:
+        return 0.0
+    posicion = (len(valores_ordenados) - 1) * p / 100
+    inferior = math.floor(posicion)
+    superior = math.ceil(posicion)
+    if inferior == superior:
+        return valores_ordenados[inferior]
+    fraccion = posicion - inferior
+    return valores_ordenados[inferior] * (1 - fraccion) + valores_ordenados[superior] * fraccion
+
+
+def reporte_rendimiento(sistema, semestre: Optional[str] = None, grado: Optional[str] = None,
+                        grupo: Optional[str] = None, materia_id: Optional[str] = None,
+                        ancho_intervalo: int = 10) -> Dict:
+    """Estadísticas de las calificaciones que cumplen los filtros
+
+    Recorre una sola vez las columnas del almacén de calificaciones: en el mismo
+    recorrido filtra, arma el histograma, cuenta aprobados y acumula media y
+    varianza (método de Welford). Los percentiles se obtienen ordenando solo
+    los valores seleccionados.
+    """
+    almacen = sistema.almacen_calificaciones
+
+    # Traducir los filtros a códigos enteros una sola vez
+    cod_semestre = almacen.semestres.codigos.get(semestre, -1) if semestre is not None else None
+    cod_materia = almacen.materias.codigos.get(materia_id, -1) if materia_id is not None else None
+    alumnos_permitidos = None
+    if grado is not None or grupo is not None:
+        alumnos_permitidos = set()
+        for matricula, codigo in list(almacen.alumnos.codigos.items()):
+            alumno = sistema.alumnos.get(matricula)
+            if (alumno is not None
+                    and (grado is None or alumno.grado == grado)
+                    and (grupo is None or alumno.grupo == grupo)):
+                alumnos_permitidos.add(codigo)
+
+    num_intervalos = math.ceil(100 / ancho_intervalo)
+    histograma = [0] * num_intervalos
+    valores = []
+    aprobados = 0
+    media = 0.0
+    m2 = 0.0
+
+    filas = zip(almacen.col_alumno, almacen.col_materia, almacen.col_semestre, almacen.col_calificacion)
+    for cod_alumno, cod_mat, cod_sem, valor in islice(filas, len(almacen)):
+        if cod_semestre is not None and cod_sem != cod_semestre:
+            continue
+        if cod_materia is not None and cod_mat != cod_materia:
+            continue
+        if alumnos_permitidos is not None and cod_alumno not in alumnos_permitidos:
+            continue
+
+        valores.append(valor)
+        histograma[min(int(valor // ancho_intervalo), num_intervalos - 1)] += 1
+        if valor >= CALIFICACION_APROBATORIA:
+            aprobados += 1
+        delta = valor - media
+        media += delta / len(valores)
+        m2 += delta * (valor - media)
+
+    cantidad = len(valores)
+    valores.sort()
+
+    return {
+        'cantidad': cantidad,
+        'promedio': media if cantidad else 0.0,
+        'mediana': percentil(valores, 50),
+        'desviacion_estandar': math.sqrt(m2 / cantidad) if cantidad else 0.0,
+        'minimo': valores[0] if cantidad else 0.0,
+        'maximo': valores[-1] if cantidad else 0.0,
+        'percentiles': {p: percentil(valores, p) for p in PERCENTILES},
+        'histograma': [(i * ancho_intervalo, min((i + 1) * ancho_intervalo, 100), n)
+                       for i, n in enumerate(histograma)],
+        'aprobados': aprobados,
+        'tasa_aprobacion': aprobados / cantidad if cantidad else 0.0
+    }
@@ -0,0 +1,521 @@
+"""
+Servidor HTTP/JSON local
+Una sola instancia de SistemaControlEscolar en memoria compartida por varios clientes
+
+Uso:
+    python -m control_escolar.servidor --datos datos_escuela.json --puerto 8765
+    python "control_escolar2_0 (1).py" --servidor http://127.0.0.1:8765
+
+La interfaz gráfica se conecta con --servidor: usa un SistemaRemoto, réplica
+en memoria del sistema del servidor que envía cada alta al servidor y se
+recarga cuando este la acepta (ver SistemaRemoto).
+
+Cada petición se atiende en su propio hilo, pero las llamadas al sistema se
+hacen una a la vez (un candado), así que todos los clientes ven los mismos
+datos e índices y solo el servidor escribe el archivo JSON. Los reportes
+(/reportes/...) se calculan sobre una instantánea tomada con el candado y
+fuera de él, así que no detienen las altas mientras se generan.
+
+Rutas (los parámetros de búsqueda van en la URL; las altas, en un cuerpo JSON
+con los mismos nombres que los argumentos del sistema):
+    GET  /alumnos?q=&todos=1            POST /alumnos
+                                        POST /alumnos/lote  (lista de alumnos)
+    GET  /alumnos/<matricula>           POST /alumnos/<matricula>/baja
+    GET  /alumnos/<matricula>/calificaciones
+    GET  /alumnos/<matricula>/boletin
+    GET  /docentes?q=                   POST /docentes
+    GET  /materias?q=                   POST /materias
+    POST /calificaciones                POST /calificaciones/grupo
+    GET  /horarios?grado=&grupo=  |  ?docente=
+    POST /horarios
+    GET  /grupos                        GET /grupos/<grado>/<grupo>/alumnos
+    GET  /reportes/estadisticas?por=&semestre=&materia_id=
+    GET  /reportes/top?grado=&grupo=&n=
+    GET  /reportes/riesgo?materia_id=&semestre=&n=
+    GET  /reportes/rendimiento?semestre=&grado=&grupo=&materia_id=
+    GET  /disponibilidad/aulas?dia=&inicio=&fin=
+    GET  /disponibilidad/docentes?dia=&inicio=&fin=
+    GET  /diagnostico/cache
+    GET  /datos                         (todas las colecciones, como exportar_datos)
+
+Las altas responden {"ok": bool, "mensaje": str} (201 si se hizo, 409 si el
+sistema la rechazó); el alta en lote y las calificaciones de grupo responden
+{"ok", "registrados", "errores"} (409 solo si no se agregó ninguna). Las
+consultas responden {"datos": ...}.
+"""
+
+import argparse
+import inspect
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Mapping, Optional, Tuple
+from urllib import request as urllib_request
+from urllib.error import HTTPError
+from urllib.parse import urlsplit, parse_qs, urlencode, quote, unquote
+
+from .modelos import Alumno, Docente, Materia, Calificacion, Horario
+from .reportes import reporte_rendimiento
+from .sistema import SistemaControlEscolar
+
+
+class ErrorPeticion(Exception):
+    """Petición mal formada o recurso inexistente; lleva el código HTTP"""
+
+    def __init__(self, estado: int, mensaje: str):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+def a_json(valor):
+    """Convertir entidades, tuplas y claves no textuales a tipos de JSON"""
+    if hasattr(valor, 'to_dict'):
+        return valor.to_dict()
+    if isinstance(valor, Mapping):
+        return {('-'.join(map(str, k)) if isinstance(k, tuple) else str(k)): a_json(v)
+                for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [a_json(v) for v in valor]
+    return valor
+
+
+def _requerido(params: Dict[str, str], nombre: str) -> str:
+    if not params.get(nombre):
+        raise ErrorPeticion(400, f"Falta el parámetro {nombre}")
+    return params[nombre]
+
+
+def _entero(params: Dict[str, str], nombre: str, defecto: int) -> int:
+    try:
+        return int(params.get(nombre, defecto))
+    except ValueError:
+        raise ErrorPeticion(400, f"El parámetro {nombre} debe ser un entero")
+
+
+def _alta(metodo, cuerpo: Dict):
+    """Llamar un método de alta del sistema con el cuerpo como argumentos
+
+    Los campos se revisan contra la firma del método antes de llamarlo; un
+    TypeError dentro del método es un error del servidor, no de la petición.
+    """
+    if not isinstance(cuerpo, dict):
+        raise ErrorPeticion(400, "El cuerpo debe ser un objeto JSON")
+    try:
+        inspect.signature(metodo).bind(**cuerpo)
+    except TypeError as e:
+        raise ErrorPeticion(400, f"Campos inválidos: {e}")
+    ok, mensaje = metodo(**cuerpo)
+    return (201 if ok else 409), {'ok': ok, 'mensaje': mensaje}
+
+
+def _resultado_lote(registrados: int, errores: Dict) -> Tuple[int, Dict]:
+    ok = registrados > 0 or not errores
+    return (201 if ok else 409), {'ok': ok, 'registrados': registrados, 'errores': errores}
+
+
+def _alta_lote(sistema, cuerpo: List[Dict]):
+    """Dar de alta una lista de alumnos con dar_alta_alumnos"""
+    if not isinstance(cuerpo, list) or not all(isinstance(r, dict) for r in cuerpo):
+        raise ErrorPeticion(400, "El cuerpo debe ser una lista de objetos JSON")
+    return _resultado_lote(*sistema.dar_alta_alumnos(cuerpo))
+
+
+def _calificaciones_grupo(sistema, cuerpo: Dict):
+    """Registrar las calificaciones de un grupo con registrar_calificaciones_grupo"""
+    if not isinstance(cuerpo, dict) or not isinstance(cuerpo.get('calificaciones'), dict):
+        raise ErrorPeticion(400, "El cuerpo debe ser un objeto JSON con las calificaciones por matrícula")
+    try:
+        inspect.signature(sistema.registrar_calificaciones_grupo).bind(**cuerpo)
+    except TypeError as e:
+        raise ErrorPeticion(400, f"Campos inválidos: {e}")
+    return _resultado_lote(*sistema.registrar_calificaciones_grupo(**cuerpo))
+
+
+def _alumno(sistema, matricula: str) -> Alumno:
+    alumno = sistema.alumnos.get(matricula)
+    if alumno is None:
+        raise ErrorPeticion(404, f"No existe alumno con matrícula {matricula}")
+    return alumno
+
+
+def _estadisticas(sistema, p):
+    try:
+        return sistema.estadisticas_calificaciones(p.get('por', 'materia'), semestre=p.get('semestre'),
+                                                   materia_id=p.get('materia_id'))
+    except ValueError as e:
+        raise ErrorPeticion(400, str(e))
+
+
+def _disponibilidad(consulta, p):
+    """aulas_libres o docentes_libres con dia, inicio y fin; un día u hora inválidos son 400"""
+    try:
+        return consulta(_requerido(p, 'dia'), _requerido(p, 'inicio'), _requerido(p, 'fin'))
+    except ValueError as e:
+        raise ErrorPeticion(400, str(e))
+
+
+def _con_promedio(pares) -> List[Dict]:
+    return [{'alumno': alumno.to_dict(), 'promedio': promedio} for alumno, promedio in pares]
+
+
+def _horarios(sistema, p):
+    if p.get('docente'):
+        return sistema.obtener_horarios_por_docente(p['docente'])
+    return sistema.obtener_horarios_por_grupo(_requerido(p, 'grado'), _requerido(p, 'grupo'))
+
+
+# (método, patrón de la ruta, función(sistema, parámetros, cuerpo, *grupos) -> datos o (estado, datos))
+RUTAS = [
+    ('GET', r'/alumnos', lambda s, p, c: s.buscar_alumnos(p.get('q', ''), solo_activos=p.get('todos') != '1')),
+    ('POST', r'/alumnos', lambda s, p, c: _alta(s.dar_alta_alumno, c)),
+    ('POST', r'/alumnos/lote', lambda s, p, c: _alta_lote(s, c)),
+    ('GET', r'/alumnos/([^/]+)', lambda s, p, c, m: _alumno(s, m)),
+    ('POST', r'/alumnos/([^/]+)/baja', lambda s, p, c, m: _alta(lambda: s.dar_baja_alumno(m), {})),
+    ('GET', r'/alumnos/([^/]+)/calificaciones',
+     lambda s, p, c, m: {'calificaciones': s.obtener_calificaciones_alumno(_alumno(s, m).matricula),
+                         'promedio': s.obtener_promedio_alumno(m)}),
+    ('GET', r'/alumnos/([^/]+)/boletin', lambda s, p, c, m: s.obtener_boletin(_alumno(s, m).matricula)),
+    ('GET', r'/docentes', lambda s, p, c: s.buscar_docentes(p.get('q', ''))),
+    ('POST', r'/docentes', lambda s, p, c: _alta(s.agregar_docente, c)),
+    ('GET', r'/materias', lambda s, p, c: s.buscar_materias(p.get('q', ''))),
+    ('POST', r'/materias', lambda s, p, c: _alta(s.agregar_materia, c)),
+    ('POST', r'/calificaciones', lambda s, p, c: _alta(s.registrar_calificacion, c)),
+    ('POST', r'/calificaciones/grupo', lambda s, p, c: _calificaciones_grupo(s, c)),
+    ('GET', r'/horarios', lambda s, p, c: _horarios(s, p)),
+    ('POST', r'/horarios', lambda s, p, c: _alta(s.agregar_horario, c)),
+    ('GET', r'/grupos', lambda s, p, c: s.obtener_grupos_disponibles()),
+    ('GET', r'/grupos/([^/]+)/([^/]+)/alumnos', lambda s, p, c, g, gr: s.obtener_alumnos_por_grupo(g, gr)),
+    ('GET', r'/reportes/estadisticas', lambda s, p, c: _estadisticas(s, p)),
+    ('GET', r'/reportes/top',
+     lambda s, p, c: _con_promedio(s.top_alumnos(_requerido(p, 'grado'), _requerido(p, 'grupo'),
+                                                 _entero(p, 'n', 10)))),
+    ('GET', r'/reportes/riesgo',
+     lambda s, p, c: _con_promedio(s.en_riesgo(_requerido(p, 'materia_id'), _requerido(p, 'semestre'),
+                                               _entero(p, 'n', 10)))),
+    ('GET', r'/reportes/rendimiento',
+     lambda s, p, c: reporte_rendimiento(s, semestre=p.get('semestre'), grado=p.get('grado'),
+                                         grupo=p.get('grupo'), materia_id=p.get('materia_id'))),
+    ('GET', r'/disponibilidad/aulas', lambda s, p, c: _disponibilidad(s.aulas_libres, p)),
+    ('GET', r'/disponibilidad/docentes', lambda s, p, c: _disponibilidad(s.docentes_libres, p)),
+    ('GET', r'/diagnostico/cache', lambda s, p, c: s.estadisticas_cache()),
+    ('GET', r'/datos', lambda s, p, c: s.exportar_datos()),
+]
+RUTAS = [(metodo, re.compile(patron + r'/?'), funcion) for metodo, patron, funcion in RUTAS]
+
+
+def buscar_ruta(metodo: str, ruta: str):
+    """(nombre, función, grupos) de la ruta que atiende la petición; ErrorPeticion 404/405 si no hay
+
+    El nombre es el método con el patrón de la ruta, p. ej. "GET /alumnos/([^/]+)".
+    """
+    otro_metodo = False
+    for metodo_ruta, patron, funcion in RUTAS:
+        coincidencia = patron.fullmatch(ruta)
+        if coincidencia is None:
+            continue
+        if metodo_ruta != metodo:
+            otro_metodo = True
+            continue
+        return f"{metodo} {patron.pattern[:-2]}", funcion, coincidencia.groups()
+    if otro_metodo:
+        raise ErrorPeticion(405, f"Método {metodo} no permitido en {ruta}")
+    raise ErrorPeticion(404, f"Ruta desconocida: {ruta}")
+
+
+def ejecutar_ruta(sistema, funcion, grupos, params: Dict[str, str], cuerpo) -> Tuple[int, Dict]:
+    """Llamar la función de una ruta: (código HTTP, respuesta JSON)"""
+    try:
+        resultado = funcion(sistema, params, cuerpo, *grupos)
+    except ErrorPeticion as e:
+        return e.estado, {'error': str(e)}
+    if isinstance(resultado, tuple):
+        return resultado
+    return 200, {'datos': a_json(resultado)}
+
+
+class ServidorControlEscolar(ThreadingHTTPServer):
+    """Servidor HTTP con hilos que atiende las rutas sobre un único sistema"""
+
+    daemon_threads = True
+
+    def __init__(self, sistema: SistemaControlEscolar, direccion: Tuple[str, int] = ('127.0.0.1', 8765)):
+        super().__init__(direccion, _ManejadorAPI)
+        self.sistema = sistema
+        self.candado = threading.RLock()
+
+    def atender(self, metodo: str, ruta: str, params: Dict[str, str], cuerpo) -> Tuple[int, Dict]:
+        """Resolver una petición: (código HTTP, respuesta JSON)"""
+        try:
+            _, funcion, grupos = buscar_ruta(metodo, ruta)
+        except ErrorPeticion as e:
+            return e.estado, {'error': str(e)}
+        if metodo == 'GET' and (ruta.startswith('/reportes/') or ruta.rstrip('/') == '/datos'):
+            with self.candado:
+                instantanea = self.sistema.instantanea()
+            return ejecutar_ruta(instantanea, funcion, grupos, params, cuerpo)
+        with self.candado:
+            return ejecutar_ruta(self.sistema, funcion, grupos, params, cuerpo)
+
+
+class _ManejadorAPI(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _responder(self, estado: int, respuesta: Dict):
+        contenido = json.dumps(respuesta, ensure_ascii=False).encode('utf-8')
+        self.send_response(estado)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(contenido)))
+        self.end_headers()
+        self.wfile.write(contenido)
+
+    def _atender(self, metodo: str):
+        partes = urlsplit(self.path)
+        params = {k: v[-1] for k, v in parse_qs(partes.query).items()}
+        cuerpo = None
+        try:
+            longitud = int(self.headers.get('Content-Length') or 0)
+            if longitud < 0:
+                raise ValueError(longitud)
+        except ValueError:
+            # Sin una longitud válida no se sabe dónde termina el cuerpo
+            self.close_connection = True
+            self._responder(400, {'error': "Content-Length inválido"})
+            return
+        if longitud:
+            try:
+                cuerpo = json.loads(self.rfile.read(longitud).decode('utf-8'))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                self._responder(400, {'error': f"JSON inválido: {e}"})
+                return
+        ruta = unquote(partes.path)
+        try:
+            estado, respuesta = self.server.atender(metodo, ruta, params, cuerpo)
+        except Exception as e:
+            estado, respuesta = 500, {'error': f"Error interno: {e}"}
+        self._responder(estado, respuesta)
+
+    def do_GET(self):
+        self._atender('GET')
+
+    def do_POST(self):
+        self._atender('POST')
+
+    def log_message(self, formato, *args):
+        pass
+
+
+class ClienteControlEscolar:
+    """Cliente de la API para scripts: métodos con los mismos nombres que el sistema
+
+    Las altas devuelven (bool, mensaje) y las consultas, entidades construidas
+    con from_dict, como el sistema local.
+    """
+
+    def __init__(self, url: str = "http://127.0.0.1:8765", tiempo_espera: float = 30.0):
+        self.url = url.rstrip('/')
+        self.tiempo_espera = tiempo_espera
+
+    def _pedir(self, metodo: str, ruta: str, cuerpo: Optional[Dict] = None, **params):
+        params = {k: v for k, v in params.items() if v is not None}
+        url = self.url + quote(ruta) + ('?' + urlencode(params) if params else '')
+        datos = json.dumps(cuerpo).encode('utf-8') if cuerpo is not None else None
+        peticion = urllib_request.Request(url, data=datos, method=metodo,
+                                          headers={'Content-Type': 'application/json'})
+        try:
+            with urllib_request.urlopen(peticion, timeout=self.tiempo_espera) as r:
+                return json.loads(r.read().decode('utf-8'))
+        except HTTPError as e:
+            respuesta = json.loads(e.read().decode('utf-8') or '{}')
+            if 'ok' in respuesta:
+                return respuesta
+            if e.code == 404:
+                return None
+            raise ErrorPeticion(e.code, respuesta.get('error', str(e)))
+
+    def _alta(self, ruta: str, **cuerpo) -> Tuple[bool, str]:
+        respuesta = self._pedir('POST', ruta, cuerpo)
+        return respuesta['ok'], respuesta['mensaje']
+
+    def _lista(self, clase, ruta: str, **params) -> List:
+        return [clase.from_dict(d) for d in self._pedir('GET', ruta, **params)['datos']]
+
+    def dar_alta_alumno(self, nombre, apellido, fecha_nacimiento, telefono, matricula, grado, grupo):
+        return self._alta('/alumnos', nombre=nombre, apellido=apellido, fecha_nacimiento=fecha_nacimiento,
+                          telefono=telefono, matricula=matricula, grado=grado, grupo=grupo)
+
+    def dar_alta_alumnos(self, registros) -> Tuple[int, Dict[int, str]]:
+        respuesta = self._pedir('POST', '/alumnos/lote', list(registros))
+        return respuesta['registrados'], {int(n): m for n, m in respuesta['errores'].items()}
+
+    def dar_baja_alumno(self, matricula):
+        respuesta = self._pedir('POST', f'/alumnos/{matricula}/baja', {})
+        if respuesta is None:
+            return False, f"No se encontró alumno con matrícula {matricula}"
+        return respuesta['ok'], respuesta['mensaje']
+
+    def agregar_docente(self, nombre, apellido, fecha_nacimiento, telefono, num_empleado, especialidad, email):
+        return self._alta('/docentes', nombre=nombre, apellido=apellido, fecha_nacimiento=fecha_nacimiento,
+                          telefono=telefono, num_empleado=num_empleado, especialidad=especialidad,
+                          email=email)
+
+    def agregar_materia(self, id, nombre, grado, descripcion=""):
+        return self._alta('/materias', id=id, nombre=nombre, grado=grado, descripcion=descripcion)
+
+    def registrar_calificacion(self, matricula_alumno, materia_id, semestre, calificacion):
+        return self._alta('/calificaciones', matricula_alumno=matricula_alumno, materia_id=materia_id,
+                          semestre=semestre, calificacion=calificacion)
+
+    def registrar_calificaciones_grupo(self, grado, grupo, materia_id, semestre,
+                                       calificaciones) -> Tuple[int, Dict[str, str]]:
+        respuesta = self._pedir('POST', '/calificaciones/grupo',
+                                dict(grado=grado, grupo=grupo, materia_id=materia_id, semestre=semestre,
+                                     calificaciones=dict(calificaciones)))
+        return respuesta['registrados'], respuesta['errores']
+
+    def agregar_horario(self, id, materia_id, docente_id, grado, grupo, dia, hora_inicio, hora_fin, aula):
+        return self._alta('/horarios', id=id, materia_id=materia_id, docente_id=docente_id, grado=grado,
+                          grupo=grupo, dia=dia, hora_inicio=hora_inicio, hora_fin=hora_fin, aula=aula)
+
+    def buscar_alumnos(self, termino="", solo_activos=True) -> List[Alumno]:
+        return self._lista(Alumno, '/alumnos', q=termino, todos=None if solo_activos else '1')
+
+    def buscar_docentes(self, termino="") -> List[Docente]:
+        return self._lista(Docente, '/docentes', q=termino)
+
+    def buscar_materias(self, termino="") -> List[Materia]:
+        return self._lista(Materia, '/materias', q=termino)
+
+    def obtener_alumno(self, matricula) -> Optional[Alumno]:
+        respuesta = self._pedir('GET', f'/alumnos/{matricula}')
+        return Alumno.from_dict(respuesta['datos']) if respuesta else None
+
+    def obtener_calificaciones_alumno(self, matricula) -> List[Calificacion]:
+        respuesta = self._pedir('GET', f'/alumnos/{matricula}/calificaciones')
+        return [Calificacion.from_dict(d) for d in respuesta['datos']['calificaciones']] if respuesta else []
+
+    def obtener_promedio_alumno(self, matricula) -> float:
+        respuesta = self._pedir('GET', f'/alumnos/{matricula}/calificaciones')
+        return respuesta['datos']['promedio'] if respuesta else 0.0
+
+    def obtener_boletin(self, matricula) -> Optional[Dict]:
+        respuesta = self._pedir('GET', f'/alumnos/{matricula}/boletin')
+        return respuesta['datos'] if respuesta else None
+
+    def obtener_grupos_disponibles(self) -> List[tuple]:
+        return [tuple(g) for g in self._pedir('GET', '/grupos')['datos']]
+
+    def obtener_alumnos_por_grupo(self, grado, grupo) -> List[Alumno]:
+        return self._lista(Alumno, f'/grupos/{grado}/{grupo}/alumnos')
+
+    def obtener_horarios_por_grupo(self, grado, grupo) -> List[Horario]:
+        return self._lista(Horario, '/horarios', grado=grado, grupo=grupo)
+
+    def obtener_horarios_por_docente(self, docente_id) -> List[Horario]:
+        return self._lista(Horario, '/horarios', docente=docente_id)
+
+    def estadisticas_calificaciones(self, por='materia', semestre=None, materia_id=None) -> Dict:
+        """Como en el sistema, pero las claves (grado, grupo) llegan como 'grado-grupo'"""
+        return self._pedir('GET', '/reportes/estadisticas', por=por, semestre=semestre,
+                           materia_id=materia_id)['datos']
+
+    def top_alumnos(self, grado, grupo, n=10) -> List[tuple]:
+        filas = self._pedir('GET', '/reportes/top', grado=grado, grupo=grupo, n=n)['datos']
+        return [(Alumno.from_dict(f['alumno']), f['promedio']) for f in filas]
+
+    def en_riesgo(self, materia_id, semestre, n=10) -> List[tuple]:
+        filas = self._pedir('GET', '/reportes/riesgo', materia_id=materia_id, semestre=semestre, n=n)['datos']
+        return [(Alumno.from_dict(f['alumno']), f['promedio']) for f in filas]
+
+    def aulas_libres(self, dia, hora_inicio, hora_fin) -> List[str]:
+        return self._pedir('GET', '/disponibilidad/aulas', dia=dia, inicio=hora_inicio, fin=hora_fin)['datos']
+
+    def docentes_libres(self, dia, hora_inicio, hora_fin) -> List[Docente]:
+        return self._lista(Docente, '/disponibilidad/docentes', dia=dia, inicio=hora_inicio, fin=hora_fin)
+
+    def exportar_datos(self) -> Dict:
+        return self._pedir('GET', '/datos')['datos']
+
+
+def _en_servidor(nombre: str):
+    """Método de SistemaRemoto que hace la operación en el servidor y, si se aplicó, recarga la réplica"""
+    def metodo(self, *args, **kwargs):
+        resultado = getattr(self.cliente, nombre)(*args, **kwargs)
+        # (bool, mensaje) o (número registrado, errores)
+        if resultado[0]:
+            self.guardar_datos()
+        return resultado
+    metodo.__name__ = nombre
+    metodo.__doc__ = getattr(SistemaControlEscolar, nombre).__doc__
+    return metodo
+
+
+class SistemaRemoto(SistemaControlEscolar):
+    """Réplica local del sistema de un servidor, para que varias interfaces compartan sus datos
+
+    Las consultas se resuelven en la copia local, con sus índices y caché,
+    igual que en un SistemaControlEscolar. Las altas se envían al servidor,
+    que las valida y guarda el archivo; si se aplicaron, la réplica se
+    recarga completa (GET /datos), con lo que también recibe los cambios de
+    los demás clientes. Dentro de escritura_diferida() la recarga se hace una
+    sola vez al salir. Los cambios de otros clientes se ven al llamar
+    cargar_datos().
+    """
+
+    def __init__(self, url: str = "http://127.0.0.1:8765", cargar: bool = True,
+                 tiempo_espera: float = 30.0):
+        self.cliente = ClienteControlEscolar(url, tiempo_espera)
+        super().__init__(url, cargar=cargar)
+
+    def _leer_datos(self) -> Dict:
+        return self.cliente.exportar_datos()
+
+    def guardar_datos(self):
+        """El servidor ya guardó; aquí solo se recarga la réplica"""
+        if self._nivel_diferido:
+            self._cambios_pendientes = True
+            return
+        self.cargar_datos()
+
+    dar_alta_alumno = _en_servidor('dar_alta_alumno')
+    dar_alta_alumnos = _en_servidor('dar_alta_alumnos')
+    dar_baja_alumno = _en_servidor('dar_baja_alumno')
+    agregar_docente = _en_servidor('agregar_docente')
+    agregar_materia = _en_servidor('agregar_materia')
+    registrar_calificacion = _en_servidor('registrar_calificacion')
+    registrar_calificaciones_grupo = _en_servidor('registrar_calificaciones_grupo')
+    agregar_horario = _en_servidor('agregar_horario')
+
+    def registrar_calificaciones_validadas(self, registros) -> int:
+        """Registrar en el servidor calificaciones ya validadas (el servidor las vuelve a validar)"""
+        registradas = 0
+        for registro in registros:
+            ok, _ = self.cliente.registrar_calificacion(registro['matricula'], registro['materia_id'],
+                                                        registro['semestre'], registro['calificacion'])
+            registradas += ok
+        if registradas:
+            self.guardar_datos()
+        return registradas
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Servidor HTTP/JSON del control escolar")
+    parser.add_argument('--datos', default="datos_escuela.json", help="Archivo JSON de datos")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    sistema = SistemaControlEscolar(args.datos)
+    servidor = ServidorControlEscolar(sistema, (args.host, args.puerto))
+    print(f"Sirviendo {args.datos} en http://{args.host}:{servidor.server_address[1]} (Ctrl+C para salir)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
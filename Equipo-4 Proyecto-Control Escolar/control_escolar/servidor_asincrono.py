@@ -0,0 +1,280 @@
+"""
+Servidor asyncio con escrituras agrupadas
+Misma API que control_escolar.servidor, atendida en un solo hilo con asyncio
+
+Uso:
+    python -m control_escolar.servidor_asincrono --datos datos_escuela.json --ventana-ms 50
+
+Las consultas (GET) se resuelven en cuanto llegan, desde la memoria. Las
+altas (POST) pasan por una cola a una única corrutina escritora: toma la
+primera, espera la ventana para juntar las que lleguen mientras tanto y las
+aplica todas dentro de escritura_diferida(), así que el lote se guarda con
+una sola escritura del archivo. La exportación y la escritura corren en otro
+hilo, de modo que las consultas siguen atendiéndose; cada alta responde
+cuando su lote ya quedó guardado. Si guardar un lote falla, sus altas ya
+quedaron aplicadas en memoria: responden con su resultado más el campo
+error_guardado, y el siguiente lote (o detener) vuelve a intentar escribir.
+
+Cada respuesta lleva el encabezado X-Latencia-Ms. GET /diagnostico/latencias
+devuelve el histograma por ruta y el tamaño de los lotes.
+"""
+
+import argparse
+import asyncio
+import json
+from time import perf_counter
+from typing import Dict, Tuple
+from urllib.parse import urlsplit, parse_qs, unquote
+
+from .instrumentacion import Instrumentacion
+from .servidor import ErrorPeticion, buscar_ruta, ejecutar_ruta
+from .sistema import SistemaControlEscolar
+
+
+RAZONES = {200: 'OK', 201: 'Created', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 409: 'Conflict', 500: 'Internal Server Error',
+           503: 'Service Unavailable'}
+
+DETENIDO = (503, {'error': "Servidor detenido"})
+
+
+class ServidorAsincrono:
+    """Atiende la API sobre un único sistema con un escritor que agrupa las altas"""
+
+    def __init__(self, sistema: SistemaControlEscolar, ventana: float = 0.05, max_lote: int = 1000):
+        self.sistema = sistema
+        self.ventana = ventana
+        self.max_lote = max_lote
+        self.latencias = Instrumentacion(activo=True)
+        self.lotes = 0
+        self.escrituras_agrupadas = 0
+        self.mayor_lote = 0
+        self._cola: asyncio.Queue = None
+        self._escritor = None
+        self._sin_guardar = False
+
+    async def iniciar(self, host: str = '127.0.0.1', puerto: int = 8765) -> asyncio.AbstractServer:
+        """Arrancar la corrutina escritora y abrir el puerto"""
+        self._cola = asyncio.Queue()
+        self._escritor = asyncio.create_task(self._escribir_lotes())
+        return await asyncio.start_server(self._atender_conexion, host, puerto)
+
+    async def detener(self):
+        """Detener la corrutina escritora; las altas aún en espera responden 503
+
+        Si el último intento de guardar falló, se intenta una vez más para no
+        perder altas que ya se aplicaron.
+        """
+        if self._escritor is not None:
+            self._escritor.cancel()
+            try:
+                await self._escritor
+            except asyncio.CancelledError:
+                pass
+            self._escritor = None
+        if self._cola is not None:
+            pendientes = []
+            while not self._cola.empty():
+                pendientes.append(self._cola.get_nowait())
+            self._responder(pendientes, DETENIDO)
+        if self._sin_guardar:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._exportar_y_escribir)
+                self._sin_guardar = False
+            except Exception as e:
+                print(f"Error al guardar datos al detener: {e}")
+
+    async def atender(self, metodo: str, objetivo: str, cuerpo) -> Tuple[int, Dict]:
+        """Resolver una petición: (código HTTP, respuesta JSON)"""
+        partes = urlsplit(objetivo)
+        params = {k: v[-1] for k, v in parse_qs(partes.query).items()}
+        ruta = unquote(partes.path)
+        if metodo == 'GET' and ruta.rstrip('/') == '/diagnostico/latencias':
+            return 200, {'datos': self.diagnostico()}
+        try:
+            nombre, funcion, grupos = buscar_ruta(metodo, ruta)
+        except ErrorPeticion as e:
+            return e.estado, {'error': str(e)}
+
+        inicio = perf_counter()
+        if metodo == 'GET':
+            resultado = ejecutar_ruta(self.sistema, funcion, grupos, params, cuerpo)
+        elif self._escritor is None:
+            return DETENIDO
+        else:
+            futuro = asyncio.get_running_loop().create_future()
+            await self._cola.put((funcion, grupos, params, cuerpo, futuro))
+            resultado = await futuro
+        self.latencias.registrar(nombre, perf_counter() - inicio)
+        return resultado
+
+    async def _escribir_lotes(self):
+        """Corrutina escritora: aplica las altas en lotes con una sola escritura por lote"""
+        bucle = asyncio.get_running_loop()
+        while True:
+            lote = [await self._cola.get()]
+            try:
+                await asyncio.sleep(self.ventana)
+            except asyncio.CancelledError:
+                self._responder(lote, DETENIDO)
+                raise
+            while len(lote) < self.max_lote and not self._cola.empty():
+                lote.append(self._cola.get_nowait())
+
+            pendiente = []
+            resultados = []
+            with self.sistema.escritura_diferida(guardar=lambda: pendiente.append(True)):
+                for funcion, grupos, params, cuerpo, _ in lote:
+                    try:
+                        resultados.append(ejecutar_ruta(self.sistema, funcion, grupos, params, cuerpo))
+                    except Exception as e:
+                        resultados.append((500, {'error': f"Error interno: {e}"}))
+
+            # Desde aquí las altas ya están aplicadas: cada una responde con su
+            # resultado aunque la escritura falle o el servidor se detenga
+            cancelado = False
+            if pendiente or self._sin_guardar:
+                escritura = bucle.run_in_executor(None, self._exportar_y_escribir)
+                error = None
+                try:
+                    await asyncio.shield(escritura)
+                except asyncio.CancelledError:
+                    cancelado = True
+                except Exception as e:
+                    error = e
+                if cancelado:
+                    # La escritura sigue en el otro hilo; se espera su resultado
+                    try:
+                        await escritura
+                    except Exception as e:
+                        error = e
+                self._sin_guardar = error is not None
+                if error is None:
+                    self.escrituras_agrupadas += 1
+                else:
+                    print(f"Error al guardar lote: {error}")
+                    resultados = [(estado, dict(respuesta, error_guardado=f"No se pudo guardar: {error}"))
+                                  for estado, respuesta in resultados]
+
+            self.lotes += 1
+            self.mayor_lote = max(self.mayor_lote, len(lote))
+            for (_, _, _, _, futuro), resultado in zip(lote, resultados):
+                if not futuro.done():
+                    futuro.set_result(resultado)
+            if cancelado:
+                raise asyncio.CancelledError
+
+    def _exportar_y_escribir(self):
+        """Exportar y escribir el archivo (corre en otro hilo); los errores se propagan"""
+        self.sistema.escribir_datos(self.sistema.exportar_datos(), lanzar_errores=True)
+
+    @staticmethod
+    def _responder(lote, resultado):
+        for _, _, _, _, futuro in lote:
+            if not futuro.done():
+                futuro.set_result(resultado)
+
+    def diagnostico(self) -> Dict:
+        altas = sum(m.llamadas for nombre, m in self.latencias.metricas.items() if nombre.startswith('POST'))
+        return {
+            'rutas': self.latencias.resumen(),
+            'lotes': self.lotes,
+            'escrituras': self.escrituras_agrupadas,
+            'altas_por_lote': altas / self.lotes if self.lotes else 0.0,
+            'mayor_lote': self.mayor_lote,
+            'ventana_ms': self.ventana * 1000
+        }
+
+    async def _atender_conexion(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """HTTP/1.1 mínimo con conexiones persistentes"""
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea.strip():
+                    break
+                try:
+                    metodo, objetivo, version = linea.decode('latin-1').split()
+                except ValueError:
+                    break
+                encabezados = {}
+                while True:
+                    linea = await lector.readline()
+                    if linea in (b'\r\n', b'\n', b''):
+                        break
+                    nombre, _, valor = linea.decode('latin-1').partition(':')
+                    encabezados[nombre.strip().lower()] = valor.strip()
+                cerrar = (encabezados.get('connection', '').lower() == 'close'
+                          or version == 'HTTP/1.0')
+                try:
+                    longitud = int(encabezados.get('content-length') or 0)
+                    if longitud < 0:
+                        raise ValueError(longitud)
+                except ValueError:
+                    longitud = None
+
+                inicio = perf_counter()
+                if longitud is None:
+                    # Sin una longitud válida no se sabe dónde termina el cuerpo
+                    estado, respuesta = 400, {'error': "Content-Length inválido"}
+                    cerrar = True
+                else:
+                    contenido = await lector.readexactly(longitud)
+                    try:
+                        cuerpo = json.loads(contenido.decode('utf-8')) if contenido else None
+                    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                        estado, respuesta = 400, {'error': f"JSON inválido: {e}"}
+                    else:
+                        try:
+                            estado, respuesta = await self.atender(metodo, objetivo, cuerpo)
+                        except Exception as e:
+                            estado, respuesta = 500, {'error': f"Error interno: {e}"}
+                ms = (perf_counter() - inicio) * 1000
+
+                datos = json.dumps(respuesta, ensure_ascii=False).encode('utf-8')
+                escritor.write(
+                    (f"HTTP/1.1 {estado} {RAZONES.get(estado, '')}\r\n"
+                     f"Content-Type: application/json; charset=utf-8\r\n"
+                     f"Content-Length: {len(datos)}\r\n"
+                     f"X-Latencia-Ms: {ms:.3f}\r\n"
+                     f"Connection: {'close' if cerrar else 'keep-alive'}\r\n\r\n").encode('latin-1') + datos)
+                await escritor.drain()
+                if cerrar:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+
+async def servir(sistema: SistemaControlEscolar, host: str, puerto: int, ventana: float, max_lote: int):
+    servidor = ServidorAsincrono(sistema, ventana, max_lote)
+    red = await servidor.iniciar(host, puerto)
+    print(f"Sirviendo {sistema.archivo_datos} en http://{host}:{puerto} "
+          f"(ventana {ventana * 1000:.0f} ms; Ctrl+C para salir)")
+    try:
+        async with red:
+            await red.serve_forever()
+    finally:
+        await servidor.detener()
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Servidor asyncio del control escolar con escrituras agrupadas")
+    parser.add_argument('--datos', default="datos_escuela.json", help="Archivo JSON de datos")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8765)
+    parser.add_argument('--ventana-ms', type=float, default=50,
+                        help="Espera para juntar altas en un mismo lote")
+    parser.add_argument('--max-lote', type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    sistema = SistemaControlEscolar(args.datos)
+    try:
+        asyncio.run(servir(sistema, args.host, args.puerto, args.ventana_ms / 1000, args.max_lote))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
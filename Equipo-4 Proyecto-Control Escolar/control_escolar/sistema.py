@@ -0,0 +1,763 @@
+"""
+Lógica del Sistema de Control Escolar
+Alta, baja, búsquedas, calificaciones y horarios con persistencia en JSON
+"""
+
+import copy
+import heapq
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from types import MappingProxyType
+from typing import List, Dict, Optional, Callable, Iterable, Mapping, Tuple
+
+from .modelos import (Alumno, Docente, Materia, Calificacion, Horario,
+                      hidratar_alumnos, hidratar_docentes, hidratar_materias, hidratar_horarios)
+from .columnar import AlmacenCalificaciones
+from .horarios import DIAS_SEMANA, IndiceHorarios, hora_a_minutos, describir_conflicto, normalizar_dia
+from .ocupacion import MapaOcupacion
+from .cache import CacheConsultas, consulta_cacheada
+from .eventos import BusEventos, EventoCambio, LOTE, RECARGA
+from .instrumentacion import instrumentada
+
+
+def datos_boletin(alumno, calificaciones, materias) -> Dict:
+    """Agrupar las calificaciones de un alumno por materia, ordenadas por semestre
+
+    Devuelve un diccionario simple (serializable) con los promedios por materia
+    y el promedio general, igual que el boletín de la interfaz gráfica.
+    """
+    por_materia = {}
+    for calif in calificaciones:
+        por_materia.setdefault(calif.materia_id, []).append(calif)
+
+    materias_boletin = []
+    for materia_id, califs in por_materia.items():
+        materia = materias.get(materia_id)
+        califs = sorted(califs, key=lambda c: c.semestre)
+        materias_boletin.append({
+            'id': materia_id,
+            'nombre': materia.nombre if materia else materia_id,
+            'calificaciones': [(c.semestre, c.calificacion) for c in califs],
+            'promedio': sum(c.calificacion for c in califs) / len(califs)
+        })
+
+    promedio = (sum(c.calificacion for c in calificaciones) / len(calificaciones)
+                if calificaciones else 0.0)
+
+    return {
+        'matricula': alumno.matricula,
+        'nombre': alumno.get_nombre_completo(),
+        'grado': alumno.grado,
+        'grupo': alumno.grupo,
+        'materias': materias_boletin,
+        'promedio': promedio
+    }
+
+
+@instrumentada('sistema', excluir=('escritura_diferida',))
+class SistemaControlEscolar:
+    """Sistema principal de Control Escolar"""
+    
+    # Colecciones en el orden en que se cargan del archivo
+    COLECCIONES = ('alumnos', 'docentes', 'materias', 'calificaciones', 'horarios')
+    
+    # Campos de cada registro de dar_alta_alumnos (además de la matrícula)
+    CAMPOS_ALUMNO = ('nombre', 'apellido', 'fecha_nacimiento', 'telefono', 'grado', 'grupo')
+    
+    def __init__(self, archivo_datos: str = "datos_escuela.json", cargar: bool = True):
+        self.archivo_datos = archivo_datos
+        self.alumnos: Dict[str, Alumno] = {}
+        self.docentes: Dict[str, Docente] = {}
+        self.materias: Dict[str, Materia] = {}
+        self.horarios: Dict[str, Horario] = {}
+        
+        # Calificaciones en columnas; self.calificaciones es la misma tabla vista
+        # como diccionario de solo lectura id -> Calificacion
+        self.almacen_calificaciones = AlmacenCalificaciones()
+        self.calificaciones: Mapping[str, Calificacion] = self.almacen_calificaciones
+        
+        # Intervalos ocupados por docente, aula y grupo para detectar empalmes
+        self.indice_horarios = IndiceHorarios()
+        
+        # Franjas semanales ocupadas por aula, docente y grupo (mapas de bits)
+        self.ocupacion = MapaOcupacion()
+        
+        # Boletines ya armados por matrícula (se descartan al registrar calificaciones del alumno)
+        self._boletines: Dict[str, Dict] = {}
+        
+        # Resultados de consultas de lectura; cada alta, baja o registro invalida su tipo
+        self.cache_consultas = CacheConsultas(self.COLECCIONES)
+        
+        # Control de escrituras agrupadas (ver escritura_diferida)
+        self._nivel_diferido = 0
+        self._cambios_pendientes = False
+        
+        # id() de los diccionarios de entidades a los que apunta alguna instantánea;
+        # se copian antes de modificarlos (ver instantanea)
+        self._compartidas = set()
+        
+        # Avisos de cambio; la caché, los boletines y los índices de horarios
+        # se actualizan como primer suscriptor, antes que los externos
+        self.eventos = BusEventos()
+        self.eventos.suscribir(self._al_cambiar)
+        
+        if cargar:
+            self.cargar_datos()
+    
+    def cargar_datos(self, progreso: Optional[Callable[[str], None]] = None):
+        """Cargar datos desde archivo JSON
+        
+        Cada colección se construye aparte y se asigna completa, de modo que
+        puede leerse desde otro hilo mientras se cargan las siguientes.
+        Las entidades se construyen en bloque desde los campos guardados
+        (hidratar_*), con los campos categóricos internados para que los
+        registros compartan una sola copia de cada valor repetido.
+        Si se indica, progreso(coleccion) se llama al terminar cada una.
+        """
+        try:
+            datos = self._leer_datos()
+            if datos is None:
+                return
+            
+            # Cargar alumnos
+            self.alumnos = hidratar_alumnos(datos.get('alumnos', []))
+            self.eventos.publicar(EventoCambio.recarga('alumnos'))
+            if progreso:
+                progreso('alumnos')
+            
+            # Cargar docentes
+            self.docentes = hidratar_docentes(datos.get('docentes', []))
+            self.eventos.publicar(EventoCambio.recarga('docentes'))
+            if progreso:
+                progreso('docentes')
+            
+            # Cargar materias
+            self.materias = hidratar_materias(datos.get('materias', []))
+            self.eventos.publicar(EventoCambio.recarga('materias'))
+            if progreso:
+                progreso('materias')
+            
+            # Cargar calificaciones directo a las columnas, sin crear objetos
+            almacen = AlmacenCalificaciones()
+            almacen.siguiente_id = datos.get('secuencias', {}).get('calificaciones', 1)
+            almacen.cargar(datos.get('calificaciones', []))
+            self.calificaciones = almacen
+            self.almacen_calificaciones = almacen
+            self.eventos.publicar(EventoCambio.recarga('calificaciones'))
+            if progreso:
+                progreso('calificaciones')
+            
+            # Cargar horarios
+            horarios = hidratar_horarios(datos.get('horarios', []))
+            indice = IndiceHorarios()
+            ocupacion = MapaOcupacion()
+            for horario in horarios.values():
+                try:
+                    indice.agregar(horario)
+                    ocupacion.agregar(horario)
+                except ValueError as e:
+                    print(f"Horario {horario.id} sin indexar: {e}")
+            self.horarios = horarios
+            self.indice_horarios = indice
+            self.ocupacion = ocupacion
+            self.eventos.publicar(EventoCambio.recarga('horarios'))
+            if progreso:
+                progreso('horarios')
+        
+        except Exception as e:
+            print(f"Error al cargar datos: {e}")
+    
+    def _leer_datos(self) -> Optional[Dict]:
+        """Datos guardados con el formato de exportar_datos, o None si aún no hay archivo"""
+        if not os.path.exists(self.archivo_datos):
+            return None
+        with open(self.archivo_datos, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def guardar_datos(self):
+        """Guardar todos los datos en archivo JSON
+        
+        Dentro de escritura_diferida() solo marca los cambios como pendientes.
+        """
+        if self._nivel_diferido:
+            self._cambios_pendientes = True
+            return
+        
+        self.escribir_datos(self.exportar_datos())
+    
+    def exportar_datos(self) -> Dict:
+        """Todas las colecciones como diccionarios, con el formato del archivo JSON"""
+        return {
+            'alumnos': [alumno.to_dict() for alumno in self.alumnos.values()],
+            'docentes': [docente.to_dict() for docente in self.docentes.values()],
+            'materias': [materia.to_dict() for materia in self.materias.values()],
+            'calificaciones': list(self.almacen_calificaciones.a_dicts()),
+            'horarios': [horario.to_dict() for horario in self.horarios.values()],
+            'secuencias': {'calificaciones': self.almacen_calificaciones.siguiente_id}
+        }
+    
+    def escribir_datos(self, datos: Dict, lanzar_errores: bool = False):
+        """Escribir al archivo datos ya exportados (puede llamarse desde otro hilo)
+        
+        Con lanzar_errores el error se propaga en lugar de solo imprimirse.
+        """
+        try:
+            with open(self.archivo_datos, 'w', encoding='utf-8') as f:
+                json.dump(datos, f, ensure_ascii=False, indent=4)
+        except Exception as e:
+            if lanzar_errores:
+                raise
+            print(f"Error al guardar datos: {e}")
+    
+    @contextmanager
+    def escritura_diferida(self, guardar: Optional[Callable[[], None]] = None):
+        """Agrupar varias operaciones en una sola escritura del archivo
+        
+        Uso:
+            with sistema.escritura_diferida():
+                sistema.dar_alta_alumno(...)
+                sistema.dar_alta_alumno(...)
+        
+        Si se indica guardar, al terminar se llama guardar() en lugar de
+        escribirse el archivo aquí (por ejemplo, para exportar y escribir en
+        otro hilo).
+        """
+        self._nivel_diferido += 1
+        try:
+            yield self
+        finally:
+            self._nivel_diferido -= 1
+            if self._nivel_diferido == 0 and self._cambios_pendientes:
+                self._cambios_pendientes = False
+                if guardar is None:
+                    self.guardar_datos()
+                else:
+                    guardar()
+    
+    def instantanea(self) -> 'Instantanea':
+        """Copia de solo lectura del estado actual para reportes y exportaciones largas
+        
+        No copia nada al crearse: toma los diccionarios de entidades actuales
+        y la tabla de calificaciones limitada a sus filas actuales. La primera
+        modificación posterior de una colección copia su diccionario (solo
+        las referencias) y las entidades modificadas se reemplazan por una
+        copia, así que la instantánea nunca ve cambios hechos después.
+        """
+        for nombre in ('alumnos', 'docentes', 'materias', 'horarios'):
+            self._compartidas.add(id(getattr(self, nombre)))
+        return Instantanea(self)
+    
+    def _al_cambiar(self, evento: EventoCambio):
+        """Mantener la caché de consultas, los boletines y los índices de horarios"""
+        self.cache_consultas.invalidar(evento.entidad)
+        if evento.entidad == 'calificaciones':
+            if evento.accion == RECARGA:
+                self._boletines = {}
+            else:
+                self._boletines.pop(evento.despues.matricula_alumno, None)
+        elif evento.entidad == 'horarios' and evento.accion != RECARGA:
+            self.indice_horarios.agregar(evento.despues)
+            self.ocupacion.agregar(evento.despues)
+    
+    def _escribible(self, nombre: str) -> Dict:
+        """Diccionario de una colección listo para modificarse (copiado si lo comparte una instantánea)"""
+        coleccion = getattr(self, nombre)
+        if id(coleccion) in self._compartidas:
+            self._compartidas.discard(id(coleccion))
+            coleccion = dict(coleccion)
+            setattr(self, nombre, coleccion)
+        return coleccion
+    
+    def dar_alta_alumno(self, nombre: str, apellido: str, fecha_nacimiento: str,
+                        telefono: str, matricula: str, grado: str, grupo: str):
+        """Dar de alta un nuevo alumno"""
+        matricula = str(matricula).strip()
+        
+        if matricula in self.alumnos:
+            return False, f"Ya existe un alumno con matrícula {matricula}"
+        
+        alumno = Alumno(
+            id=matricula,
+            nombre=nombre,
+            apellido=apellido,
+            fecha_nacimiento=fecha_nacimiento,
+            telefono=telefono,
+            matricula=matricula,
+            grado=grado,
+            grupo=grupo
+        )
+        
+        self._escribible('alumnos')[matricula] = alumno
+        self.eventos.publicar(EventoCambio('alumnos', matricula, None, alumno))
+        self.guardar_datos()
+        return True, f"Alumno {alumno.get_nombre_completo()} dado de alta exitosamente"
+    
+    def dar_alta_alumnos(self, registros: Iterable[Dict]) -> Tuple[int, Dict[int, str]]:
+        """Dar de alta muchos alumnos de una vez
+        
+        registros: iterable (puede ser un generador) de diccionarios con los
+        campos de dar_alta_alumno. Se consumen uno a uno sin guardarlos, así
+        que la memoria solo crece con los alumnos agregados. La matrícula se
+        valida contra los alumnos existentes y contra el mismo lote; los
+        válidos se agregan juntos al final con un solo evento y una sola
+        escritura del archivo.
+        
+        Devuelve (número de alumnos agregados, {número de registro: error}),
+        con los registros numerados desde 1 en el orden del iterable.
+        """
+        existentes = self.alumnos
+        errores: Dict[int, str] = {}
+        vistas = set()
+        fecha_alta = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        def validos():
+            for numero, data in enumerate(registros, start=1):
+                matricula = str(data.get('matricula') or '').strip()
+                if not matricula:
+                    errores[numero] = "Falta la matrícula"
+                elif matricula in existentes:
+                    errores[numero] = f"Ya existe un alumno con matrícula {matricula}"
+                elif matricula in vistas:
+                    errores[numero] = f"Matrícula {matricula} repetida en el lote"
+                else:
+                    faltantes = [c for c in self.CAMPOS_ALUMNO if c not in data]
+                    if faltantes:
+                        errores[numero] = f"Faltan campos de {matricula}: {', '.join(faltantes)}"
+                        continue
+                    vistas.add(matricula)
+                    yield {
+                        'id': matricula, 'matricula': matricula, 'activo': True,
+                        'fecha_alta': fecha_alta, 'fecha_baja': None,
+                        'nombre': data['nombre'], 'apellido': data['apellido'],
+                        'fecha_nacimiento': data['fecha_nacimiento'], 'telefono': data['telefono'],
+                        'grado': data['grado'], 'grupo': data['grupo']
+                    }
+        
+        nuevos = hidratar_alumnos(validos())
+        if nuevos:
+            self._escribible('alumnos').update(nuevos)
+            self.eventos.publicar(EventoCambio('alumnos', despues=list(nuevos.values()), accion=LOTE))
+            self.guardar_datos()
+        return len(nuevos), errores
+    
+    def dar_baja_alumno(self, matricula: str):
+        """Dar de baja a un alumno"""
+        matricula = str(matricula).strip()
+        
+        if matricula not in self.alumnos:
+            return False, f"No se encontró alumno con matrícula {matricula}"
+        
+        alumno = self.alumnos[matricula]
+        
+        if not alumno.activo:
+            return False, f"El alumno {alumno.get_nombre_completo()} ya está dado de baja"
+        
+        # Se modifica una copia: las instantáneas conservan el alumno original
+        antes = alumno
+        alumno = copy.copy(antes)
+        alumno.dar_de_baja()
+        self._escribible('alumnos')[matricula] = alumno
+        self.eventos.publicar(EventoCambio('alumnos', matricula, antes, alumno))
+        self.guardar_datos()
+        return True, f"Alumno {alumno.get_nombre_completo()} dado de baja exitosamente"
+    
+    def agregar_docente(self, nombre: str, apellido: str, fecha_nacimiento: str,
+                       telefono: str, num_empleado: str, especialidad: str, email: str):
+        """Agregar un nuevo docente"""
+        if num_empleado in self.docentes:
+            return False, f"Ya existe un docente con número de empleado {num_empleado}"
+        
+        docente = Docente(
+            id=num_empleado,
+            nombre=nombre,
+            apellido=apellido,
+            fecha_nacimiento=fecha_nacimiento,
+            telefono=telefono,
+            num_empleado=num_empleado,
+            especialidad=especialidad,
+            email=email
+        )
+        
+        self._escribible('docentes')[num_empleado] = docente
+        self.eventos.publicar(EventoCambio('docentes', num_empleado, None, docente))
+        self.guardar_datos()
+        return True, f"Docente {docente.get_nombre_completo()} agregado exitosamente"
+    
+    def agregar_materia(self, id: str, nombre: str, grado: str, descripcion: str = ""):
+        """Agregar una nueva materia"""
+        if id in self.materias:
+            return False, f"Ya existe una materia con ID {id}"
+        
+        materia = Materia(id, nombre, grado, descripcion)
+        self._escribible('materias')[id] = materia
+        self.eventos.publicar(EventoCambio('materias', id, None, materia))
+        self.guardar_datos()
+        return True, f"Materia {nombre} agregada exitosamente"
+    
+    def registrar_calificacion(self, matricula_alumno: str, materia_id: str, 
+                              semestre: str, calificacion: float):
+        """Registrar una calificación para un alumno"""
+        if matricula_alumno not in self.alumnos:
+            return False, f"No existe alumno con matrícula {matricula_alumno}"
+        
+        if not self.alumnos[matricula_alumno].activo:
+            return False, f"El alumno está dado de baja"
+        
+        if materia_id not in self.materias:
+            return False, f"No existe materia con ID {materia_id}"
+        
+        try:
+            calificacion = float(calificacion)
+        except (TypeError, ValueError):
+            return False, f"Calificación inválida: {calificacion}"
+        if not 0 <= calificacion <= 100:
+            return False, "La calificación debe estar entre 0 y 100"
+        
+        # Verificar si ya existe una calificación para este alumno, materia y semestre
+        if self.almacen_calificaciones.existe(matricula_alumno, materia_id, semestre):
+            return False, f"Ya existe una calificación para este alumno en {semestre}"
+        
+        self._insertar_calificacion(matricula_alumno, materia_id, semestre, calificacion)
+        self.guardar_datos()
+        return True, f"Calificación registrada exitosamente"
+    
+    def registrar_calificaciones_grupo(self, grado: str, grupo: str, materia_id: str, semestre: str,
+                                       calificaciones: Dict[str, float]) -> Tuple[int, Dict[str, str]]:
+        """Registrar en una sola operación las calificaciones de un grupo en una materia
+        
+        calificaciones: matrícula -> calificación (0-100). Cada alumno se valida
+        por separado; los válidos se registran y el archivo se escribe una vez.
+        Devuelve (número de calificaciones registradas, {matrícula: error}).
+        """
+        if materia_id not in self.materias:
+            mensaje = f"No existe materia con ID {materia_id}"
+            return 0, {matricula: mensaje for matricula in calificaciones}
+        
+        del_grupo = {a.matricula for a in self.obtener_alumnos_por_grupo(grado, grupo)}
+        existe = self.almacen_calificaciones.existe
+        validas = []
+        errores: Dict[str, str] = {}
+        for matricula, calificacion in calificaciones.items():
+            alumno = self.alumnos.get(matricula)
+            if alumno is None:
+                errores[matricula] = f"No existe alumno con matrícula {matricula}"
+            elif not alumno.activo:
+                errores[matricula] = "El alumno está dado de baja"
+            elif matricula not in del_grupo:
+                errores[matricula] = f"El alumno no pertenece al grado {grado} grupo {grupo}"
+            else:
+                try:
+                    calificacion = float(calificacion)
+                except (TypeError, ValueError):
+                    errores[matricula] = f"Calificación inválida: {calificacion}"
+                    continue
+                if not 0 <= calificacion <= 100:
+                    errores[matricula] = "La calificación debe estar entre 0 y 100"
+                elif existe(matricula, materia_id, semestre):
+                    errores[matricula] = f"Ya existe una calificación para este alumno en {semestre}"
+                else:
+                    validas.append((matricula, calificacion))
+        
+        for matricula, calificacion in validas:
+            self._insertar_calificacion(matricula, materia_id, semestre, calificacion)
+        if validas:
+            self.guardar_datos()
+        return len(validas), errores
+    
+    def registrar_calificaciones_validadas(self, registros: Iterable[Dict]) -> int:
+        """Registrar de una vez calificaciones que ya se validaron
+        
+        registros: iterable (puede ser un generador) de diccionarios con
+        matricula, materia_id, semestre y calificacion. No se revisa que el
+        alumno y la materia existan ni que la calificación sea nueva: quien
+        llama ya lo hizo (por ejemplo, importar_csv). El archivo se escribe
+        una sola vez al final. Devuelve el número de calificaciones registradas.
+        """
+        registradas = 0
+        for registro in registros:
+            self._insertar_calificacion(registro['matricula'], registro['materia_id'],
+                                        registro['semestre'], float(registro['calificacion']))
+            registradas += 1
+        if registradas:
+            self.guardar_datos()
+        return registradas
+    
+    def _insertar_calificacion(self, matricula_alumno: str, materia_id: str,
+                               semestre: str, calificacion: float) -> Calificacion:
+        """Crear y almacenar una calificación ya validada (sin guardar el archivo)
+        
+        El ID es el siguiente del contador del almacén, así que no se repite
+        aunque se registren muchas calificaciones en el mismo segundo.
+        """
+        fila = self.almacen_calificaciones.agregar(None, matricula_alumno, materia_id, semestre,
+                                                   calificacion, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        calif = self.almacen_calificaciones.vista(fila)
+        self.eventos.publicar(EventoCambio('calificaciones', calif.id, None, calif))
+        return calif
+    
+    def agregar_horario(self, id: str, materia_id: str, docente_id: str, grado: str,
+                       grupo: str, dia: str, hora_inicio: str, hora_fin: str, aula: str):
+        """Agregar un nuevo horario"""
+        if id in self.horarios:
+            return False, f"Ya existe un horario con ID {id}"
+        
+        if docente_id not in self.docentes:
+            return False, f"No existe docente con número de empleado {docente_id}"
+        
+        if materia_id not in self.materias:
+            return False, f"No existe materia con ID {materia_id}"
+        
+        try:
+            if hora_a_minutos(hora_fin) <= hora_a_minutos(hora_inicio):
+                return False, "La hora de fin debe ser posterior a la hora de inicio"
+        except ValueError as e:
+            return False, f"{e}. Use el formato HH:MM"
+        
+        dia = normalizar_dia(dia)
+        if dia not in DIAS_SEMANA:
+            return False, f"Día no válido: {dia}. Use uno de: {', '.join(DIAS_SEMANA)}"
+        
+        horario = Horario(id, materia_id, docente_id, grado, grupo, dia, hora_inicio, hora_fin, aula)
+        
+        # Verificar empalmes con el docente, el aula y el grupo ese mismo día
+        conflictos = self.indice_horarios.conflictos(horario)
+        if conflictos:
+            detalles = [describir_conflicto(tipo, recurso, self.horarios.get(otro_id))
+                        for tipo, recurso, otro_id in conflictos]
+            return False, "Conflicto de horario: " + "; ".join(detalles)
+        
+        self._escribible('horarios')[id] = horario
+        self.eventos.publicar(EventoCambio('horarios', id, None, horario))
+        self.guardar_datos()
+        return True, "Horario agregado exitosamente"
+    
+    def auditar_conflictos_horarios(self) -> List[Dict]:
+        """Listar todos los empalmes entre horarios ya registrados"""
+        conflictos = []
+        for tipo, recurso, dia, id1, id2 in self.indice_horarios.auditar():
+            conflictos.append({
+                'tipo': tipo,
+                'recurso': recurso,
+                'dia': dia,
+                'horario_1': self.horarios.get(id1),
+                'horario_2': self.horarios.get(id2)
+            })
+        return conflictos
+    
+    def aulas_libres(self, dia: str, hora_inicio: str, hora_fin: str,
+                     aulas: Optional[List[str]] = None) -> List[str]:
+        """Aulas sin clase en el intervalo (por defecto, las que aparecen en algún horario)"""
+        if aulas is None:
+            aulas = self.ocupacion.aulas()
+        else:
+            aulas = [a.strip().upper() for a in aulas]
+        return self.ocupacion.libres('aula', aulas, dia, hora_inicio, hora_fin)
+    
+    def docentes_libres(self, dia: str, hora_inicio: str, hora_fin: str) -> List[Docente]:
+        """Docentes sin clase en el intervalo"""
+        libres = self.ocupacion.libres('docente', self.docentes, dia, hora_inicio, hora_fin)
+        return [self.docentes[num_empleado] for num_empleado in libres]
+    
+    def franjas_libres_comunes(self, docentes: List[str] = (), aulas: List[str] = (),
+                               grupos: List[tuple] = (), dias: Optional[List[str]] = None,
+                               desde: str = "07:00", hasta: str = "20:00") -> List[tuple]:
+        """Intervalos en que todos los docentes, aulas y grupos indicados están libres"""
+        recursos = ([('docente', d) for d in docentes]
+                    + [('aula', a.strip().upper()) for a in aulas]
+                    + [('grupo', tuple(g)) for g in grupos])
+        return self.ocupacion.franjas_libres_comunes(recursos, dias, desde, hasta)
+    
+    @consulta_cacheada('calificaciones')
+    def obtener_calificaciones_alumno(self, matricula: str) -> List[Calificacion]:
+        """Obtener todas las calificaciones de un alumno"""
+        return self.almacen_calificaciones.de_alumno(matricula)
+    
+    def obtener_boletin(self, matricula: str) -> Optional[Dict]:
+        """Boletín de un alumno (ver datos_boletin); no debe modificarse"""
+        return self.obtener_boletines([matricula]).get(matricula)
+    
+    def obtener_boletines(self, matriculas: List[str], guardar: bool = True) -> Dict[str, Dict]:
+        """Boletines de varios alumnos, armando solo los que no estén guardados
+        
+        Con guardar=False los que faltan se arman sin conservarse (exportaciones
+        de muchos alumnos que solo se leen una vez).
+        """
+        boletines = {}
+        for matricula in matriculas:
+            boletin = self._boletines.get(matricula)
+            if boletin is None and matricula in self.alumnos:
+                boletin = datos_boletin(self.alumnos[matricula],
+                                        self.almacen_calificaciones.de_alumno(matricula), self.materias)
+                if guardar:
+                    self._boletines[matricula] = boletin
+            if boletin is not None:
+                boletines[matricula] = boletin
+        return boletines
+    
+    def estadisticas_cache(self) -> Dict:
+        """Aciertos, fallos y generaciones de la caché de consultas"""
+        return self.cache_consultas.estadisticas()
+    
+    @consulta_cacheada('calificaciones')
+    def obtener_promedio_alumno(self, matricula: str) -> float:
+        """Calcular el promedio de calificaciones de un alumno"""
+        calificaciones = self.obtener_calificaciones_alumno(matricula)
+        if not calificaciones:
+            return 0.0
+        return sum(c.calificacion for c in calificaciones) / len(calificaciones)
+    
+    @consulta_cacheada('calificaciones', 'alumnos')
+    def estadisticas_calificaciones(self, por: str = 'materia', semestre: Optional[str] = None,
+                                    materia_id: Optional[str] = None) -> Mapping:
+        """Promedio, cantidad y tasa de aprobación agrupados por materia, semestre, alumno o grupo
+        
+        Las claves del resultado son el ID de materia, el semestre, la matrícula
+        o la tupla (grado, grupo), según la agrupación. El resultado es de solo
+        lectura (ver consulta_cacheada).
+        """
+        grupos_alumnos = None
+        if por == 'grupo':
+            grupos_alumnos = {m: (a.grado, a.grupo) for m, a in self.alumnos.items()}
+        return self.almacen_calificaciones.estadisticas_por(por, semestre=semestre,
+                                                            materia_id=materia_id,
+                                                            grupos_alumnos=grupos_alumnos)
+    
+    @consulta_cacheada('calificaciones', 'alumnos')
+    def top_alumnos(self, grado: str, grupo: str, n: int = 10) -> List[tuple]:
+        """Los n alumnos activos de un grupo con mejor promedio, como (alumno, promedio)
+        
+        Usa un montículo acotado sobre los promedios agregados, sin ordenar todo el grupo.
+        """
+        promedios = self.estadisticas_calificaciones('alumno')
+        candidatos = ((alumno, promedios[matricula]['promedio'])
+                      for matricula, alumno in self.alumnos.items()
+                      if alumno.activo and alumno.grado == grado and alumno.grupo == grupo
+                      and matricula in promedios)
+        return heapq.nlargest(n, candidatos, key=lambda par: par[1])
+    
+    @consulta_cacheada('calificaciones', 'alumnos')
+    def en_riesgo(self, materia_id: str, semestre: str, n: int = 10) -> List[tuple]:
+        """Los n alumnos activos con peor promedio en una materia y semestre, como (alumno, promedio)"""
+        promedios = self.estadisticas_calificaciones('alumno', semestre=semestre, materia_id=materia_id)
+        candidatos = ((self.alumnos[matricula], datos['promedio'])
+                      for matricula, datos in promedios.items()
+                      if matricula in self.alumnos and self.alumnos[matricula].activo)
+        return heapq.nsmallest(n, candidatos, key=lambda par: par[1])
+    
+    @consulta_cacheada('alumnos')
+    def buscar_alumnos(self, termino: str = "", solo_activos: bool = True) -> List[Alumno]:
+        """Buscar alumnos por matrícula, nombre o apellido"""
+        termino = termino.lower().strip()
+        resultados = []
+        
+        for alumno in self.alumnos.values():
+            if solo_activos and not alumno.activo:
+                continue
+            
+            if not termino or alumno.coincide(termino):
+                resultados.append(alumno)
+        
+        return resultados
+    
+    @consulta_cacheada('docentes')
+    def buscar_docentes(self, termino: str = "") -> List[Docente]:
+        """Buscar docentes por número de empleado, nombre, apellido o especialidad"""
+        termino = termino.lower().strip()
+        resultados = []
+        
+        for docente in self.docentes.values():
+            if not termino:
+                resultados.append(docente)
+            elif (termino in docente.num_empleado.lower() or
+                  termino in docente.nombre.lower() or
+                  termino in docente.apellido.lower() or
+                  termino in docente.get_nombre_completo().lower() or
+                  termino in docente.especialidad.lower() or
+                  termino in docente.email.lower()):
+                resultados.append(docente)
+        
+        return resultados
+    
+    @consulta_cacheada('materias')
+    def buscar_materias(self, termino: str = "") -> List[Materia]:
+        """Buscar materias por ID, nombre, grado o descripción"""
+        termino = termino.lower().strip()
+        resultados = []
+        
+        for materia in self.materias.values():
+            if not termino:
+                resultados.append(materia)
+            elif (termino in materia.id.lower() or
+                  termino in materia.nombre.lower() or
+                  termino in materia.grado.lower() or
+                  termino in materia.descripcion.lower()):
+                resultados.append(materia)
+        
+        return resultados
+    
+    @consulta_cacheada('alumnos')
+    def obtener_grupos_disponibles(self) -> List[tuple]:
+        """Obtener lista de grupos disponibles con grado y grupo"""
+        grupos = set()
+        for alumno in self.alumnos.values():
+            if alumno.activo:
+                grupos.add((alumno.grado, alumno.grupo))
+        return sorted(list(grupos), key=lambda x: (x[0], x[1]))
+    
+    @consulta_cacheada('alumnos')
+    def obtener_alumnos_por_grupo(self, grado: str, grupo: str) -> List[Alumno]:
+        """Obtener todos los alumnos activos de un grupo específico"""
+        return [a for a in self.alumnos.values() 
+                if a.activo and a.grado == grado and a.grupo == grupo]
+    
+    @consulta_cacheada('horarios')
+    def obtener_horarios_por_grupo(self, grado: str, grupo: str) -> List[Horario]:
+        """Obtener todos los horarios de un grupo específico"""
+        return [h for h in self.horarios.values() if h.grado == grado and h.grupo == grupo]
+    
+    @consulta_cacheada('horarios')
+    def obtener_horarios_por_docente(self, docente_id: str) -> List[Horario]:
+        """Obtener todos los horarios de un docente específico"""
+        return [h for h in self.horarios.values() if h.docente_id == docente_id]
+
+
+class Instantanea:
+    """Estado del sistema en un momento dado, de solo lectura (ver SistemaControlEscolar.instantanea)
+    
+    Ofrece las mismas colecciones y consultas de lectura que el sistema, así
+    que reporte_rendimiento, los boletines y exportar_datos funcionan igual
+    sobre ella mientras el sistema sigue recibiendo cambios.
+    """
+    
+    COLECCIONES = SistemaControlEscolar.COLECCIONES
+    
+    def __init__(self, sistema: SistemaControlEscolar):
+        self.momento = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.archivo_datos = sistema.archivo_datos
+        self.alumnos: Mapping[str, Alumno] = MappingProxyType(sistema.alumnos)
+        self.docentes: Mapping[str, Docente] = MappingProxyType(sistema.docentes)
+        self.materias: Mapping[str, Materia] = MappingProxyType(sistema.materias)
+        self.horarios: Mapping[str, Horario] = MappingProxyType(sistema.horarios)
+        self.almacen_calificaciones = sistema.almacen_calificaciones.instantanea()
+        self.calificaciones: Mapping[int, Calificacion] = self.almacen_calificaciones
+        self._boletines: Dict[str, Dict] = {}
+        # Los datos no cambian, así que las entradas nunca se invalidan
+        self.cache_consultas = CacheConsultas(self.COLECCIONES)
+    
+    exportar_datos = SistemaControlEscolar.exportar_datos
+    obtener_calificaciones_alumno = SistemaControlEscolar.obtener_calificaciones_alumno
+    obtener_boletin = SistemaControlEscolar.obtener_boletin
+    obtener_boletines = SistemaControlEscolar.obtener_boletines
+    obtener_promedio_alumno = SistemaControlEscolar.obtener_promedio_alumno
+    estadisticas_calificaciones = SistemaControlEscolar.estadisticas_calificaciones
+    top_alumnos = SistemaControlEscolar.top_alumnos
+    en_riesgo = SistemaControlEscolar.en_riesgo
+    buscar_alumnos = SistemaControlEscolar.buscar_alumnos
+    buscar_docentes = SistemaControlEscolar.buscar_docentes
+    buscar_materias = SistemaControlEscolar.buscar_materias
+    obtener_grupos_disponibles = SistemaControlEscolar.obtener_grupos_disponibles
+    obtener_alumnos_por_grupo = SistemaControlEscolar.obtener_alumnos_por_grupo
+    obtener_horarios_por_grupo = SistemaControlEscolar.obtener_horarios_por_grupo
+    obtener_horarios_por_docente = SistemaControlEscolar.obtener_horarios_por_docente
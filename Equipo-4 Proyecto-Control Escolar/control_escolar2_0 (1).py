@@ -4,506 +4,43 @@ Programación Orientada a Objetos en Python
 Funcionalidades: Gestión de alumnos, docentes, materias, calificaciones y horarios con persistencia de datos
 """
 
-import json
-import os
+import argparse
+import bisect
+import queue
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, Optional
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext, filedialog
 from tkinter import font as tkfont
 
-
-class Persona:
-    """Clase base para Alumno y Docente"""
-    
-    def __init__(self, id: str, nombre: str, apellido: str, fecha_nacimiento: str, telefono: str):
-        self.id = id
-        self.nombre = nombre
-        self.apellido = apellido
-        self.fecha_nacimiento = fecha_nacimiento
-        self.telefono = telefono
-    
-    def get_nombre_completo(self) -> str:
-        return f"{self.nombre} {self.apellido}"
-    
-    def to_dict(self) -> Dict:
-        return {
-            'id': self.id,
-            'nombre': self.nombre,
-            'apellido': self.apellido,
-            'fecha_nacimiento': self.fecha_nacimiento,
-            'telefono': self.telefono
-        }
-
-
-class Alumno(Persona):
-    """Clase Alumno que hereda de Persona"""
-    
-    def __init__(self, id: str, nombre: str, apellido: str, fecha_nacimiento: str, 
-                 telefono: str, matricula: str, grado: str, grupo: str, activo: bool = True):
-        super().__init__(id, nombre, apellido, fecha_nacimiento, telefono)
-        self.matricula = matricula
-        self.grado = grado
-        self.grupo = grupo
-        self.activo = activo
-        self.fecha_alta = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.fecha_baja = None
-    
-    def dar_de_baja(self):
-        """Dar de baja al alumno"""
-        self.activo = False
-        self.fecha_baja = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    def to_dict(self) -> Dict:
-        data = super().to_dict()
-        data.update({
-            'matricula': self.matricula,
-            'grado': self.grado,
-            'grupo': self.grupo,
-            'activo': self.activo,
-            'fecha_alta': self.fecha_alta,
-            'fecha_baja': self.fecha_baja
-        })
-        return data
-    
-    @staticmethod
-    def from_dict(data: Dict) -> 'Alumno':
-        alumno = Alumno(
-            data['id'],
-            data['nombre'],
-            data['apellido'],
-            data['fecha_nacimiento'],
-            data['telefono'],
-            data['matricula'],
-            data['grado'],
-            data['grupo'],
-            data['activo']
-        )
-        alumno.fecha_alta = data.get('fecha_alta', alumno.fecha_alta)
-        alumno.fecha_baja = data.get('fecha_baja')
-        return alumno
-
-
-class Docente(Persona):
-    """Clase Docente que hereda de Persona"""
-    
-    def __init__(self, id: str, nombre: str, apellido: str, fecha_nacimiento: str,
-                 telefono: str, num_empleado: str, especialidad: str, email: str):
-        super().__init__(id, nombre, apellido, fecha_nacimiento, telefono)
-        self.num_empleado = num_empleado
-        self.especialidad = especialidad
-        self.email = email
-    
-    def to_dict(self) -> Dict:
-        data = super().to_dict()
-        data.update({
-            'num_empleado': self.num_empleado,
-            'especialidad': self.especialidad,
-            'email': self.email
-        })
-        return data
-    
-    @staticmethod
-    def from_dict(data: Dict) -> 'Docente':
-        return Docente(
-            data['id'],
-            data['nombre'],
-            data['apellido'],
-            data['fecha_nacimiento'],
-            data['telefono'],
-            data['num_empleado'],
-            data['especialidad'],
-            data['email']
-        )
-
-
-class Materia:
-    """Clase para gestionar materias"""
-    
-    def __init__(self, id: str, nombre: str, grado: str, descripcion: str = ""):
-        self.id = id
-        self.nombre = nombre
-        self.grado = grado
-        self.descripcion = descripcion
-    
-    def to_dict(self) -> Dict:
-        return {
-            'id': self.id,
-            'nombre': self.nombre,
-            'grado': self.grado,
-            'descripcion': self.descripcion
-        }
-    
-    @staticmethod
-    def from_dict(data: Dict) -> 'Materia':
-        return Materia(
-            data['id'],
-            data['nombre'],
-            data['grado'],
-            data.get('descripcion', '')
-        )
-
-
-class Calificacion:
-    """Clase para gestionar calificaciones de alumnos"""
-    
-    def __init__(self, id: str, matricula_alumno: str, materia_id: str, 
-                 semestre: str, calificacion: float, fecha_registro: str = None):
-        self.id = id
-        self.matricula_alumno = matricula_alumno
-        self.materia_id = materia_id
-        self.semestre = semestre
-        self.calificacion = calificacion
-        self.fecha_registro = fecha_registro or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    def to_dict(self) -> Dict:
-        return {
-            'id': self.id,
-            'matricula_alumno': self.matricula_alumno,
-            'materia_id': self.materia_id,
-            'semestre': self.semestre,
-            'calificacion': self.calificacion,
-            'fecha_registro': self.fecha_registro
-        }
-    
-    @staticmethod
-    def from_dict(data: Dict) -> 'Calificacion':
-        return Calificacion(
-            data['id'],
-            data['matricula_alumno'],
-            data['materia_id'],
-            data['semestre'],
-            data['calificacion'],
-            data.get('fecha_registro')
-        )
-
-
-class Horario:
-    """Clase para gestionar horarios de clases"""
-    
-    def __init__(self, id: str, materia_id: str, docente_id: str, grado: str, 
-                 grupo: str, dia: str, hora_inicio: str, hora_fin: str, aula: str):
-        self.id = id
-        self.materia_id = materia_id
-        self.docente_id = docente_id
-        self.grado = grado
-        self.grupo = grupo
-        self.dia = dia
-        self.hora_inicio = hora_inicio
-        self.hora_fin = hora_fin
-        self.aula = aula
-    
-    def to_dict(self) -> Dict:
-        return {
-            'id': self.id,
-            'materia_id': self.materia_id,
-            'docente_id': self.docente_id,
-            'grado': self.grado,
-            'grupo': self.grupo,
-            'dia': self.dia,
-            'hora_inicio': self.hora_inicio,
-            'hora_fin': self.hora_fin,
-            'aula': self.aula
-        }
-    
-    @staticmethod
-    def from_dict(data: Dict) -> 'Horario':
-        return Horario(
-            data['id'],
-            data['materia_id'],
-            data['docente_id'],
-            data['grado'],
-            data['grupo'],
-            data['dia'],
-            data['hora_inicio'],
-            data['hora_fin'],
-            data['aula']
-        )
-
-
-class SistemaControlEscolar:
-    """Sistema principal de Control Escolar"""
-    
-    def __init__(self, archivo_datos: str = "datos_escuela.json"):
-        self.archivo_datos = archivo_datos
-        self.alumnos: Dict[str, Alumno] = {}
-        self.docentes: Dict[str, Docente] = {}
-        self.materias: Dict[str, Materia] = {}
-        self.calificaciones: Dict[str, Calificacion] = {}
-        self.horarios: Dict[str, Horario] = {}
-        self.cargar_datos()
-    
-    def cargar_datos(self):
-        """Cargar datos desde archivo JSON"""
-        if os.path.exists(self.archivo_datos):
-            try:
-                with open(self.archivo_datos, 'r', encoding='utf-8') as f:
-                    datos = json.load(f)
-                    
-                    # Cargar alumnos
-                    for alumno_data in datos.get('alumnos', []):
-                        alumno = Alumno.from_dict(alumno_data)
-                        matricula_str = str(alumno.matricula).strip()
-                        self.alumnos[matricula_str] = alumno
-                    
-                    # Cargar docentes
-                    for docente_data in datos.get('docentes', []):
-                        docente = Docente.from_dict(docente_data)
-                        num_emp_str = str(docente.num_empleado).strip()
-                        self.docentes[num_emp_str] = docente
-                    
-                    # Cargar materias
-                    for materia_data in datos.get('materias', []):
-                        materia = Materia.from_dict(materia_data)
-                        self.materias[materia.id] = materia
-                    
-                    # Cargar calificaciones
-                    for calif_data in datos.get('calificaciones', []):
-                        calificacion = Calificacion.from_dict(calif_data)
-                        self.calificaciones[calificacion.id] = calificacion
-                    
-                    # Cargar horarios
-                    for horario_data in datos.get('horarios', []):
-                        horario = Horario.from_dict(horario_data)
-                        self.horarios[horario.id] = horario
-                
-            except Exception as e:
-                print(f"Error al cargar datos: {e}")
-    
-    def guardar_datos(self):
-        """Guardar todos los datos en archivo JSON"""
-        datos = {
-            'alumnos': [alumno.to_dict() for alumno in self.alumnos.values()],
-            'docentes': [docente.to_dict() for docente in self.docentes.values()],
-            'materias': [materia.to_dict() for materia in self.materias.values()],
-            'calificaciones': [calif.to_dict() for calif in self.calificaciones.values()],
-            'horarios': [horario.to_dict() for horario in self.horarios.values()]
-        }
-        
-        try:
-            with open(self.archivo_datos, 'w', encoding='utf-8') as f:
-                json.dump(datos, f, ensure_ascii=False, indent=4)
-        except Exception as e:
-            print(f"Error al guardar datos: {e}")
-    
-    def dar_alta_alumno(self, nombre: str, apellido: str, fecha_nacimiento: str,
-                        telefono: str, matricula: str, grado: str, grupo: str):
-        """Dar de alta un nuevo alumno"""
-        matricula = str(matricula).strip()
-        
-        if matricula in self.alumnos:
-            return False, f"Ya existe un alumno con matrícula {matricula}"
-        
-        alumno = Alumno(
-            id=matricula,
-            nombre=nombre,
-            apellido=apellido,
-            fecha_nacimiento=fecha_nacimiento,
-            telefono=telefono,
-            matricula=matricula,
-            grado=grado,
-            grupo=grupo
-        )
-        
-        self.alumnos[matricula] = alumno
-        self.guardar_datos()
-        return True, f"Alumno {alumno.get_nombre_completo()} dado de alta exitosamente"
-    
-    def dar_baja_alumno(self, matricula: str):
-        """Dar de baja a un alumno"""
-        matricula = str(matricula).strip()
-        
-        if matricula not in self.alumnos:
-            return False, f"No se encontró alumno con matrícula {matricula}"
-        
-        alumno = self.alumnos[matricula]
-        
-        if not alumno.activo:
-            return False, f"El alumno {alumno.get_nombre_completo()} ya está dado de baja"
-        
-        alumno.dar_de_baja()
-        self.guardar_datos()
-        return True, f"Alumno {alumno.get_nombre_completo()} dado de baja exitosamente"
-    
-    def agregar_docente(self, nombre: str, apellido: str, fecha_nacimiento: str,
-                       telefono: str, num_empleado: str, especialidad: str, email: str):
-        """Agregar un nuevo docente"""
-        if num_empleado in self.docentes:
-            return False, f"Ya existe un docente con número de empleado {num_empleado}"
-        
-        docente = Docente(
-            id=num_empleado,
-            nombre=nombre,
-            apellido=apellido,
-            fecha_nacimiento=fecha_nacimiento,
-            telefono=telefono,
-            num_empleado=num_empleado,
-            especialidad=especialidad,
-            email=email
-        )
-        
-        self.docentes[num_empleado] = docente
-        self.guardar_datos()
-        return True, f"Docente {docente.get_nombre_completo()} agregado exitosamente"
-    
-    def agregar_materia(self, id: str, nombre: str, grado: str, descripcion: str = ""):
-        """Agregar una nueva materia"""
-        if id in self.materias:
-            return False, f"Ya existe una materia con ID {id}"
-        
-        materia = Materia(id, nombre, grado, descripcion)
-        self.materias[id] = materia
-        self.guardar_datos()
-        return True, f"Materia {nombre} agregada exitosamente"
-    
-    def registrar_calificacion(self, matricula_alumno: str, materia_id: str, 
-                              semestre: str, calificacion: float):
-        """Registrar una calificación para un alumno"""
-        if matricula_alumno not in self.alumnos:
-            return False, f"No existe alumno con matrícula {matricula_alumno}"
-        
-        if not self.alumnos[matricula_alumno].activo:
-            return False, f"El alumno está dado de baja"
-        
-        if materia_id not in self.materias:
-            return False, f"No existe materia con ID {materia_id}"
-        
-        # Verificar si ya existe una calificación para este alumno, materia y semestre
-        for calif in self.calificaciones.values():
-            if (calif.matricula_alumno == matricula_alumno and 
-                calif.materia_id == materia_id and 
-                calif.semestre == semestre):
-                return False, f"Ya existe una calificación para este alumno en {semestre}"
-        
-        # Generar ID único para la calificación
-        calif_id = f"{matricula_alumno}_{materia_id}_{semestre}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        calificacion_obj = Calificacion(
-            calif_id,
-            matricula_alumno,
-            materia_id,
-            semestre,
-            calificacion
-        )
-        
-        self.calificaciones[calif_id] = calificacion_obj
-        self.guardar_datos()
-        return True, f"Calificación registrada exitosamente"
-    
-    def agregar_horario(self, id: str, materia_id: str, docente_id: str, grado: str,
-                       grupo: str, dia: str, hora_inicio: str, hora_fin: str, aula: str):
-        """Agregar un nuevo horario"""
-        if id in self.horarios:
-            return False, f"Ya existe un horario con ID {id}"
-        
-        if docente_id not in self.docentes:
-            return False, f"No existe docente con número de empleado {docente_id}"
-        
-        if materia_id not in self.materias:
-            return False, f"No existe materia con ID {materia_id}"
-        
-        horario = Horario(id, materia_id, docente_id, grado, grupo, dia, hora_inicio, hora_fin, aula)
-        self.horarios[id] = horario
-        self.guardar_datos()
-        return True, "Horario agregado exitosamente"
-    
-    def obtener_calificaciones_alumno(self, matricula: str) -> List[Calificacion]:
-        """Obtener todas las calificaciones de un alumno"""
-        return [c for c in self.calificaciones.values() if c.matricula_alumno == matricula]
-    
-    def obtener_promedio_alumno(self, matricula: str) -> float:
-        """Calcular el promedio de calificaciones de un alumno"""
-        calificaciones = self.obtener_calificaciones_alumno(matricula)
-        if not calificaciones:
-            return 0.0
-        return sum(c.calificacion for c in calificaciones) / len(calificaciones)
-    
-    def buscar_alumnos(self, termino: str = "", solo_activos: bool = True) -> List[Alumno]:
-        """Buscar alumnos por matrícula, nombre o apellido"""
-        termino = termino.lower().strip()
-        resultados = []
-        
-        for alumno in self.alumnos.values():
-            if solo_activos and not alumno.activo:
-                continue
-            
-            if not termino:
-                resultados.append(alumno)
-            elif (termino in alumno.matricula.lower() or
-                  termino in alumno.nombre.lower() or
-                  termino in alumno.apellido.lower() or
-                  termino in alumno.get_nombre_completo().lower()):
-                resultados.append(alumno)
-        
-        return resultados
-    
-    def buscar_docentes(self, termino: str = "") -> List[Docente]:
-        """Buscar docentes por número de empleado, nombre, apellido o especialidad"""
-        termino = termino.lower().strip()
-        resultados = []
-        
-        for docente in self.docentes.values():
-            if not termino:
-                resultados.append(docente)
-            elif (termino in docente.num_empleado.lower() or
-                  termino in docente.nombre.lower() or
-                  termino in docente.apellido.lower() or
-                  termino in docente.get_nombre_completo().lower() or
-                  termino in docente.especialidad.lower() or
-                  termino in docente.email.lower()):
-                resultados.append(docente)
-        
-        return resultados
-    
-    def buscar_materias(self, termino: str = "") -> List[Materia]:
-        """Buscar materias por ID, nombre, grado o descripción"""
-        termino = termino.lower().strip()
-        resultados = []
-        
-        for materia in self.materias.values():
-            if not termino:
-                resultados.append(materia)
-            elif (termino in materia.id.lower() or
-                  termino in materia.nombre.lower() or
-                  termino in materia.grado.lower() or
-                  termino in materia.descripcion.lower()):
-                resultados.append(materia)
-        
-        return resultados
-    
-    def obtener_grupos_disponibles(self) -> List[tuple]:
-        """Obtener lista de grupos disponibles con grado y grupo"""
-        grupos = set()
-        for alumno in self.alumnos.values():
-            if alumno.activo:
-                grupos.add((alumno.grado, alumno.grupo))
-        return sorted(list(grupos), key=lambda x: (x[0], x[1]))
-    
-    def obtener_alumnos_por_grupo(self, grado: str, grupo: str) -> List[Alumno]:
-        """Obtener todos los alumnos activos de un grupo específico"""
-        return [a for a in self.alumnos.values() 
-                if a.activo and a.grado == grado and a.grupo == grupo]
-    
-    def obtener_horarios_por_grupo(self, grado: str, grupo: str) -> List[Horario]:
-        """Obtener todos los horarios de un grupo específico"""
-        return [h for h in self.horarios.values() if h.grado == grado and h.grupo == grupo]
-    
-    def obtener_horarios_por_docente(self, docente_id: str) -> List[Horario]:
-        """Obtener todos los horarios de un docente específico"""
-        return [h for h in self.horarios.values() if h.docente_id == docente_id]
+from control_escolar import SistemaControlEscolar
+from control_escolar.eventos import AGREGADO, MODIFICADO, RECARGA
+from control_escolar.reportes import reporte_rendimiento
+from control_escolar.servidor import SistemaRemoto
+from control_escolar.instrumentacion import REGISTRO, instrumentada
 
 
+@instrumentada('pantalla', incluir=('mostrar_',), excluir=('mostrar_pantalla',))
 class SistemaEscolarGUI:
     """Interfaz gráfica del Sistema de Control Escolar"""
     
-    def __init__(self, root):
+    def __init__(self, root, servidor: Optional[str] = None):
         self.root = root
-        self.root.title("Sistema de Control Escolar")
+        self.root.title("Sistema de Control Escolar" + (f" - {servidor}" if servidor else ""))
         self.root.geometry("1400x800")
         self.root.resizable(True, True)
         
-        # Sistema de datos
-        self.sistema = SistemaControlEscolar()
+        # Sistema de datos (se carga en segundo plano tras mostrar la ventana). Con
+        # servidor, es una réplica de sus datos y las altas se hacen en él
+        if servidor:
+            self.sistema = SistemaRemoto(servidor, cargar=False)
+        else:
+            self.sistema = SistemaControlEscolar(cargar=False)
+        self.colecciones_cargadas = set()
+        self.cola_carga = queue.Queue()
+        self.botones_menu = []
         
         # Colores del tema
         self.colors = {
@@ -525,7 +62,18 @@ class SistemaEscolarGUI:
         
         # Días de la semana en orden
         self.dias_semana = ["LUNES", "MARTES", "MIÉRCOLES", "JUEVES", "VIERNES", "SÁBADO", "DOMINGO"]
-        
+
+        # Caché de pantallas del panel derecho (LRU)
+        self.pantallas: OrderedDict = OrderedDict()
+        self.refrescos: Dict = {}
+        self.pantallas_invalidas = set()
+        self.pantalla_actual = None
+        self.max_pantallas = 8
+        
+        # Pantallas que se actualizan por evento en lugar de reconstruirse
+        self.oyentes: Dict = {}
+        self.sistema.eventos.suscribir(self.al_cambiar_datos)
+
         # Configurar estilo
         self.configurar_estilos()
         
@@ -534,6 +82,9 @@ class SistemaEscolarGUI:
         
         # Crear interfaz
         self.crear_interfaz()
+        
+        # Cargar datos sin bloquear la ventana
+        self.iniciar_carga_datos()
     
     def configurar_estilos(self):
         """Configurar estilos personalizados"""
@@ -611,6 +162,23 @@ class SistemaEscolarGUI:
                                style='Title.TLabel')
         title_label.pack(side='left', padx=20)
         
+        # Indicador de carga de datos
+        self.carga_frame = tk.Frame(header, bg=self.colors['primary'])
+        self.carga_frame.pack(side='right', padx=20)
+        
+        self.carga_label = tk.Label(self.carga_frame,
+                                    text="Leyendo archivo de datos...",
+                                    bg=self.colors['primary'],
+                                    fg='white',
+                                    font=('Segoe UI', 9))
+        self.carga_label.pack(anchor='e')
+        
+        self.carga_progreso = ttk.Progressbar(self.carga_frame,
+                                              mode='determinate',
+                                              length=220,
+                                              maximum=len(SistemaControlEscolar.COLECCIONES))
+        self.carga_progreso.pack(pady=(4, 0))
+        
         # Frame de contenido
         content_frame = tk.Frame(main_container, bg=self.colors['background'])
         content_frame.pack(fill='both', expand=True, padx=20, pady=20)
@@ -674,15 +242,19 @@ class SistemaEscolarGUI:
                 font=('Segoe UI', 10, 'bold'),
                 anchor='w').pack(fill='x', padx=20, pady=(15, 5))
         
+        # Las pantallas que modifican datos esperan a la carga completa,
+        # ya que guardar_datos reescribe todas las colecciones
+        todas = SistemaControlEscolar.COLECCIONES
+        
         botones_alumnos = [
-            ("➕ Alta Alumno", self.mostrar_alta_alumno),
-            ("➖ Baja Alumno", self.mostrar_baja_alumno),
-            ("👥 Lista Alumnos", self.mostrar_lista_alumnos),
-            ("👥 Ver Grupos", self.mostrar_grupos),
+            ("➕ Alta Alumno", self.mostrar_alta_alumno, todas),
+            ("➖ Baja Alumno", self.mostrar_baja_alumno, todas),
+            ("👥 Lista Alumnos", self.mostrar_lista_alumnos, ('alumnos',)),
+            ("👥 Ver Grupos", self.mostrar_grupos, ('alumnos',)),
         ]
         
-        for texto, comando in botones_alumnos:
-            self.crear_boton_menu(parent, texto, comando)
+        for texto, comando, requiere in botones_alumnos:
+            self.crear_boton_menu(parent, texto, comando, requiere)
         
         # SECCIÓN DOCENTES
         tk.Label(parent, text="👨‍🏫 DOCENTES", 
@@ -692,12 +264,12 @@ class SistemaEscolarGUI:
                 anchor='w').pack(fill='x', padx=20, pady=(15, 5))
         
         botones_docentes = [
-            ("➕ Agregar Docente", self.mostrar_agregar_docente),
-            ("📋 Lista Docentes", self.mostrar_lista_docentes),
+            ("➕ Agregar Docente", self.mostrar_agregar_docente, todas),
+            ("📋 Lista Docentes", self.mostrar_lista_docentes, ('docentes',)),
         ]
         
-        for texto, comando in botones_docentes:
-            self.crear_boton_menu(parent, texto, comando)
+        for texto, comando, requiere in botones_docentes:
+            self.crear_boton_menu(parent, texto, comando, requiere)
         
         # SECCIÓN MATERIAS
         tk.Label(parent, text="📚 MATERIAS", 
@@ -707,12 +279,12 @@ class SistemaEscolarGUI:
                 anchor='w').pack(fill='x', padx=20, pady=(15, 5))
         
         botones_materias = [
-            ("📖 Agregar Materia", self.mostrar_agregar_materia),
-            ("📋 Lista Materias", self.mostrar_lista_materias),
+            ("📖 Agregar Materia", self.mostrar_agregar_materia, todas),
+            ("📋 Lista Materias", self.mostrar_lista_materias, ('materias',)),
         ]
         
-        for texto, comando in botones_materias:
-            self.crear_boton_menu(parent, texto, comando)
+        for texto, comando, requiere in botones_materias:
+            self.crear_boton_menu(parent, texto, comando, requiere)
         
         # SECCIÓN CALIFICACIONES - SIMPLIFICADA
         tk.Label(parent, text="📝 CALIFICACIONES", 
@@ -722,13 +294,16 @@ class SistemaEscolarGUI:
                 anchor='w').pack(fill='x', padx=20, pady=(15, 5))
         
         botones_calificaciones = [
-            ("✏️ Registrar Calificación", self.mostrar_registrar_calificacion),
-            ("🔍 Buscar Calificaciones", self.mostrar_ver_calificaciones_con_buscador),
-            ("📄 Boletín de Calificaciones", self.mostrar_boletin_alumno),
+            ("✏️ Registrar Calificación", self.mostrar_registrar_calificacion, todas),
+            ("📋 Calificaciones por Grupo", self.mostrar_calificaciones_grupo, todas),
+            ("🔍 Buscar Calificaciones", self.mostrar_ver_calificaciones_con_buscador,
+             ('alumnos', 'materias', 'calificaciones')),
+            ("📄 Boletín de Calificaciones", self.mostrar_boletin_alumno,
+             ('alumnos', 'materias', 'calificaciones')),
         ]
         
-        for texto, comando in botones_calificaciones:
-            self.crear_boton_menu(parent, texto, comando)
+        for texto, comando, requiere in botones_calificaciones:
+            self.crear_boton_menu(parent, texto, comando, requiere)
         
         # SECCIÓN HORARIOS - SIMPLIFICADA
         tk.Label(parent, text="🕐 HORARIOS", 
@@ -738,12 +313,14 @@ class SistemaEscolarGUI:
                 anchor='w').pack(fill='x', padx=20, pady=(15, 5))
         
         botones_horarios = [
-            ("➕ Agregar Horario", self.mostrar_agregar_horario),
-            ("🔍 Buscar Horarios", self.mostrar_buscar_horarios),
+            ("➕ Agregar Horario", self.mostrar_agregar_horario, todas),
+            ("🔍 Buscar Horarios", self.mostrar_buscar_horarios, todas),
+            ("⚠️ Conflictos de Horario", self.mostrar_conflictos_horarios, ('horarios',)),
+            ("🔎 Aulas y Docentes Libres", self.mostrar_disponibilidad, ('docentes', 'horarios')),
         ]
         
-        for texto, comando in botones_horarios:
-            self.crear_boton_menu(parent, texto, comando)
+        for texto, comando, requiere in botones_horarios:
+            self.crear_boton_menu(parent, texto, comando, requiere)
         
         # SECCIÓN REPORTES
         tk.Label(parent, text="📊 REPORTES", 
@@ -753,14 +330,30 @@ class SistemaEscolarGUI:
                 anchor='w').pack(fill='x', padx=20, pady=(15, 5))
         
         botones_reportes = [
-            ("📈 Estadísticas Generales", self.mostrar_inicio),
+            ("📈 Estadísticas Generales", self.mostrar_inicio, ()),
+            ("📊 Rendimiento por Grupo", self.mostrar_reporte_rendimiento,
+             ('alumnos', 'materias', 'calificaciones')),
+            ("🏆 Rankings de Alumnos", self.mostrar_rankings,
+             ('alumnos', 'materias', 'calificaciones')),
+            ("⏱️ Diagnóstico de Rendimiento", self.mostrar_diagnostico, ()),
         ]
+        if isinstance(self.sistema, SistemaRemoto):
+            botones_reportes.append(("🔄 Sincronizar con el Servidor", self.sincronizar,
+                                     SistemaControlEscolar.COLECCIONES))
         
-        for texto, comando in botones_reportes:
-            self.crear_boton_menu(parent, texto, comando)
+        for texto, comando, requiere in botones_reportes:
+            self.crear_boton_menu(parent, texto, comando, requiere)
+    
+    def sincronizar(self):
+        """Recargar la réplica con los cambios hechos por otros clientes del servidor"""
+        self.sistema.cargar_datos()
+        self.refrescar_pantalla_actual()
     
-    def crear_boton_menu(self, parent, texto, comando):
-        """Crear botón de menú con estilo"""
+    def crear_boton_menu(self, parent, texto, comando, requiere=()):
+        """Crear botón de menú con estilo
+        
+        requiere: colecciones que deben estar cargadas para habilitar el botón
+        """
         btn = tk.Button(parent,
                       text=texto,
                       command=comando,
@@ -780,12 +373,144 @@ class SistemaEscolarGUI:
         # Efecto hover
         btn.bind('<Enter>', lambda e, b=btn: b.configure(bg=self.colors['secondary'], fg='white'))
         btn.bind('<Leave>', lambda e, b=btn: b.configure(bg=self.colors['surface'], fg=self.colors['text']))
+        
+        if requiere:
+            btn.configure(state='disabled')
+            self.botones_menu.append((btn, set(requiere)))
     
-    def limpiar_panel(self):
-        """Limpiar el panel derecho"""
-        for widget in self.right_panel.winfo_children():
-            widget.destroy()
+    def iniciar_carga_datos(self):
+        """Cargar los datos en un hilo aparte y vigilar su avance desde el hilo de la GUI"""
+        def cargar():
+            try:
+                self.sistema.cargar_datos(progreso=self.cola_carga.put)
+            finally:
+                self.cola_carga.put(None)
+        
+        threading.Thread(target=cargar, daemon=True).start()
+        self.root.after(100, self.revisar_carga_datos)
     
+    def revisar_carga_datos(self):
+        """Procesar los avisos del hilo de carga (tkinter solo se usa desde este hilo)"""
+        terminado = False
+        nuevas = False
+        
+        try:
+            while True:
+                coleccion = self.cola_carga.get_nowait()
+                if coleccion is None:
+                    terminado = True
+                    break
+                self.colecciones_cargadas.add(coleccion)
+                nuevas = True
+        except queue.Empty:
+            pass
+        
+        if terminado:
+            # Sin archivo o con error de lectura: las colecciones quedan vacías pero utilizables
+            self.colecciones_cargadas.update(SistemaControlEscolar.COLECCIONES)
+            nuevas = True
+        
+        if nuevas:
+            for btn, requiere in self.botones_menu:
+                if requiere <= self.colecciones_cargadas:
+                    btn.configure(state='normal')
+            
+            self.carga_progreso['value'] = len(self.colecciones_cargadas)
+            self.carga_label.config(text=f"Cargando datos... "
+                                         f"{len(self.colecciones_cargadas)}/{len(SistemaControlEscolar.COLECCIONES)}")
+            self.invalidar_pantallas()
+            self.refrescar_pantalla_actual()
+        
+        if terminado:
+            self.carga_frame.pack_forget()
+        else:
+            self.root.after(100, self.revisar_carga_datos)
+    
+    def ocultar_pantalla_actual(self):
+        """Ocultar la pantalla visible del panel derecho sin destruirla"""
+        if self.pantalla_actual in self.pantallas:
+            self.pantallas[self.pantalla_actual].pack_forget()
+        self.pantalla_actual = None
+
+    def mostrar_pantalla(self, nombre: str) -> bool:
+        """Mostrar una pantalla ya construida; devuelve False si no está en caché"""
+        frame = self.pantallas.get(nombre)
+        if frame is None:
+            return False
+
+        self.ocultar_pantalla_actual()
+        self.pantallas.move_to_end(nombre)
+        frame.pack(fill='both', expand=True)
+        self.pantalla_actual = nombre
+
+        if nombre in self.pantallas_invalidas:
+            self.pantallas_invalidas.discard(nombre)
+            self.refrescos[nombre]()
+        return True
+
+    def crear_pantalla(self, nombre: str):
+        """Crear el frame de una pantalla nueva, registrarlo en la caché y mostrarlo"""
+        self.ocultar_pantalla_actual()
+
+        frame = ttk.Frame(self.right_panel, style='Card.TFrame')
+        frame.pack(fill='both', expand=True)
+        self.pantallas[nombre] = frame
+        self.pantalla_actual = nombre
+
+        # Desalojar las pantallas usadas hace más tiempo (LRU)
+        while len(self.pantallas) > self.max_pantallas:
+            antigua, frame_antiguo = self.pantallas.popitem(last=False)
+            self.refrescos.pop(antigua, None)
+            self.oyentes.pop(antigua, None)
+            self.pantallas_invalidas.discard(antigua)
+            frame_antiguo.destroy()
+
+        return frame
+
+    def registrar_refresco(self, nombre: str, funcion):
+        """Registrar la función que actualiza una pantalla cuando cambian los datos"""
+        self.refrescos[nombre] = funcion
+
+    def registrar_oyente(self, nombre: str, funcion):
+        """Registrar funcion(evento) que aplica un cambio a una pantalla sin reconstruirla
+        
+        Devuelve True si la pantalla quedó al día; si devuelve False, la
+        pantalla se marca como desactualizada como las demás.
+        """
+        self.oyentes[nombre] = funcion
+    
+    def al_cambiar_datos(self, evento):
+        """Aplicar un cambio del sistema a las pantallas construidas
+        
+        Las recargas de la carga inicial las atiende revisar_carga_datos (llegan
+        desde el hilo de carga); las del hilo de la GUI (la réplica de un
+        servidor se recarga tras cada alta) invalidan todas las pantallas.
+        """
+        if evento.accion == RECARGA:
+            if threading.current_thread() is threading.main_thread():
+                self.invalidar_pantallas()
+            return
+        for nombre in self.refrescos:
+            if nombre not in self.pantallas or nombre in self.pantallas_invalidas:
+                continue
+            oyente = self.oyentes.get(nombre)
+            if oyente is not None and oyente(evento):
+                continue
+            self.pantallas_invalidas.add(nombre)
+    
+    def refrescar_pantalla_actual(self):
+        """Refrescar de inmediato la pantalla visible si está desactualizada"""
+        nombre = self.pantalla_actual
+        if nombre in self.pantallas_invalidas:
+            self.pantallas_invalidas.discard(nombre)
+            self.refrescos[nombre]()
+    
+    def invalidar_pantallas(self):
+        """Marcar como desactualizadas las pantallas que dependen de los datos"""
+        for nombre in self.refrescos:
+            if nombre in self.pantallas:
+                self.pantallas_invalidas.add(nombre)
+
     def configurar_treeview_con_lineas(self, tree):
         """Configurar Treeview con líneas divisorias"""
         style = ttk.Style()
@@ -802,58 +527,33 @@ class SistemaEscolarGUI:
     
     def mostrar_inicio(self):
         """Mostrar pantalla de inicio con estadísticas"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('inicio'):
+            return
+        panel = self.crear_pantalla('inicio')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="📊 Dashboard",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        stats_container = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        stats_container = tk.Frame(panel, bg=self.colors['surface'])
         stats_container.pack(fill='both', expand=True, padx=30, pady=10)
         
-        alumnos_activos = sum(1 for a in self.sistema.alumnos.values() if a.activo)
-        total_docentes = len(self.sistema.docentes)
-        total_materias = len(self.sistema.materias)
-        total_horarios = len(self.sistema.horarios)
-        total_calificaciones = len(self.sistema.calificaciones)
-        total_grupos = len(self.sistema.obtener_grupos_disponibles())
-        
-        stats1 = [
-            ("👥 Alumnos Activos", alumnos_activos, self.colors['secondary']),
-            ("👨‍🏫 Docentes", total_docentes, self.colors['success']),
-            ("📚 Materias", total_materias, self.colors['info']),
+        stats = [
+            ("👥 Alumnos Activos", 'alumnos', self.colors['secondary']),
+            ("👨‍🏫 Docentes", 'docentes', self.colors['success']),
+            ("📚 Materias", 'materias', self.colors['info']),
+            ("📅 Horarios", 'horarios', self.colors['warning']),
+            ("📝 Calificaciones", 'calificaciones', self.colors['accent']),
+            ("👥 Grupos", 'grupos', self.colors['primary']),
         ]
         
-        for i, (titulo, valor, color) in enumerate(stats1):
-            card = tk.Frame(stats_container, bg=color, relief='flat', bd=0)
-            card.grid(row=0, column=i, padx=15, pady=20, sticky='nsew')
-            stats_container.columnconfigure(i, weight=1)
-            
-            tk.Label(card,
-                    text=titulo,
-                    bg=color,
-                    fg='white',
-                    font=('Segoe UI', 12, 'bold'),
-                    pady=15).pack()
-            
-            tk.Label(card,
-                    text=str(valor),
-                    bg=color,
-                    fg='white',
-                    font=('Segoe UI', 36, 'bold'),
-                    pady=10).pack()
-        
-        stats2 = [
-            ("📅 Horarios", total_horarios, self.colors['warning']),
-            ("📝 Calificaciones", total_calificaciones, self.colors['accent']),
-            ("👥 Grupos", total_grupos, self.colors['primary']),
-        ]
+        valores_labels = {}
         
-        for i, (titulo, valor, color) in enumerate(stats2):
+        for i, (titulo, clave, color) in enumerate(stats):
             card = tk.Frame(stats_container, bg=color, relief='flat', bd=0)
-            card.grid(row=1, column=i, padx=15, pady=20, sticky='nsew')
-            stats_container.columnconfigure(i, weight=1)
+            card.grid(row=i // 3, column=i % 3, padx=15, pady=20, sticky='nsew')
+            stats_container.columnconfigure(i % 3, weight=1)
             
             tk.Label(card,
                     text=titulo,
@@ -862,14 +562,30 @@ class SistemaEscolarGUI:
                     font=('Segoe UI', 12, 'bold'),
                     pady=15).pack()
             
-            tk.Label(card,
-                    text=str(valor),
-                    bg=color,
-                    fg='white',
-                    font=('Segoe UI', 36, 'bold'),
-                    pady=10).pack()
-        
-        info_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+            valores_labels[clave] = tk.Label(card,
+                                             text="",
+                                             bg=color,
+                                             fg='white',
+                                             font=('Segoe UI', 36, 'bold'),
+                                             pady=10)
+            valores_labels[clave].pack()
+        
+        def actualizar_estadisticas():
+            valores = {
+                'alumnos': sum(1 for a in self.sistema.alumnos.values() if a.activo),
+                'docentes': len(self.sistema.docentes),
+                'materias': len(self.sistema.materias),
+                'horarios': len(self.sistema.horarios),
+                'calificaciones': len(self.sistema.calificaciones),
+                'grupos': len(self.sistema.obtener_grupos_disponibles()),
+            }
+            for clave, valor in valores.items():
+                valores_labels[clave].config(text=str(valor))
+        
+        self.registrar_refresco('inicio', actualizar_estadisticas)
+        actualizar_estadisticas()
+        
+        info_frame = tk.Frame(panel, bg=self.colors['surface'])
         info_frame.pack(fill='both', expand=True, padx=30, pady=20)
         
         welcome_text = """
@@ -894,14 +610,16 @@ class SistemaEscolarGUI:
     
     def mostrar_alta_alumno(self):
         """Mostrar formulario para dar de alta un alumno"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('alta_alumno'):
+            return
+        panel = self.crear_pantalla('alta_alumno')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="➕ Dar de Alta Alumno",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        form_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        form_frame = tk.Frame(panel, bg=self.colors['surface'])
         form_frame.pack(fill='both', expand=True, padx=40, pady=20)
         
         campos = [
@@ -953,6 +671,8 @@ class SistemaEscolarGUI:
             
             if exito:
                 messagebox.showinfo("Éxito", mensaje)
+                for entry in entries.values():
+                    entry.delete(0, tk.END)
                 self.mostrar_inicio()
             else:
                 messagebox.showerror("Error", mensaje)
@@ -973,14 +693,16 @@ class SistemaEscolarGUI:
     
     def mostrar_baja_alumno(self):
         """Mostrar formulario para dar de baja un alumno con buscador mejorado"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('baja_alumno'):
+            return
+        panel = self.crear_pantalla('baja_alumno')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="➖ Dar de Baja Alumno",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        main_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        main_frame = tk.Frame(panel, bg=self.colors['surface'])
         main_frame.pack(fill='both', expand=True, padx=40, pady=20)
         
         search_frame = tk.Frame(main_frame, bg=self.colors['surface'])
@@ -1176,18 +898,21 @@ class SistemaEscolarGUI:
                  cursor='hand2').pack(side='left', padx=5)
         
         actualizar_tabla()
+        self.registrar_refresco('baja_alumno', actualizar_tabla)
         search_entry.focus()
     
     def mostrar_lista_alumnos(self):
         """Mostrar lista de alumnos en un Treeview"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('lista_alumnos'):
+            return
+        panel = self.crear_pantalla('lista_alumnos')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="👥 Lista de Alumnos",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        search_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        search_frame = tk.Frame(panel, bg=self.colors['surface'])
         search_frame.pack(fill='x', padx=20, pady=(0, 10))
         
         tk.Label(search_frame,
@@ -1211,7 +936,7 @@ class SistemaEscolarGUI:
                 fg=self.colors['text_light'],
                 font=('Segoe UI', 9, 'italic')).pack(side='left', padx=5)
         
-        activos_frame = tk.LabelFrame(self.right_panel,
+        activos_frame = tk.LabelFrame(panel,
                                       text="✓ ALUMNOS ACTIVOS",
                                       bg=self.colors['surface'],
                                       fg=self.colors['success'],
@@ -1256,6 +981,14 @@ class SistemaEscolarGUI:
         
         self.configurar_treeview_con_lineas(tree_activos)
         
+        def fila_activo(alumno):
+            return (alumno.matricula, alumno.get_nombre_completo(), alumno.grado,
+                    alumno.grupo, alumno.telefono, alumno.fecha_alta)
+        
+        def fila_inactivo(alumno):
+            return (alumno.matricula, alumno.get_nombre_completo(), alumno.grado,
+                    alumno.grupo, alumno.fecha_baja if alumno.fecha_baja else "N/A")
+        
         def actualizar_activos(*args):
             for item in tree_activos.get_children():
                 tree_activos.delete(item)
@@ -1265,14 +998,8 @@ class SistemaEscolarGUI:
             alumnos_filtrados.sort(key=lambda a: a.matricula)
             
             for i, alumno in enumerate(alumnos_filtrados):
-                tree_activos.insert('', 'end', values=(
-                    alumno.matricula,
-                    alumno.get_nombre_completo(),
-                    alumno.grado,
-                    alumno.grupo,
-                    alumno.telefono,
-                    alumno.fecha_alta
-                ), tags=('evenrow' if i % 2 == 0 else 'oddrow',))
+                tree_activos.insert('', 'end', iid=alumno.matricula, values=fila_activo(alumno),
+                                    tags=('evenrow' if i % 2 == 0 else 'oddrow',))
             
             tree_activos.tag_configure('evenrow', background='#E8F5E9')
             tree_activos.tag_configure('oddrow', background='white')
@@ -1290,7 +1017,7 @@ class SistemaEscolarGUI:
                                       font=('Segoe UI', 10, 'bold'))
         count_activos_label.pack(pady=5)
         
-        inactivos_frame = tk.LabelFrame(self.right_panel,
+        inactivos_frame = tk.LabelFrame(panel,
                                         text="✗ ALUMNOS INACTIVOS (DADOS DE BAJA)",
                                         bg=self.colors['surface'],
                                         fg=self.colors['danger'],
@@ -1333,45 +1060,86 @@ class SistemaEscolarGUI:
         
         self.configurar_treeview_con_lineas(tree_inactivos)
         
-        count_inactivos = 0
-        for alumno in sorted(self.sistema.alumnos.values(), key=lambda a: a.matricula):
-            if not alumno.activo:
-                tree_inactivos.insert('', 'end', values=(
-                    alumno.matricula,
-                    alumno.get_nombre_completo(),
-                    alumno.grado,
-                    alumno.grupo,
-                    alumno.fecha_baja if alumno.fecha_baja else "N/A"
-                ))
-                count_inactivos += 1
-        
-        for i, item in enumerate(tree_inactivos.get_children()):
-            if i % 2 == 0:
-                tree_inactivos.item(item, tags=('evenrow',))
+        def actualizar_inactivos():
+            for item in tree_inactivos.get_children():
+                tree_inactivos.delete(item)
+            
+            count_inactivos = 0
+            for alumno in sorted(self.sistema.alumnos.values(), key=lambda a: a.matricula):
+                if not alumno.activo:
+                    tree_inactivos.insert('', 'end', iid=alumno.matricula, values=fila_inactivo(alumno),
+                                          tags=('evenrow' if count_inactivos % 2 == 0 else 'oddrow',))
+                    count_inactivos += 1
+            
+            count_inactivos_label.config(text=f"Total: {count_inactivos} alumno(s) inactivo(s)")
         
         tree_inactivos.tag_configure('evenrow', background='#FFEBEE')
         tree_inactivos.tag_configure('oddrow', background='white')
         tree_inactivos.pack(fill='both', expand=True, padx=5, pady=5)
         
-        tk.Label(inactivos_frame,
-                text=f"Total: {count_inactivos} alumno(s) inactivo(s)",
-                bg=self.colors['surface'],
-                fg=self.colors['danger'],
-                font=('Segoe UI', 10, 'bold')).pack(pady=5)
+        count_inactivos_label = tk.Label(inactivos_frame,
+                                        text="",
+                                        bg=self.colors['surface'],
+                                        fg=self.colors['danger'],
+                                        font=('Segoe UI', 10, 'bold'))
+        count_inactivos_label.pack(pady=5)
+        
+        def refrescar_listas():
+            actualizar_activos()
+            actualizar_inactivos()
+        
+        def insertar_ordenado(tree, alumno, valores):
+            """Insertar una fila en su lugar por matrícula y corregir el rayado desde ahí"""
+            filas = tree.get_children()
+            posicion = bisect.bisect_left(filas, alumno.matricula)
+            tree.insert('', posicion, iid=alumno.matricula, values=valores)
+            retocar_rayado(tree, posicion)
         
-        actualizar_activos()
+        def retocar_rayado(tree, desde):
+            for i, iid in enumerate(tree.get_children()[desde:], start=desde):
+                tree.item(iid, tags=('evenrow' if i % 2 == 0 else 'oddrow',))
+        
+        def al_cambiar_alumno(evento):
+            """Insertar o mover una sola fila cuando se da de alta o de baja un alumno
+            
+            Las altas en lote reconstruyen la lista al mostrarse.
+            """
+            if evento.entidad != 'alumnos':
+                return True
+            alumno = evento.despues
+            if evento.accion == AGREGADO:
+                termino = search_var.get().lower().strip()
+                if alumno.activo and (not termino or alumno.coincide(termino)):
+                    insertar_ordenado(tree_activos, alumno, fila_activo(alumno))
+            elif evento.accion == MODIFICADO and evento.antes.activo and not alumno.activo:
+                if tree_activos.exists(alumno.matricula):
+                    posicion = tree_activos.index(alumno.matricula)
+                    tree_activos.delete(alumno.matricula)
+                    retocar_rayado(tree_activos, posicion)
+                insertar_ordenado(tree_inactivos, alumno, fila_inactivo(alumno))
+            else:
+                return False
+            count_activos_label.config(text=f"Total: {len(tree_activos.get_children())} alumno(s) activo(s)")
+            count_inactivos_label.config(text=f"Total: {len(tree_inactivos.get_children())} alumno(s) inactivo(s)")
+            return True
+        
+        self.registrar_refresco('lista_alumnos', refrescar_listas)
+        self.registrar_oyente('lista_alumnos', al_cambiar_alumno)
+        refrescar_listas()
         search_entry.focus()
     
     def mostrar_agregar_docente(self):
         """Mostrar formulario para agregar docente"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('agregar_docente'):
+            return
+        panel = self.crear_pantalla('agregar_docente')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="👨‍🏫 Agregar Docente",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        form_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        form_frame = tk.Frame(panel, bg=self.colors['surface'])
         form_frame.pack(fill='both', expand=True, padx=40, pady=20)
         
         campos = [
@@ -1423,6 +1191,8 @@ class SistemaEscolarGUI:
             
             if exito:
                 messagebox.showinfo("Éxito", mensaje)
+                for entry in entries.values():
+                    entry.delete(0, tk.END)
                 self.mostrar_inicio()
             else:
                 messagebox.showerror("Error", mensaje)
@@ -1443,14 +1213,16 @@ class SistemaEscolarGUI:
     
     def mostrar_lista_docentes(self):
         """Mostrar lista de docentes con buscador"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('lista_docentes'):
+            return
+        panel = self.crear_pantalla('lista_docentes')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="📋 Lista de Docentes",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        search_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        search_frame = tk.Frame(panel, bg=self.colors['surface'])
         search_frame.pack(fill='x', padx=20, pady=(0, 10))
         
         tk.Label(search_frame,
@@ -1474,7 +1246,7 @@ class SistemaEscolarGUI:
                 fg=self.colors['text_light'],
                 font=('Segoe UI', 9, 'italic')).pack(side='left', padx=5)
         
-        table_container = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        table_container = tk.Frame(panel, bg=self.colors['surface'])
         table_container.pack(fill='both', expand=True, padx=20, pady=10)
         
         canvas = tk.Canvas(table_container, bg=self.colors['surface'], highlightthickness=0)
@@ -1537,7 +1309,7 @@ class SistemaEscolarGUI:
         
         tree.pack(fill='both', expand=True, padx=5, pady=5)
         
-        count_label = tk.Label(self.right_panel,
+        count_label = tk.Label(panel,
                               text="",
                               bg=self.colors['surface'],
                               fg=self.colors['text_light'],
@@ -1545,18 +1317,21 @@ class SistemaEscolarGUI:
         count_label.pack(pady=10)
         
         actualizar_tabla()
+        self.registrar_refresco('lista_docentes', actualizar_tabla)
         search_entry.focus()
     
     def mostrar_agregar_materia(self):
         """Mostrar formulario para agregar materia"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('agregar_materia'):
+            return
+        panel = self.crear_pantalla('agregar_materia')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="📖 Agregar Materia",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        form_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        form_frame = tk.Frame(panel, bg=self.colors['surface'])
         form_frame.pack(fill='both', expand=True, padx=40, pady=20)
         
         campos = [
@@ -1617,6 +1392,11 @@ class SistemaEscolarGUI:
             
             if exito:
                 messagebox.showinfo("Éxito", mensaje)
+                for key, entry in entries.items():
+                    if key == "descripcion":
+                        entry.delete("1.0", tk.END)
+                    else:
+                        entry.delete(0, tk.END)
                 self.mostrar_inicio()
             else:
                 messagebox.showerror("Error", mensaje)
@@ -1637,14 +1417,16 @@ class SistemaEscolarGUI:
     
     def mostrar_lista_materias(self):
         """Mostrar lista de materias con buscador"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('lista_materias'):
+            return
+        panel = self.crear_pantalla('lista_materias')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="📋 Lista de Materias",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        search_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        search_frame = tk.Frame(panel, bg=self.colors['surface'])
         search_frame.pack(fill='x', padx=20, pady=(0, 10))
         
         tk.Label(search_frame,
@@ -1668,7 +1450,7 @@ class SistemaEscolarGUI:
                 fg=self.colors['text_light'],
                 font=('Segoe UI', 9, 'italic')).pack(side='left', padx=5)
         
-        table_container = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        table_container = tk.Frame(panel, bg=self.colors['surface'])
         table_container.pack(fill='both', expand=True, padx=20, pady=10)
         
         canvas = tk.Canvas(table_container, bg=self.colors['surface'], highlightthickness=0)
@@ -1728,7 +1510,7 @@ class SistemaEscolarGUI:
         
         tree.pack(fill='both', expand=True, padx=5, pady=5)
         
-        count_label = tk.Label(self.right_panel,
+        count_label = tk.Label(panel,
                               text="",
                               bg=self.colors['surface'],
                               fg=self.colors['text_light'],
@@ -1736,29 +1518,27 @@ class SistemaEscolarGUI:
         count_label.pack(pady=10)
         
         actualizar_tabla()
+        self.registrar_refresco('lista_materias', actualizar_tabla)
         search_entry.focus()
     
     def mostrar_grupos(self):
         """Mostrar lista de grupos con sus alumnos"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('grupos'):
+            return
+        panel = self.crear_pantalla('grupos')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="👥 Grupos Escolares",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        grupos = self.sistema.obtener_grupos_disponibles()
-        
-        if not grupos:
-            tk.Label(self.right_panel,
-                    text="No hay grupos registrados",
-                    bg=self.colors['surface'],
-                    fg=self.colors['text_light'],
-                    font=('Segoe UI', 12, 'italic')).pack(pady=50)
-            return
+        sin_grupos_label = tk.Label(panel,
+                                   text="No hay grupos registrados",
+                                   bg=self.colors['surface'],
+                                   fg=self.colors['text_light'],
+                                   font=('Segoe UI', 12, 'italic'))
         
-        selector_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
-        selector_frame.pack(fill='x', padx=40, pady=20)
+        selector_frame = tk.Frame(panel, bg=self.colors['surface'])
         
         tk.Label(selector_frame,
                 text="Seleccionar Grupo:",
@@ -1767,20 +1547,14 @@ class SistemaEscolarGUI:
                 font=('Segoe UI', 11, 'bold')).pack(side='left', padx=5)
         
         grupo_var = tk.StringVar()
-        grupos_list = [f"{grado}° {grupo}" for grado, grupo in grupos]
         grupo_combo = ttk.Combobox(selector_frame,
                                   textvariable=grupo_var,
-                                  values=grupos_list,
                                   font=('Segoe UI', 11),
                                   width=30,
                                   state='readonly')
         grupo_combo.pack(side='left', padx=5)
         
-        if grupos_list:
-            grupo_combo.set(grupos_list[0])
-        
-        alumnos_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
-        alumnos_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        alumnos_frame = tk.Frame(panel, bg=self.colors['surface'])
         
         def mostrar_alumnos_grupo(*args):
             for widget in alumnos_frame.winfo_children():
@@ -1862,19 +1636,41 @@ class SistemaEscolarGUI:
         
         grupo_var.trace('w', mostrar_alumnos_grupo)
         
-        if grupos_list:
-            mostrar_alumnos_grupo()
+        def refrescar_grupos():
+            grupos_list = [f"{grado}° {grupo}" for grado, grupo in self.sistema.obtener_grupos_disponibles()]
+            grupo_combo['values'] = grupos_list
+            
+            selector_frame.pack_forget()
+            alumnos_frame.pack_forget()
+            sin_grupos_label.pack_forget()
+            
+            if not grupos_list:
+                sin_grupos_label.pack(pady=50)
+                return
+            
+            selector_frame.pack(fill='x', padx=40, pady=20)
+            alumnos_frame.pack(fill='both', expand=True, padx=20, pady=10)
+            
+            if grupo_var.get() in grupos_list:
+                mostrar_alumnos_grupo()
+            else:
+                grupo_combo.set(grupos_list[0])
+        
+        self.registrar_refresco('grupos', refrescar_grupos)
+        refrescar_grupos()
     
     def mostrar_registrar_calificacion(self):
         """Mostrar formulario para registrar calificación con buscador"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('registrar_calificacion'):
+            return
+        panel = self.crear_pantalla('registrar_calificacion')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="✏️ Registrar Calificación",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        form_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        form_frame = tk.Frame(panel, bg=self.colors['surface'])
         form_frame.pack(fill='both', expand=True, padx=40, pady=20)
         
         search_frame = tk.Frame(form_frame, bg=self.colors['surface'])
@@ -2059,18 +1855,240 @@ class SistemaEscolarGUI:
         
         actualizar_combo_alumnos()
         actualizar_combo_materias()
+        
+        def refrescar_formulario():
+            actualizar_combo_alumnos()
+            actualizar_combo_materias()
+        
+        self.registrar_refresco('registrar_calificacion', refrescar_formulario)
         search_entry.focus()
     
+    def mostrar_calificaciones_grupo(self):
+        """Mostrar cuadrícula para capturar las calificaciones de todo un grupo en una materia"""
+        if self.mostrar_pantalla('calificaciones_grupo'):
+            return
+        panel = self.crear_pantalla('calificaciones_grupo')
+        
+        title = ttk.Label(panel,
+                         text="📋 Calificaciones por Grupo",
+                         style='Subtitle.TLabel')
+        title.pack(pady=20)
+        
+        selector_frame = tk.Frame(panel, bg=self.colors['surface'])
+        selector_frame.pack(fill='x', padx=40, pady=(0, 10))
+        
+        def etiqueta(texto, columna):
+            tk.Label(selector_frame,
+                    text=texto,
+                    bg=self.colors['surface'],
+                    fg=self.colors['text'],
+                    font=('Segoe UI', 10, 'bold')).grid(row=0, column=columna, sticky='w', padx=5, pady=5)
+        
+        etiqueta("Grupo:", 0)
+        grupo_var = tk.StringVar()
+        grupo_combo = ttk.Combobox(selector_frame,
+                                  textvariable=grupo_var,
+                                  font=('Segoe UI', 10),
+                                  width=10,
+                                  state='readonly')
+        grupo_combo.grid(row=0, column=1, padx=5, pady=5)
+        
+        etiqueta("Materia:", 2)
+        materia_var = tk.StringVar()
+        materia_combo = ttk.Combobox(selector_frame,
+                                    textvariable=materia_var,
+                                    font=('Segoe UI', 10),
+                                    width=35,
+                                    state='readonly')
+        materia_combo.grid(row=0, column=3, padx=5, pady=5)
+        
+        etiqueta("Semestre:", 4)
+        semestre_entry = tk.Entry(selector_frame,
+                                 font=('Segoe UI', 10),
+                                 relief='solid',
+                                 bd=1,
+                                 width=18)
+        semestre_entry.grid(row=0, column=5, padx=5, pady=5)
+        semestre_entry.insert(0, "1er Semestre")
+        
+        tk.Label(panel,
+                text="Las celdas vacías se omiten; las deshabilitadas ya tienen calificación en ese semestre",
+                bg=self.colors['surface'],
+                fg=self.colors['text_light'],
+                font=('Segoe UI', 9, 'italic')).pack(anchor='w', padx=45)
+        
+        table_container = tk.Frame(panel, bg=self.colors['surface'])
+        table_container.pack(fill='both', expand=True, padx=40, pady=10)
+        
+        canvas = tk.Canvas(table_container, bg=self.colors['surface'], highlightthickness=0, height=380)
+        scrollbar_y = ttk.Scrollbar(table_container, orient="vertical", command=canvas.yview)
+        cuadricula = tk.Frame(canvas, bg=self.colors['surface'])
+        cuadricula.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        canvas.create_window((0, 0), window=cuadricula, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar_y.set)
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar_y.pack(side="right", fill="y")
+        
+        # matrícula -> Entry de la calificación
+        celdas: Dict = {}
+        semestre_mostrado = [None]
+        
+        def grupo_seleccionado():
+            texto = grupo_var.get()
+            if not texto:
+                return None, None
+            return texto.split("°")[0], texto.split(" ")[1]
+        
+        def actualizar_materias():
+            grado, _ = grupo_seleccionado()
+            materias = [m for m in self.sistema.materias.values() if m.grado == grado]
+            if not materias:
+                materias = list(self.sistema.materias.values())
+            materias.sort(key=lambda m: m.id)
+            materias_list = [f"{m.id} - {m.nombre} (Grado {m.grado})" for m in materias]
+            materia_combo['values'] = materias_list
+            if materia_var.get() not in materias_list:
+                materia_combo.set(materias_list[0] if materias_list else "")
+        
+        def armar_cuadricula(*args):
+            for widget in cuadricula.winfo_children():
+                widget.destroy()
+            celdas.clear()
+            
+            grado, grupo = grupo_seleccionado()
+            if grado is None:
+                return
+            
+            alumnos = sorted(self.sistema.obtener_alumnos_por_grupo(grado, grupo), key=lambda a: a.matricula)
+            if not alumnos:
+                tk.Label(cuadricula,
+                        text=f"No hay alumnos en el grupo {grupo_var.get()}",
+                        bg=self.colors['surface'],
+                        fg=self.colors['text_light'],
+                        font=('Segoe UI', 11, 'italic')).grid(row=0, column=0, pady=30)
+                return
+            
+            materia_id = materia_var.get().split(" - ")[0]
+            semestre = semestre_entry.get().strip()
+            semestre_mostrado[0] = semestre
+            
+            for columna, encabezado in enumerate(("Matrícula", "Nombre Completo", "Calificación (0-100)")):
+                tk.Label(cuadricula,
+                        text=encabezado,
+                        bg=self.colors['primary'],
+                        fg='white',
+                        font=('Segoe UI', 10, 'bold'),
+                        padx=10,
+                        pady=5,
+                        anchor='w').grid(row=0, column=columna, sticky='ew')
+            
+            for i, alumno in enumerate(alumnos, start=1):
+                fondo = '#F0F8FF' if i % 2 else 'white'
+                tk.Label(cuadricula, text=alumno.matricula, bg=fondo, anchor='w',
+                        font=('Segoe UI', 10), padx=10, pady=3).grid(row=i, column=0, sticky='ew')
+                tk.Label(cuadricula, text=alumno.get_nombre_completo(), bg=fondo, anchor='w',
+                        font=('Segoe UI', 10), padx=10, pady=3, width=35).grid(row=i, column=1, sticky='ew')
+                entry = tk.Entry(cuadricula, font=('Segoe UI', 10), relief='solid', bd=1, width=10)
+                entry.grid(row=i, column=2, padx=10, pady=2)
+                
+                previa = next((c for c in self.sistema.obtener_calificaciones_alumno(alumno.matricula)
+                               if c.materia_id == materia_id and c.semestre == semestre), None)
+                if previa is not None:
+                    entry.insert(0, f"{previa.calificacion:g}")
+                    entry.config(state='disabled')
+                else:
+                    celdas[alumno.matricula] = entry
+        
+        def al_cambiar_grupo(*args):
+            actualizar_materias()
+            armar_cuadricula()
+        
+        grupo_combo.bind('<<ComboboxSelected>>', al_cambiar_grupo)
+        materia_combo.bind('<<ComboboxSelected>>', armar_cuadricula)
+        
+        def al_cambiar_semestre(event):
+            # Solo se rearma si cambió, para no perder lo capturado al salir del campo
+            if semestre_entry.get().strip() != semestre_mostrado[0]:
+                armar_cuadricula()
+        
+        semestre_entry.bind('<Return>', al_cambiar_semestre)
+        semestre_entry.bind('<FocusOut>', al_cambiar_semestre)
+        
+        def guardar():
+            grado, grupo = grupo_seleccionado()
+            if grado is None:
+                messagebox.showwarning("Selección requerida", "Por favor seleccione un grupo")
+                return
+            
+            if not materia_var.get():
+                messagebox.showwarning("Selección requerida", "Por favor seleccione una materia")
+                return
+            
+            semestre = semestre_entry.get().strip()
+            if not semestre:
+                messagebox.showwarning("Campo vacío", "Por favor ingrese el semestre")
+                return
+            
+            capturadas = {matricula: entry.get().strip()
+                          for matricula, entry in celdas.items() if entry.get().strip()}
+            if not capturadas:
+                messagebox.showwarning("Sin calificaciones", "Capture al menos una calificación")
+                return
+            
+            materia_id = materia_var.get().split(" - ")[0]
+            registradas, errores = self.sistema.registrar_calificaciones_grupo(
+                grado, grupo, materia_id, semestre, capturadas
+            )
+            
+            # Se conservan en la cuadrícula solo las calificaciones que fallaron
+            armar_cuadricula()
+            for matricula, valor in capturadas.items():
+                if matricula in errores and matricula in celdas:
+                    celdas[matricula].insert(0, valor)
+            
+            if errores:
+                detalle = "\n".join(f"{matricula}: {mensaje}" for matricula, mensaje in list(errores.items())[:15])
+                if len(errores) > 15:
+                    detalle += f"\n... y {len(errores) - 15} más"
+                messagebox.showwarning("Registro parcial",
+                                       f"Calificaciones registradas: {registradas}\n"
+                                       f"Con errores: {len(errores)}\n\n{detalle}")
+            else:
+                messagebox.showinfo("Éxito", f"{registradas} calificación(es) registrada(s) exitosamente")
+        
+        tk.Button(panel,
+                 text="💾 Registrar Calificaciones del Grupo",
+                 command=guardar,
+                 bg=self.colors['warning'],
+                 fg='white',
+                 font=('Segoe UI', 11, 'bold'),
+                 relief='flat',
+                 padx=30,
+                 pady=12,
+                 cursor='hand2').pack(pady=20)
+        
+        def refrescar_cuadricula():
+            grupos_list = [f"{grado}° {grupo}" for grado, grupo in self.sistema.obtener_grupos_disponibles()]
+            grupo_combo['values'] = grupos_list
+            if grupo_var.get() not in grupos_list:
+                grupo_combo.set(grupos_list[0] if grupos_list else "")
+            al_cambiar_grupo()
+        
+        self.registrar_refresco('calificaciones_grupo', refrescar_cuadricula)
+        refrescar_cuadricula()
+    
     def mostrar_ver_calificaciones_con_buscador(self):
         """Mostrar buscador de calificaciones por alumno"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('ver_calificaciones'):
+            return
+        panel = self.crear_pantalla('ver_calificaciones')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="🔍 Buscar Calificaciones por Alumno",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        main_search_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        main_search_frame = tk.Frame(panel, bg=self.colors['surface'])
         main_search_frame.pack(fill='x', padx=40, pady=20)
         
         tk.Label(main_search_frame,
@@ -2097,7 +2115,7 @@ class SistemaEscolarGUI:
                 fg=self.colors['text_light'],
                 font=('Segoe UI', 10, 'italic')).pack(side='left', padx=5)
         
-        results_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        results_frame = tk.Frame(panel, bg=self.colors['surface'])
         results_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         canvas = tk.Canvas(results_frame, bg=self.colors['surface'], highlightthickness=0)
@@ -2233,18 +2251,22 @@ class SistemaEscolarGUI:
                  cursor='hand2').pack(pady=20)
         
         search_entry.bind('<Return>', lambda e: buscar_calificaciones())
+        self.registrar_refresco('ver_calificaciones',
+                                lambda: buscar_calificaciones() if search_var.get().strip() else None)
         search_entry.focus()
     
     def mostrar_boletin_alumno(self):
         """Mostrar boletín completo de calificaciones por alumno"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('boletin'):
+            return
+        panel = self.crear_pantalla('boletin')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="📈 Boletín de Calificaciones",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        search_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        search_frame = tk.Frame(panel, bg=self.colors['surface'])
         search_frame.pack(fill='x', padx=40, pady=20)
         
         tk.Label(search_frame,
@@ -2268,7 +2290,7 @@ class SistemaEscolarGUI:
                 fg=self.colors['text_light'],
                 font=('Segoe UI', 9, 'italic')).pack(side='left', padx=5)
         
-        select_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        select_frame = tk.Frame(panel, bg=self.colors['surface'])
         select_frame.pack(fill='x', padx=40, pady=10)
         
         tk.Label(select_frame,
@@ -2298,7 +2320,7 @@ class SistemaEscolarGUI:
         
         search_var.trace('w', actualizar_combo)
         
-        boletin_container = tk.Frame(self.right_panel, bg='white', relief='solid', bd=2)
+        boletin_container = tk.Frame(panel, bg='white', relief='solid', bd=2)
         boletin_container.pack(fill='both', expand=True, padx=20, pady=20)
         
         canvas = tk.Canvas(boletin_container, bg='white', highlightthickness=0)
@@ -2353,24 +2375,17 @@ class SistemaEscolarGUI:
                     font=('Segoe UI', 11),
                     justify='left').pack(anchor='w')
             
-            calificaciones = self.sistema.obtener_calificaciones_alumno(matricula)
+            boletin = self.sistema.obtener_boletin(matricula)
             
-            if not calificaciones:
+            if not boletin['materias']:
                 tk.Label(scrollable_frame,
                         text="No hay calificaciones registradas para este alumno",
                         bg='white',
                         fg=self.colors['text_light'],
                         font=('Segoe UI', 12, 'italic')).pack(pady=30)
             else:
-                materias_calif = {}
-                for calif in calificaciones:
-                    if calif.materia_id not in materias_calif:
-                        materias_calif[calif.materia_id] = []
-                    materias_calif[calif.materia_id].append(calif)
-                
-                for materia_id, califs in materias_calif.items():
-                    materia = self.sistema.materias.get(materia_id)
-                    materia_nombre = materia.nombre if materia else materia_id
+                for materia in boletin['materias']:
+                    materia_nombre = materia['nombre']
                     
                     materia_frame = tk.Frame(scrollable_frame, bg='white', relief='solid', bd=1)
                     materia_frame.pack(fill='x', padx=20, pady=5)
@@ -2393,12 +2408,12 @@ class SistemaEscolarGUI:
                             font=('Segoe UI', 10, 'bold'), width=15, relief='solid', bd=1).grid(row=0, column=2, padx=2, pady=2, sticky='nsew')
                     
                     row = 1
-                    for calif in sorted(califs, key=lambda x: x.semestre):
-                        calif_text = f"{calif.calificacion:.1f}"
-                        estado = "Aprobado" if calif.calificacion >= 70 else "Reprobado"
-                        estado_color = self.colors['success'] if calif.calificacion >= 70 else self.colors['danger']
+                    for semestre, calificacion in materia['calificaciones']:
+                        calif_text = f"{calificacion:.1f}"
+                        estado = "Aprobado" if calificacion >= 70 else "Reprobado"
+                        estado_color = self.colors['success'] if calificacion >= 70 else self.colors['danger']
                         
-                        tk.Label(calif_subframe, text=calif.semestre, bg='white', 
+                        tk.Label(calif_subframe, text=semestre, bg='white', 
                                 fg=self.colors['text'], font=('Segoe UI', 10), 
                                 width=20, relief='solid', bd=1).grid(row=row, column=0, padx=2, pady=2, sticky='nsew')
                         tk.Label(calif_subframe, text=calif_text, bg='white', 
@@ -2409,7 +2424,7 @@ class SistemaEscolarGUI:
                                 width=15, relief='solid', bd=1).grid(row=row, column=2, padx=2, pady=2, sticky='nsew')
                         row += 1
                     
-                    promedio_materia = sum(c.calificacion for c in califs) / len(califs)
+                    promedio_materia = materia['promedio']
                     color_prom = self.colors['success'] if promedio_materia >= 70 else self.colors['danger']
                     
                     tk.Label(materia_frame,
@@ -2418,7 +2433,7 @@ class SistemaEscolarGUI:
                             fg='white',
                             font=('Segoe UI', 10, 'bold')).pack(pady=5)
                 
-                promedio = self.sistema.obtener_promedio_alumno(matricula)
+                promedio = boletin['promedio']
                 
                 promedio_frame = tk.Frame(scrollable_frame, bg='white', relief='solid', bd=2)
                 promedio_frame.pack(fill='x', padx=20, pady=15)
@@ -2449,19 +2464,28 @@ class SistemaEscolarGUI:
                  pady=8,
                  cursor='hand2').pack(side='left', padx=10)
         
+        
+        def refrescar_boletin():
+            for widget in scrollable_frame.winfo_children():
+                widget.destroy()
+            actualizar_combo()
+        
+        self.registrar_refresco('boletin', refrescar_boletin)
         actualizar_combo()
         search_entry.focus()
     
     def mostrar_agregar_horario(self):
         """Mostrar formulario para agregar horario"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('agregar_horario'):
+            return
+        panel = self.crear_pantalla('agregar_horario')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="📅 Agregar Horario",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        form_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
+        form_frame = tk.Frame(panel, bg=self.colors['surface'])
         form_frame.pack(fill='both', expand=True, padx=40, pady=20)
         
         campos = [
@@ -2520,6 +2544,13 @@ class SistemaEscolarGUI:
         
         form_frame.columnconfigure(1, weight=1)
         
+        def actualizar_combos():
+            entries['materia_id']['values'] = [f"{m.id} - {m.nombre}" for m in self.sistema.materias.values()]
+            entries['docente_id']['values'] = [f"{d.num_empleado} - {d.get_nombre_completo()}"
+                                               for d in self.sistema.docentes.values()]
+        
+        self.registrar_refresco('agregar_horario', actualizar_combos)
+        
         def guardar():
             datos = {}
             for key, entry in entries.items():
@@ -2550,6 +2581,11 @@ class SistemaEscolarGUI:
             
             if exito:
                 messagebox.showinfo("Éxito", mensaje)
+                for entry in entries.values():
+                    if isinstance(entry, ttk.Combobox):
+                        entry.set('')
+                    else:
+                        entry.delete(0, tk.END)
                 self.mostrar_inicio()
             else:
                 messagebox.showerror("Error", mensaje)
@@ -2570,27 +2606,23 @@ class SistemaEscolarGUI:
     
     def mostrar_buscar_horarios(self):
         """Mostrar buscador de horarios en formato de tabla estilo horario escolar"""
-        self.limpiar_panel()
+        if self.mostrar_pantalla('buscar_horarios'):
+            return
+        panel = self.crear_pantalla('buscar_horarios')
         
-        title = ttk.Label(self.right_panel,
+        title = ttk.Label(panel,
                          text="🔍 Buscar Horarios - Vista de Grupo",
                          style='Subtitle.TLabel')
         title.pack(pady=20)
         
-        # Obtener grupos disponibles
-        grupos = self.sistema.obtener_grupos_disponibles()
-        
-        if not grupos:
-            tk.Label(self.right_panel,
-                    text="No hay grupos registrados para mostrar horarios",
-                    bg=self.colors['surface'],
-                    fg=self.colors['text_light'],
-                    font=('Segoe UI', 12, 'italic')).pack(pady=50)
-            return
+        sin_grupos_label = tk.Label(panel,
+                                   text="No hay grupos registrados para mostrar horarios",
+                                   bg=self.colors['surface'],
+                                   fg=self.colors['text_light'],
+                                   font=('Segoe UI', 12, 'italic'))
         
         # Frame para selector de grupo
-        selector_frame = tk.Frame(self.right_panel, bg=self.colors['surface'])
-        selector_frame.pack(fill='x', padx=40, pady=20)
+        selector_frame = tk.Frame(panel, bg=self.colors['surface'])
         
         tk.Label(selector_frame,
                 text="Seleccionar Grupo:",
@@ -2599,21 +2631,15 @@ class SistemaEscolarGUI:
                 font=('Segoe UI', 12, 'bold')).pack(side='left', padx=5)
         
         grupo_var = tk.StringVar()
-        grupos_list = [f"{grado}° {grupo}" for grado, grupo in grupos]
         grupo_combo = ttk.Combobox(selector_frame,
                                   textvariable=grupo_var,
-                                  values=grupos_list,
                                   font=('Segoe UI', 12),
                                   width=20,
                                   state='readonly')
         grupo_combo.pack(side='left', padx=5)
         
-        if grupos_list:
-            grupo_combo.set(grupos_list[0])
-        
         # Frame de resultados con scrollbars - Tabla estilo horario
-        results_container = tk.Frame(self.right_panel, bg=self.colors['surface'])
-        results_container.pack(fill='both', expand=True, padx=20, pady=20)
+        results_container = tk.Frame(panel, bg=self.colors['surface'])
         
         # Crear canvas con scrollbars para la tabla
         canvas = tk.Canvas(results_container, bg=self.colors['surface'], highlightthickness=0)
@@ -2793,15 +2819,619 @@ class SistemaEscolarGUI:
         # Evento de selección de grupo
         grupo_var.trace('w', mostrar_horarios_grupo)
         
-        # Mostrar horarios del primer grupo
-        if grupos_list:
-            mostrar_horarios_grupo()
+        def refrescar_grupos():
+            grupos_list = [f"{grado}° {grupo}" for grado, grupo in self.sistema.obtener_grupos_disponibles()]
+            grupo_combo['values'] = grupos_list
+            
+            selector_frame.pack_forget()
+            results_container.pack_forget()
+            sin_grupos_label.pack_forget()
+            
+            if not grupos_list:
+                sin_grupos_label.pack(pady=50)
+                return
+            
+            selector_frame.pack(fill='x', padx=40, pady=20)
+            results_container.pack(fill='both', expand=True, padx=20, pady=20)
+            
+            # Mostrar horarios del grupo seleccionado o del primero
+            if grupo_var.get() in grupos_list:
+                mostrar_horarios_grupo()
+            else:
+                grupo_combo.set(grupos_list[0])
+        
+        self.registrar_refresco('buscar_horarios', refrescar_grupos)
+        refrescar_grupos()
+    
+    def mostrar_conflictos_horarios(self):
+        """Mostrar todos los empalmes entre horarios registrados"""
+        if self.mostrar_pantalla('conflictos_horarios'):
+            return
+        panel = self.crear_pantalla('conflictos_horarios')
+        
+        title = ttk.Label(panel,
+                         text="⚠️ Conflictos de Horario",
+                         style='Subtitle.TLabel')
+        title.pack(pady=20)
+        
+        table_frame = tk.Frame(panel, bg=self.colors['surface'])
+        table_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        scrollbar = ttk.Scrollbar(table_frame)
+        scrollbar.pack(side='right', fill='y')
+        
+        columns = ('Recurso', 'Día', 'Horario 1', 'Horario 2')
+        tree = ttk.Treeview(table_frame,
+                           columns=columns,
+                           show='headings',
+                           yscrollcommand=scrollbar.set,
+                           height=18)
+        scrollbar.config(command=tree.yview)
+        
+        for col, ancho in zip(columns, (220, 120, 280, 280)):
+            tree.heading(col, text=col)
+            tree.column(col, width=ancho, minwidth=100)
+        
+        self.configurar_treeview_con_lineas(tree)
+        tree.tag_configure('evenrow', background='#FFEBEE')
+        tree.tag_configure('oddrow', background='white')
+        tree.pack(fill='both', expand=True)
+        
+        count_label = tk.Label(panel,
+                              text="",
+                              bg=self.colors['surface'],
+                              fg=self.colors['text_light'],
+                              font=('Segoe UI', 10))
+        count_label.pack(pady=10)
+        
+        def describir(horario):
+            if horario is None:
+                return "N/A"
+            return f"{horario.id}: {horario.materia_id} {horario.hora_inicio}-{horario.hora_fin} ({horario.aula})"
+        
+        def actualizar_tabla():
+            for item in tree.get_children():
+                tree.delete(item)
+            
+            conflictos = self.sistema.auditar_conflictos_horarios()
+            nombres_tipo = {'docente': "Docente", 'aula': "Aula", 'grupo': "Grupo"}
+            
+            for i, conflicto in enumerate(conflictos):
+                recurso = conflicto['recurso']
+                if conflicto['tipo'] == 'grupo':
+                    recurso = f"{recurso[0]}° {recurso[1]}"
+                tree.insert('', 'end', values=(
+                    f"{nombres_tipo[conflicto['tipo']]} {recurso}",
+                    conflicto['dia'],
+                    describir(conflicto['horario_1']),
+                    describir(conflicto['horario_2'])
+                ), tags=('evenrow' if i % 2 == 0 else 'oddrow',))
+            
+            if conflictos:
+                count_label.config(text=f"Se encontraron {len(conflictos)} empalme(s)", fg=self.colors['danger'])
+            else:
+                count_label.config(text="No hay empalmes de horario", fg=self.colors['success'])
+        
+        self.registrar_refresco('conflictos_horarios', actualizar_tabla)
+        actualizar_tabla()
+    
+    def mostrar_disponibilidad(self):
+        """Mostrar aulas y docentes libres en un día y horario"""
+        if self.mostrar_pantalla('disponibilidad'):
+            return
+        panel = self.crear_pantalla('disponibilidad')
+        
+        title = ttk.Label(panel,
+                         text="🔎 Aulas y Docentes Libres",
+                         style='Subtitle.TLabel')
+        title.pack(pady=20)
+        
+        filtros_frame = tk.Frame(panel, bg=self.colors['surface'])
+        filtros_frame.pack(fill='x', padx=40, pady=10)
+        
+        tk.Label(filtros_frame,
+                text="Día:",
+                bg=self.colors['surface'],
+                fg=self.colors['text'],
+                font=('Segoe UI', 10, 'bold')).grid(row=0, column=0, sticky='w', padx=5)
+        dia_combo = ttk.Combobox(filtros_frame,
+                                values=self.dias_semana,
+                                font=('Segoe UI', 10),
+                                width=15,
+                                state='readonly')
+        dia_combo.grid(row=0, column=1, padx=5, pady=5)
+        dia_combo.current(0)
+        
+        horas = {}
+        for i, (label, key, valor) in enumerate([("Hora Inicio (HH:MM):", "inicio", "07:00"),
+                                                 ("Hora Fin (HH:MM):", "fin", "08:00")], start=1):
+            tk.Label(filtros_frame,
+                    text=label,
+                    bg=self.colors['surface'],
+                    fg=self.colors['text'],
+                    font=('Segoe UI', 10, 'bold')).grid(row=0, column=i * 2, sticky='w', padx=5)
+            entry = tk.Entry(filtros_frame,
+                           font=('Segoe UI', 10),
+                           relief='solid',
+                           bd=1,
+                           width=10)
+            entry.insert(0, valor)
+            entry.grid(row=0, column=i * 2 + 1, padx=5, pady=5)
+            horas[key] = entry
+        
+        resultados_frame = tk.Frame(panel, bg=self.colors['surface'])
+        resultados_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        tablas = {}
+        for col, (titulo, columnas, anchos) in enumerate([
+                ("🏫 Aulas Libres", ('Aula',), (200,)),
+                ("👨‍🏫 Docentes Libres", ('No. Empleado', 'Nombre', 'Especialidad'), (110, 220, 160))]):
+            marco = tk.LabelFrame(resultados_frame,
+                                 text=titulo,
+                                 bg=self.colors['surface'],
+                                 fg=self.colors['primary'],
+                                 font=('Segoe UI', 11, 'bold'))
+            marco.grid(row=0, column=col, sticky='nsew', padx=10)
+            resultados_frame.columnconfigure(col, weight=1)
+            
+            tree = ttk.Treeview(marco, columns=columnas, show='headings', height=15)
+            for nombre, ancho in zip(columnas, anchos):
+                tree.heading(nombre, text=nombre)
+                tree.column(nombre, width=ancho, minwidth=80)
+            self.configurar_treeview_con_lineas(tree)
+            tree.pack(fill='both', expand=True, padx=5, pady=5)
+            tablas[col] = tree
+        resultados_frame.rowconfigure(0, weight=1)
+        
+        count_label = tk.Label(panel,
+                              text="",
+                              bg=self.colors['surface'],
+                              fg=self.colors['text_light'],
+                              font=('Segoe UI', 10))
+        count_label.pack(pady=10)
+        
+        def buscar():
+            for tree in tablas.values():
+                for item in tree.get_children():
+                    tree.delete(item)
+            
+            dia = dia_combo.get()
+            inicio, fin = horas['inicio'].get().strip(), horas['fin'].get().strip()
+            try:
+                aulas = self.sistema.aulas_libres(dia, inicio, fin)
+                docentes = self.sistema.docentes_libres(dia, inicio, fin)
+            except ValueError as e:
+                count_label.config(text=f"{e}. Use el formato HH:MM", fg=self.colors['danger'])
+                return
+            
+            for aula in aulas:
+                tablas[0].insert('', 'end', values=(aula,))
+            for docente in sorted(docentes, key=lambda d: d.num_empleado):
+                tablas[1].insert('', 'end', values=(docente.num_empleado,
+                                                    docente.get_nombre_completo(),
+                                                    docente.especialidad))
+            count_label.config(text=f"{dia} de {inicio} a {fin}: {len(aulas)} aula(s) y "
+                                    f"{len(docentes)} docente(s) libres",
+                               fg=self.colors['text_light'])
+        
+        tk.Button(filtros_frame,
+                 text="🔍 Buscar",
+                 command=buscar,
+                 bg=self.colors['secondary'],
+                 fg='white',
+                 font=('Segoe UI', 10, 'bold'),
+                 relief='flat',
+                 padx=20,
+                 cursor='hand2').grid(row=0, column=6, padx=10)
+        
+        self.registrar_refresco('disponibilidad', buscar)
+        buscar()
+    
+    def mostrar_reporte_rendimiento(self):
+        """Mostrar reporte de rendimiento por grupo, materia y semestre"""
+        if self.mostrar_pantalla('reporte_rendimiento'):
+            return
+        panel = self.crear_pantalla('reporte_rendimiento')
+        
+        title = ttk.Label(panel,
+                         text="📊 Rendimiento por Grupo y Materia",
+                         style='Subtitle.TLabel')
+        title.pack(pady=20)
+        
+        filtros_frame = tk.Frame(panel, bg=self.colors['surface'])
+        filtros_frame.pack(fill='x', padx=40, pady=10)
+        
+        filtros = {}
+        for i, (label, key) in enumerate([("Grupo:", "grupo"), ("Materia:", "materia"), ("Semestre:", "semestre")]):
+            tk.Label(filtros_frame,
+                    text=label,
+                    bg=self.colors['surface'],
+                    fg=self.colors['text'],
+                    font=('Segoe UI', 10, 'bold')).grid(row=0, column=i * 2, sticky='w', padx=5)
+            
+            combo = ttk.Combobox(filtros_frame,
+                                font=('Segoe UI', 10),
+                                width=25,
+                                state='readonly')
+            combo.grid(row=0, column=i * 2 + 1, padx=5, pady=5)
+            filtros[key] = combo
+        
+        resultados_frame = tk.Frame(panel, bg=self.colors['surface'])
+        resultados_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        def actualizar_filtros():
+            filtros['grupo']['values'] = ["Todos"] + [f"{grado}° {grupo}" for grado, grupo
+                                                      in self.sistema.obtener_grupos_disponibles()]
+            filtros['materia']['values'] = ["Todas"] + [f"{m.id} - {m.nombre}" for m in
+                                                        sorted(self.sistema.materias.values(), key=lambda m: m.id)]
+            filtros['semestre']['values'] = ["Todos"] + sorted(self.sistema.almacen_calificaciones.semestres.valores)
+            for combo in filtros.values():
+                if combo.get() not in combo['values']:
+                    combo.current(0)
+        
+        def generar_reporte():
+            for widget in resultados_frame.winfo_children():
+                widget.destroy()
+            
+            grado = grupo = materia_id = semestre = None
+            if filtros['grupo'].current() > 0:
+                grado, grupo = filtros['grupo'].get().split("° ")
+            if filtros['materia'].current() > 0:
+                materia_id = filtros['materia'].get().split(" - ")[0]
+            if filtros['semestre'].current() > 0:
+                semestre = filtros['semestre'].get()
+            
+            reporte = reporte_rendimiento(self.sistema, semestre=semestre, grado=grado,
+                                          grupo=grupo, materia_id=materia_id)
+            
+            if not reporte['cantidad']:
+                tk.Label(resultados_frame,
+                        text="No hay calificaciones para los filtros seleccionados",
+                        bg=self.colors['surface'],
+                        fg=self.colors['text_light'],
+                        font=('Segoe UI', 12, 'italic')).pack(pady=50)
+                return
+            
+            # Tarjetas de resumen
+            resumen_frame = tk.Frame(resultados_frame, bg=self.colors['surface'])
+            resumen_frame.pack(fill='x', pady=10)
+            
+            tarjetas = [
+                ("Calificaciones", str(reporte['cantidad']), self.colors['secondary']),
+                ("Promedio", f"{reporte['promedio']:.1f}", self.colors['accent']),
+                ("Mediana", f"{reporte['mediana']:.1f}", self.colors['info']),
+                ("Desv. Estándar", f"{reporte['desviacion_estandar']:.1f}", self.colors['warning']),
+                ("Aprobación", f"{reporte['tasa_aprobacion'] * 100:.1f}%",
+                 self.colors['success'] if reporte['tasa_aprobacion'] >= 0.5 else self.colors['danger']),
+            ]
+            
+            for i, (titulo, valor, color) in enumerate(tarjetas):
+                card = tk.Frame(resumen_frame, bg=color)
+                card.grid(row=0, column=i, padx=8, sticky='nsew')
+                resumen_frame.columnconfigure(i, weight=1)
+                tk.Label(card, text=titulo, bg=color, fg='white',
+                        font=('Segoe UI', 10, 'bold'), pady=5).pack()
+                tk.Label(card, text=valor, bg=color, fg='white',
+                        font=('Segoe UI', 20, 'bold'), pady=5).pack()
+            
+            detalle_frame = tk.Frame(resultados_frame, bg=self.colors['surface'])
+            detalle_frame.pack(fill='both', expand=True, pady=10)
+            
+            # Tabla de percentiles
+            tabla_frame = tk.Frame(detalle_frame, bg='white')
+            tabla_frame.pack(side='left', anchor='n', padx=10)
+            
+            tk.Label(tabla_frame, text="Percentil", bg=self.colors['primary'], fg='white',
+                    font=('Segoe UI', 10, 'bold'), width=12, relief='solid', bd=1).grid(row=0, column=0, padx=1, pady=1, sticky='nsew')
+            tk.Label(tabla_frame, text="Calificación", bg=self.colors['primary'], fg='white',
+                    font=('Segoe UI', 10, 'bold'), width=12, relief='solid', bd=1).grid(row=0, column=1, padx=1, pady=1, sticky='nsew')
+            
+            filas = ([("Mínimo", reporte['minimo'])] +
+                     [(f"P{p}", v) for p, v in reporte['percentiles'].items()] +
+                     [("Máximo", reporte['maximo'])])
+            for row, (nombre, valor) in enumerate(filas, start=1):
+                tk.Label(tabla_frame, text=nombre, bg='white', fg=self.colors['text'],
+                        font=('Segoe UI', 10), width=12, relief='solid', bd=1).grid(row=row, column=0, padx=1, pady=1, sticky='nsew')
+                tk.Label(tabla_frame, text=f"{valor:.1f}", bg='white', fg=self.colors['text'],
+                        font=('Segoe UI', 10), width=12, relief='solid', bd=1).grid(row=row, column=1, padx=1, pady=1, sticky='nsew')
+            
+            # Histograma
+            ancho, alto = 600, 300
+            canvas = tk.Canvas(detalle_frame, width=ancho, height=alto, bg='white',
+                               highlightthickness=1, highlightbackground=self.colors['border'])
+            canvas.pack(side='left', padx=10, anchor='n')
+            
+            histograma = reporte['histograma']
+            maximo = max(n for _, _, n in histograma) or 1
+            barra = (ancho - 40) / len(histograma)
+            for i, (inicio, fin, n) in enumerate(histograma):
+                x0 = 20 + i * barra
+                y0 = alto - 30 - (alto - 60) * n / maximo
+                color = self.colors['success'] if inicio >= 70 else self.colors['danger']
+                canvas.create_rectangle(x0 + 2, y0, x0 + barra - 2, alto - 30, fill=color, outline='')
+                canvas.create_text(x0 + barra / 2, y0 - 8, text=str(n), font=('Segoe UI', 8))
+                canvas.create_text(x0 + barra / 2, alto - 15, text=f"{inicio}-{fin}", font=('Segoe UI', 8))
+        
+        tk.Button(filtros_frame,
+                 text="📊 Generar Reporte",
+                 command=generar_reporte,
+                 bg=self.colors['secondary'],
+                 fg='white',
+                 font=('Segoe UI', 10, 'bold'),
+                 relief='flat',
+                 padx=20,
+                 pady=6,
+                 cursor='hand2').grid(row=0, column=6, padx=10)
+        
+        def refrescar_reporte():
+            actualizar_filtros()
+            generar_reporte()
+        
+        self.registrar_refresco('reporte_rendimiento', refrescar_reporte)
+        refrescar_reporte()
+    
+    def mostrar_rankings(self):
+        """Mostrar los mejores promedios por grupo y los alumnos en riesgo por materia"""
+        if self.mostrar_pantalla('rankings'):
+            return
+        panel = self.crear_pantalla('rankings')
+        
+        title = ttk.Label(panel,
+                         text="🏆 Rankings de Alumnos",
+                         style='Subtitle.TLabel')
+        title.pack(pady=20)
+        
+        contenedor = tk.Frame(panel, bg=self.colors['surface'])
+        contenedor.pack(fill='both', expand=True, padx=20, pady=10)
+        contenedor.columnconfigure(0, weight=1)
+        contenedor.columnconfigure(1, weight=1)
+        contenedor.rowconfigure(0, weight=1)
+        
+        def crear_seccion(columna, titulo, color, filtros):
+            """Crear un recuadro con filtros, cantidad N y tabla de resultados"""
+            frame = tk.LabelFrame(contenedor,
+                                  text=titulo,
+                                  bg=self.colors['surface'],
+                                  fg=color,
+                                  font=('Segoe UI', 11, 'bold'),
+                                  relief='solid',
+                                  bd=2)
+            frame.grid(row=0, column=columna, sticky='nsew', padx=10)
+            
+            filtros_frame = tk.Frame(frame, bg=self.colors['surface'])
+            filtros_frame.pack(fill='x', padx=10, pady=10)
+            
+            combos = {}
+            for i, (label, key) in enumerate(filtros):
+                tk.Label(filtros_frame,
+                        text=label,
+                        bg=self.colors['surface'],
+                        fg=self.colors['text'],
+                        font=('Segoe UI', 10, 'bold')).grid(row=i, column=0, sticky='w', pady=3)
+                combos[key] = ttk.Combobox(filtros_frame,
+                                           font=('Segoe UI', 10),
+                                           width=28,
+                                           state='readonly')
+                combos[key].grid(row=i, column=1, sticky='w', padx=5, pady=3)
+            
+            tk.Label(filtros_frame,
+                    text="Cantidad:",
+                    bg=self.colors['surface'],
+                    fg=self.colors['text'],
+                    font=('Segoe UI', 10, 'bold')).grid(row=len(filtros), column=0, sticky='w', pady=3)
+            n_spin = tk.Spinbox(filtros_frame, from_=1, to=100, width=5, font=('Segoe UI', 10))
+            n_spin.delete(0, tk.END)
+            n_spin.insert(0, "10")
+            n_spin.grid(row=len(filtros), column=1, sticky='w', padx=5, pady=3)
+            
+            columns = ('Lugar', 'Matrícula', 'Nombre', 'Promedio')
+            tree = ttk.Treeview(frame, columns=columns, show='headings', height=12)
+            for col, ancho in zip(columns, (60, 110, 220, 90)):
+                tree.heading(col, text=col)
+                tree.column(col, width=ancho, minwidth=ancho)
+            self.configurar_treeview_con_lineas(tree)
+            tree.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+            tree.tag_configure('aprobado', background='#E8F5E9')
+            tree.tag_configure('reprobado', background='#FFEBEE')
+            
+            return filtros_frame, combos, n_spin, tree
+        
+        def llenar_tabla(tree, resultados):
+            for item in tree.get_children():
+                tree.delete(item)
+            for lugar, (alumno, promedio) in enumerate(resultados, start=1):
+                tree.insert('', 'end', values=(
+                    lugar,
+                    alumno.matricula,
+                    alumno.get_nombre_completo(),
+                    f"{promedio:.1f}"
+                ), tags=('aprobado' if promedio >= 70 else 'reprobado',))
+        
+        def leer_n(spin):
+            try:
+                return max(1, int(spin.get()))
+            except ValueError:
+                return 10
+        
+        # Mejores promedios por grupo
+        top_filtros, top_combos, top_n, top_tree = crear_seccion(
+            0, "🏆 MEJORES PROMEDIOS", self.colors['success'], [("Grupo:", "grupo")])
+        
+        def actualizar_top(*args):
+            if not top_combos['grupo'].get():
+                llenar_tabla(top_tree, [])
+                return
+            grado, grupo = top_combos['grupo'].get().split("° ")
+            llenar_tabla(top_tree, self.sistema.top_alumnos(grado, grupo, leer_n(top_n)))
+        
+        # Alumnos en riesgo por materia y semestre
+        riesgo_filtros, riesgo_combos, riesgo_n, riesgo_tree = crear_seccion(
+            1, "⚠️ ALUMNOS EN RIESGO", self.colors['danger'],
+            [("Materia:", "materia"), ("Semestre:", "semestre")])
+        
+        def actualizar_riesgo(*args):
+            if not riesgo_combos['materia'].get() or not riesgo_combos['semestre'].get():
+                llenar_tabla(riesgo_tree, [])
+                return
+            materia_id = riesgo_combos['materia'].get().split(" - ")[0]
+            semestre = riesgo_combos['semestre'].get()
+            llenar_tabla(riesgo_tree, self.sistema.en_riesgo(materia_id, semestre, leer_n(riesgo_n)))
+        
+        for filtros_frame, comando, fila in ((top_filtros, actualizar_top, 2),
+                                             (riesgo_filtros, actualizar_riesgo, 3)):
+            tk.Button(filtros_frame,
+                     text="🔍 Consultar",
+                     command=comando,
+                     bg=self.colors['secondary'],
+                     fg='white',
+                     font=('Segoe UI', 10, 'bold'),
+                     relief='flat',
+                     padx=15,
+                     pady=4,
+                     cursor='hand2').grid(row=fila, column=0, columnspan=2, pady=8)
+        
+        top_combos['grupo'].bind('<<ComboboxSelected>>', actualizar_top)
+        riesgo_combos['materia'].bind('<<ComboboxSelected>>', actualizar_riesgo)
+        riesgo_combos['semestre'].bind('<<ComboboxSelected>>', actualizar_riesgo)
+        
+        def refrescar_rankings():
+            top_combos['grupo']['values'] = [f"{grado}° {grupo}" for grado, grupo
+                                             in self.sistema.obtener_grupos_disponibles()]
+            riesgo_combos['materia']['values'] = [f"{m.id} - {m.nombre}" for m in
+                                                  sorted(self.sistema.materias.values(), key=lambda m: m.id)]
+            riesgo_combos['semestre']['values'] = sorted(self.sistema.almacen_calificaciones.semestres.valores)
+            for combo in list(top_combos.values()) + list(riesgo_combos.values()):
+                if combo.get() not in combo['values'] and combo['values']:
+                    combo.current(0)
+            actualizar_top()
+            actualizar_riesgo()
+        
+        self.registrar_refresco('rankings', refrescar_rankings)
+        refrescar_rankings()
+    
+    def mostrar_diagnostico(self):
+        """Mostrar llamadas y tiempos de las operaciones del sistema y de las pantallas"""
+        if self.mostrar_pantalla('diagnostico'):
+            return
+        panel = self.crear_pantalla('diagnostico')
+        
+        title = ttk.Label(panel,
+                         text="⏱️ Diagnóstico de Rendimiento",
+                         style='Subtitle.TLabel')
+        title.pack(pady=20)
+        
+        controles_frame = tk.Frame(panel, bg=self.colors['surface'])
+        controles_frame.pack(fill='x', padx=20, pady=5)
+        
+        activo_var = tk.BooleanVar(value=REGISTRO.activo)
+        
+        def cambiar_medicion():
+            if activo_var.get():
+                REGISTRO.activar()
+            else:
+                REGISTRO.desactivar()
+        
+        tk.Checkbutton(controles_frame,
+                      text="Medición activa",
+                      variable=activo_var,
+                      command=cambiar_medicion,
+                      bg=self.colors['surface'],
+                      fg=self.colors['text'],
+                      font=('Segoe UI', 10, 'bold')).pack(side='left', padx=5)
+        
+        table_frame = tk.Frame(panel, bg=self.colors['surface'])
+        table_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        
+        scrollbar = ttk.Scrollbar(table_frame)
+        scrollbar.pack(side='right', fill='y')
+        
+        columns = ('Operación', 'Llamadas', 'Total (ms)', 'Promedio (ms)', 'p50 (ms)', 'p95 (ms)', 'Máx. (ms)')
+        tree = ttk.Treeview(table_frame,
+                           columns=columns,
+                           show='headings',
+                           yscrollcommand=scrollbar.set,
+                           height=16)
+        scrollbar.config(command=tree.yview)
+        
+        for col, ancho in zip(columns, (300, 90, 110, 110, 90, 90, 100)):
+            tree.heading(col, text=col)
+            tree.column(col, width=ancho, minwidth=80)
+        
+        self.configurar_treeview_con_lineas(tree)
+        tree.tag_configure('evenrow', background='#F0F8FF')
+        tree.tag_configure('oddrow', background='white')
+        tree.pack(fill='both', expand=True)
+        
+        cache_label = tk.Label(panel,
+                              text="",
+                              bg=self.colors['surface'],
+                              fg=self.colors['text_light'],
+                              font=('Segoe UI', 10))
+        cache_label.pack(pady=10)
+        
+        def actualizar_tabla():
+            for item in tree.get_children():
+                tree.delete(item)
+            
+            for i, fila in enumerate(REGISTRO.resumen()):
+                tree.insert('', 'end', values=(
+                    fila['operacion'],
+                    fila['llamadas'],
+                    f"{fila['total_ms']:.2f}",
+                    f"{fila['promedio_ms']:.3f}",
+                    f"≤ {fila['p50_ms']:g}",
+                    f"≤ {fila['p95_ms']:g}",
+                    f"{fila['maximo_ms']:.2f}"
+                ), tags=('evenrow' if i % 2 == 0 else 'oddrow',))
+            
+            cache = self.sistema.estadisticas_cache()
+            cache_label.config(text=f"Caché de consultas: {cache['aciertos']} aciertos, {cache['fallos']} fallos "
+                                    f"({cache['tasa_aciertos'] * 100:.1f}%), "
+                                    f"{cache['entradas']}/{cache['capacidad']} entradas")
+        
+        def reiniciar():
+            REGISTRO.reiniciar()
+            actualizar_tabla()
+        
+        def exportar_json():
+            ruta = filedialog.asksaveasfilename(title="Exportar métricas",
+                                                defaultextension=".json",
+                                                initialfile="metricas.json",
+                                                filetypes=[("JSON", "*.json")])
+            if not ruta:
+                return
+            try:
+                REGISTRO.volcar_json(ruta)
+                messagebox.showinfo("Éxito", f"Métricas exportadas a {ruta}")
+            except OSError as e:
+                messagebox.showerror("Error", f"No se pudieron exportar las métricas: {e}")
+        
+        for texto, comando, color in (("🔄 Actualizar", actualizar_tabla, self.colors['secondary']),
+                                      ("🗑️ Reiniciar", reiniciar, self.colors['danger']),
+                                      ("💾 Exportar JSON", exportar_json, self.colors['success'])):
+            tk.Button(controles_frame,
+                     text=texto,
+                     command=comando,
+                     bg=color,
+                     fg='white',
+                     font=('Segoe UI', 10, 'bold'),
+                     relief='flat',
+                     padx=15,
+                     cursor='hand2').pack(side='right', padx=5)
+        
+        self.registrar_refresco('diagnostico', actualizar_tabla)
+        actualizar_tabla()
 
 
-def main():
+def main(argv=None):
     """Función principal"""
+    parser = argparse.ArgumentParser(description="Sistema de Control Escolar")
+    parser.add_argument('--servidor', help="URL de un servidor de control_escolar.servidor "
+                                           "(p. ej. http://127.0.0.1:8765) en lugar del archivo local")
+    args = parser.parse_args(argv)
+
     root = tk.Tk()
-    app = SistemaEscolarGUI(root)
+    app = SistemaEscolarGUI(root, servidor=args.servidor)
     root.mainloop()
 
 
@@ -0,0 +1,32 @@
+"""
+Fixtures comunes de las pruebas del paquete control_escolar
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from control_escolar import SistemaControlEscolar  # noqa: E402
+
+
+@pytest.fixture
+def ruta_datos(tmp_path):
+    return str(tmp_path / "datos.json")
+
+
+@pytest.fixture
+def sistema(ruta_datos):
+    """Sistema con una materia, un docente, tres alumnos en 1° A y uno en 2° B"""
+    s = SistemaControlEscolar(ruta_datos)
+    with s.escritura_diferida():
+        s.agregar_materia("M1", "Matemáticas", "1")
+        s.agregar_materia("M2", "Español", "1")
+        s.agregar_docente("Eva", "Ruiz", "1980-01-01", "555", "E1", "Matemáticas", "eva@escuela.mx")
+        s.agregar_docente("Luis", "Paz", "1982-01-01", "556", "E2", "Español", "luis@escuela.mx")
+        for matricula in ("A1", "A2", "A3"):
+            s.dar_alta_alumno("Ana", matricula, "2010-01-01", "555", matricula, "1", "A")
+        s.dar_alta_alumno("Beto", "B1", "2009-01-01", "555", "B1", "2", "B")
+    return s
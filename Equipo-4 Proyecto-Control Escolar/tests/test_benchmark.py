@@ -0,0 +1,48 @@
+"""
+Pruebas de humo de las mediciones con datos sintéticos
+"""
+
+import pytest
+
+from control_escolar import SistemaControlEscolar
+from control_escolar.benchmark import comparar_carga, generar_datos, reporte_memoria
+
+
+@pytest.fixture
+def archivo_sintetico(tmp_path):
+    ruta = str(tmp_path / "sintetico.json")
+    conteo = generar_datos(ruta, alumnos=30, docentes=5, materias=6, calificaciones=200,
+                           horarios=20)
+    assert conteo == {'alumnos': 30, 'docentes': 5, 'materias': 6, 'calificaciones': 200,
+                      'horarios': 20}
+    return ruta
+
+
+def test_archivo_sintetico_se_carga(archivo_sintetico):
+    sistema = SistemaControlEscolar(archivo_sintetico)
+    assert len(sistema.alumnos) == 30
+    assert len(sistema.calificaciones) == 200
+
+
+def test_reporte_memoria(archivo_sintetico):
+    reporte = reporte_memoria(archivo_sintetico, muestra=50)
+
+    assert set(reporte) == {'alumnos', 'docentes', 'materias', 'calificaciones', 'horarios',
+                            'calificaciones (tabla)'}
+    assert reporte['alumnos']['registros'] == 30
+    assert reporte['calificaciones']['registros'] == 50
+    for fila in reporte.values():
+        assert fila['antes_bytes_por_registro'] > 0
+        assert fila['despues_bytes_por_registro'] > 0
+        assert fila['ahorro'] < 1
+
+
+def test_comparar_carga(archivo_sintetico):
+    reporte = comparar_carga(archivo_sintetico, repeticiones=1)
+
+    assert {nombre: fila['registros'] for nombre, fila in reporte.items()} == {
+        'alumnos': 30, 'docentes': 5, 'materias': 6, 'calificaciones': 200, 'horarios': 20}
+    for fila in reporte.values():
+        assert fila['por_registro_por_s'] > 0
+        assert fila['en_bloque_por_s'] > 0
+        assert fila['aceleracion'] > 0
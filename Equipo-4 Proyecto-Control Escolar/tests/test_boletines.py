@@ -0,0 +1,77 @@
+"""
+Pruebas de la exportación por lotes de boletines
+"""
+
+import csv
+import os
+
+import pytest
+
+from control_escolar import boletines
+from control_escolar.boletines import exportar_boletines
+
+
+def test_exportar_boletines_de_un_grupo(sistema, tmp_path):
+    sistema.registrar_calificacion("A1", "M1", "2024-1", 90)
+    sistema.registrar_calificacion("A1", "M2", "2024-1", 50)
+    sistema.dar_baja_alumno("A3")
+    directorio = str(tmp_path / "boletines")
+
+    resumen = exportar_boletines(sistema, directorio, grado="1", grupo="A",
+                                 procesos=2, tamano_particion=1)
+
+    assert (resumen['alumnos'], resumen['archivos']) == (2, 4)
+    assert sorted(os.listdir(directorio)) == [
+        "boletin_A1.csv", "boletin_A1.html", "boletin_A2.csv", "boletin_A2.html"]
+    assert resumen['bytes'] == sum(os.path.getsize(os.path.join(directorio, n))
+                                   for n in os.listdir(directorio))
+    with open(os.path.join(directorio, "boletin_A1.csv"), encoding='utf-8') as f:
+        filas = list(csv.DictReader(f))
+    assert [(f['materia_id'], f['estado']) for f in filas] == [
+        ("M1", "Aprobado"), ("M2", "Reprobado"), ("", "Aprobado")]
+
+
+def test_los_procesos_arman_los_boletines(sistema, tmp_path, monkeypatch):
+    sistema.registrar_calificacion("B1", "M1", "2024-1", 70)
+    datos = sistema.instantanea()
+    monkeypatch.setattr(boletines, '_DATOS_PROCESO', None)
+    boletines._iniciar_proceso(dict(datos.alumnos), dict(datos.materias),
+                               datos.almacen_calificaciones)
+    # Lo registrado después de la instantánea no llega a los procesos
+    sistema.registrar_calificacion("B1", "M1", "2024-2", 90)
+
+    resultado = boletines._exportar_particion([("B1", "boletin_B1")], str(tmp_path), ['csv'], "hoy")
+
+    assert resultado[:2] == (1, 1)
+    with open(tmp_path / "boletin_B1.csv", encoding='utf-8') as f:
+        filas = list(csv.DictReader(f))
+    assert [(f['semestre'], f['calificacion']) for f in filas] == [
+        ("2024-1", "70.0"), ("", "70.0")]
+
+
+def test_matriculas_con_el_mismo_nombre_de_archivo(sistema, tmp_path):
+    for matricula in ("A/1", "A_1", "a_1"):
+        sistema.dar_alta_alumno("Ana", matricula, "2010-01-01", "555", matricula, "3", "C")
+    directorio = str(tmp_path / "boletines")
+
+    resumen = exportar_boletines(sistema, directorio, formatos=['csv'], grado="3",
+                                 procesos=2, tamano_particion=1)
+
+    assert resumen['archivos'] == 3
+    matriculas = {}
+    for nombre in os.listdir(directorio):
+        with open(os.path.join(directorio, nombre), encoding='utf-8') as f:
+            matriculas[nombre] = next(csv.DictReader(f))['matricula']
+    assert matriculas == {"boletin_A_1.csv": "A_1", "boletin_a_1_2.csv": "a_1",
+                          "boletin_A_1_3.csv": "A/1"}
+
+
+def test_exportar_no_guarda_boletines_en_el_sistema(sistema, tmp_path):
+    exportar_boletines(sistema, str(tmp_path), procesos=1)
+
+    assert sistema._boletines == {}
+
+
+def test_formatos_invalidos(sistema, tmp_path):
+    with pytest.raises(ValueError):
+        exportar_boletines(sistema, str(tmp_path), formatos=['pdf'])
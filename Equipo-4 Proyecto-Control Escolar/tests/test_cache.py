@@ -0,0 +1,57 @@
+"""
+Pruebas de la caché de consultas con generaciones por entidad
+"""
+
+import pytest
+
+from control_escolar.cache import CacheConsultas
+
+
+def test_lru_respeta_la_capacidad():
+    cache = CacheConsultas(['alumnos'], capacidad=2)
+    cache.obtener('a', ('alumnos',), lambda: 1)
+    cache.obtener('b', ('alumnos',), lambda: 2)
+    cache.obtener('a', ('alumnos',), lambda: None)  # 'a' pasa a ser la más reciente
+    cache.obtener('c', ('alumnos',), lambda: 3)
+
+    assert cache.obtener('a', ('alumnos',), lambda: 'nuevo') == 1
+    assert cache.obtener('b', ('alumnos',), lambda: 'nuevo') == 'nuevo'
+    assert cache.estadisticas()['entradas'] == 2
+
+
+def test_invalidar_solo_afecta_a_sus_dependientes():
+    cache = CacheConsultas(['alumnos', 'materias'])
+    cache.obtener('a', ('alumnos',), lambda: 1)
+    cache.obtener('m', ('materias',), lambda: 1)
+    cache.invalidar('alumnos')
+
+    assert cache.obtener('a', ('alumnos',), lambda: 2) == 2
+    assert cache.obtener('m', ('materias',), lambda: 2) == 1
+    assert cache.estadisticas()['aciertos'] == 1
+
+
+def test_sistema_invalida_al_modificar(sistema):
+    assert [a.matricula for a in sistema.obtener_alumnos_por_grupo("1", "A")] == ["A1", "A2", "A3"]
+    sistema.dar_alta_alumno("Ana", "A4", "2010-01-01", "555", "A4", "1", "A")
+    assert [a.matricula for a in sistema.obtener_alumnos_por_grupo("1", "A")] == ["A1", "A2", "A3", "A4"]
+
+
+def test_listas_en_copia_y_diccionarios_de_solo_lectura(sistema):
+    sistema.registrar_calificacion("A1", "M1", "2024-1", 90)
+
+    lista = sistema.obtener_alumnos_por_grupo("1", "A")
+    lista.clear()
+    assert len(sistema.obtener_alumnos_por_grupo("1", "A")) == 3
+
+    estadisticas = sistema.estadisticas_calificaciones('materia')
+    with pytest.raises(TypeError):
+        estadisticas["M1"]['promedio'] = 0
+    with pytest.raises(TypeError):
+        estadisticas["M2"] = {}
+    # Un acierto devuelve la misma vista, sin copiarla
+    assert sistema.estadisticas_calificaciones('materia') is estadisticas
+    assert estadisticas["M1"]['promedio'] == 90
+    assert dict(estadisticas["M1"])['cantidad'] == 1
+
+    sistema.registrar_calificacion("A2", "M1", "2024-1", 70)
+    assert sistema.estadisticas_calificaciones('materia')["M1"]['promedio'] == 80
@@ -0,0 +1,94 @@
+"""
+Pruebas del almacén columnar de calificaciones
+"""
+
+import pytest
+
+from control_escolar.columnar import AlmacenCalificaciones
+
+
+def registro(id, matricula, materia, semestre, calificacion, fecha="2024-01-01 08:00:00"):
+    return {'id': id, 'matricula_alumno': matricula, 'materia_id': materia, 'semestre': semestre,
+            'calificacion': calificacion, 'fecha_registro': fecha}
+
+
+def longitudes(almacen):
+    return {len(almacen.col_alumno), len(almacen.col_materia), len(almacen.col_semestre),
+            len(almacen.col_calificacion), len(almacen.col_fecha), len(almacen.ids)}
+
+
+@pytest.mark.parametrize('malo', ["abc", None, object()])
+def test_agregar_invalido_no_deja_fila_a_medias(malo):
+    almacen = AlmacenCalificaciones()
+    almacen.agregar(None, "X", "M1", "Y", 80)
+    with pytest.raises((ValueError, TypeError)):
+        almacen.agregar(None, "Z", "M1", "Q", malo)
+
+    assert longitudes(almacen) == {1}
+    assert almacen.siguiente_id == 2
+    assert not almacen.existe("Z", "M1", "Q")
+    assert len(almacen.filas_de_alumno("Z")) == 0
+
+    fila = almacen.agregar(None, "Z", "M1", "S", 90)
+    calificacion = almacen.vista(fila)
+    assert (calificacion.matricula_alumno, calificacion.semestre, calificacion.calificacion) == ("Z", "S", 90.0)
+    assert calificacion.id == 2
+
+
+def test_cargar_invalido_no_deja_fila_a_medias():
+    almacen = AlmacenCalificaciones()
+    almacen.cargar([registro(1, "X", "M1", "Y", 80)])
+    with pytest.raises(ValueError):
+        almacen.cargar([registro(2, "W", "M1", "T", "x")])
+    assert longitudes(almacen) == {1}
+    assert len(almacen.filas_de_alumno("W")) == 0
+
+
+def test_ids_de_texto_se_migran_y_se_pueden_buscar():
+    almacen = AlmacenCalificaciones()
+    almacen.cargar([registro("X_M1_Y_20240101080000", "X", "M1", "Y", 80),
+                    registro(5, "X", "M2", "Y", 60)])
+
+    assert sorted(almacen) == [5, 6]
+    assert almacen.siguiente_id == 7
+    migrada = almacen["X_M1_Y_20240101080000"]
+    assert migrada.id == 6
+    assert migrada.to_dict()['id_externo'] == "X_M1_Y_20240101080000"
+
+
+def test_a_dicts_y_cargar_conservan_los_datos():
+    almacen = AlmacenCalificaciones()
+    almacen.agregar(None, "X", "M1", "Y", 80, "2024-01-01 08:00:00")
+    almacen.agregar(None, "Z", "M1", "Y", 65.5, "fecha libre")
+    copia = AlmacenCalificaciones()
+    copia.cargar(almacen.a_dicts())
+    assert list(copia.a_dicts()) == list(almacen.a_dicts())
+    assert copia.siguiente_id == almacen.siguiente_id
+
+
+def test_estadisticas_por_materia_y_semestre():
+    almacen = AlmacenCalificaciones()
+    for matricula, materia, semestre, valor in [("A", "M1", "S1", 80), ("B", "M1", "S1", 60),
+                                                ("A", "M2", "S2", 90)]:
+        almacen.agregar(None, matricula, materia, semestre, valor)
+
+    por_materia = almacen.estadisticas_por('materia')
+    assert por_materia['M1']['cantidad'] == 2
+    assert por_materia['M1']['promedio'] == 70
+    assert por_materia['M1']['aprobados'] == 1
+    assert set(almacen.estadisticas_por('semestre', materia_id='M2')) == {'S2'}
+    with pytest.raises(ValueError):
+        almacen.estadisticas_por('nada')
+
+
+def test_columna_numpy_no_bloquea_la_tabla():
+    np = pytest.importorskip("numpy")
+    almacen = AlmacenCalificaciones()
+    almacen.agregar(None, "A", "M1", "S1", 80)
+    columna = almacen._columna_numpy(almacen.col_calificacion, np.float64)
+
+    # Con una vista del búfer vivo, agrandar la columna lanzaría BufferError
+    for i in range(1000):
+        almacen.agregar(None, f"A{i}", "M1", "S1", 70)
+    assert list(columna) == [80.0]
+    assert almacen.estadisticas_por('materia')['M1']['cantidad'] == 1001
@@ -0,0 +1,49 @@
+"""
+Pruebas del bus de eventos de cambio
+"""
+
+from control_escolar.eventos import AGREGADO, LOTE, MODIFICADO, BusEventos, EventoCambio
+
+
+def test_filtro_por_entidad_y_cancelar():
+    bus = BusEventos()
+    todos, alumnos = [], []
+    bus.suscribir(todos.append)
+    suscripcion = bus.suscribir(alumnos.append, entidades=['alumnos'])
+
+    bus.publicar(EventoCambio('alumnos', 'A1', despues=1))
+    bus.publicar(EventoCambio('materias', 'M1', despues=1))
+    bus.cancelar(suscripcion)
+    bus.publicar(EventoCambio('alumnos', 'A2', despues=1))
+
+    assert [e.clave for e in todos] == ['A1', 'M1', 'A2']
+    assert [e.clave for e in alumnos] == ['A1']
+
+
+def test_error_de_un_suscriptor_no_detiene_a_los_demas(capsys):
+    bus = BusEventos()
+    recibidos = []
+
+    def falla(evento):
+        raise RuntimeError("fallo")
+
+    bus.suscribir(falla)
+    bus.suscribir(recibidos.append)
+    bus.publicar(EventoCambio('alumnos', 'A1', despues=1))
+
+    assert len(recibidos) == 1
+    assert "fallo" in capsys.readouterr().out
+
+
+def test_sistema_publica_altas_bajas_y_lotes(sistema):
+    eventos = []
+    sistema.eventos.suscribir(eventos.append, entidades=['alumnos'])
+
+    sistema.dar_alta_alumno("Ana", "A4", "2010-01-01", "555", "A4", "1", "A")
+    sistema.dar_baja_alumno("A4")
+    sistema.dar_alta_alumnos([{'nombre': "Eli", 'apellido': "Mora", 'fecha_nacimiento': "2010-01-01",
+                               'telefono': "555", 'matricula': "A5", 'grado': "1", 'grupo': "A"}])
+
+    assert [(e.accion, e.clave) for e in eventos] == [(AGREGADO, "A4"), (MODIFICADO, "A4"), (LOTE, None)]
+    assert eventos[1].antes.activo and not eventos[1].despues.activo
+    assert [a.matricula for a in eventos[2].despues] == ["A5"]
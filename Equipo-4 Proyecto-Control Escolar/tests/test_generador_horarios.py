@@ -0,0 +1,65 @@
+"""
+Pruebas del generador automático de horarios
+"""
+
+from control_escolar.generador_horarios import generar_horarios
+
+
+HORAS = {"M1": 3, "M2": 2}
+DOCENTES = {"M1": "E1", "M2": "E2"}
+AULAS = ["A1", "A2"]
+
+
+def sesiones_por_materia(sistema, grado="1", grupo="A"):
+    conteo = {}
+    for h in sistema.obtener_horarios_por_grupo(grado, grupo):
+        conteo[h.materia_id] = conteo.get(h.materia_id, 0) + 1
+    return conteo
+
+
+def test_genera_sin_empalmes(sistema):
+    resultado = generar_horarios(sistema, HORAS, DOCENTES, AULAS)
+    assert resultado.completo
+    assert len(resultado.horarios) == 5
+    assert resultado.aplicar(sistema) == []
+    assert sesiones_por_materia(sistema) == HORAS
+    assert sistema.auditar_conflictos_horarios() == []
+
+
+def test_generar_dos_veces_no_repite_ids_ni_excede_horas(sistema):
+    generar_horarios(sistema, HORAS, DOCENTES, AULAS).aplicar(sistema)
+
+    # Sin cambios en las horas no queda nada por generar
+    assert generar_horarios(sistema, HORAS, DOCENTES, AULAS).horarios == []
+
+    mas_horas = {"M1": 4, "M2": 3}
+    segundo = generar_horarios(sistema, mas_horas, DOCENTES, AULAS)
+    ids = [h.id for h in segundo.horarios]
+    assert len(ids) == 2
+    assert not set(ids) & set(sistema.horarios)
+    assert segundo.aplicar(sistema) == []
+    assert sesiones_por_materia(sistema) == mas_horas
+
+
+def test_respeta_horarios_existentes(sistema):
+    # Una sesión doble ya registrada cuenta como dos horas de M1
+    sistema.agregar_horario("H1", "M1", "E1", "1", "A", "LUNES", "07:00", "09:00", "A1")
+    resultado = generar_horarios(sistema, HORAS, DOCENTES, AULAS)
+    assert [h.materia_id for h in resultado.horarios].count("M1") == 1
+    assert resultado.aplicar(sistema) == []
+    assert sistema.auditar_conflictos_horarios() == []
+
+
+def test_dias_en_minusculas_respetan_horarios_existentes(sistema):
+    sistema.agregar_horario("H1", "M1", "E1", "1", "A", "LUNES", "07:00", "09:00", "A1")
+    resultado = generar_horarios(sistema, HORAS, DOCENTES, AULAS, dias=["lunes", " Martes "],
+                                 franjas=[("07:00", "08:00"), ("08:00", "09:00"), ("09:00", "10:00")])
+    assert {h.dia for h in resultado.horarios} <= {"LUNES", "MARTES"}
+    assert resultado.aplicar(sistema) == []
+    assert sistema.auditar_conflictos_horarios() == []
+
+
+def test_sin_docente_se_reporta(sistema):
+    resultado = generar_horarios(sistema, {"M1": 1}, {}, AULAS)
+    assert resultado.horarios == []
+    assert resultado.no_asignadas == [("1", "A", "M1", "Sin docente asignado")]
@@ -0,0 +1,86 @@
+"""
+Pruebas del índice de empalmes de horarios
+"""
+
+import random
+from itertools import accumulate
+
+import pytest
+
+from control_escolar.horarios import IndiceHorarios, hora_a_minutos
+from control_escolar.modelos import Horario
+
+
+def horario(id, inicio, fin, dia="LUNES", docente="E1", aula="A1", grupo=("1", "A")):
+    return Horario(id, "M1", docente, grupo[0], grupo[1], dia, inicio, fin, aula)
+
+
+def a_hora(minutos):
+    return f"{minutos // 60:02d}:{minutos % 60:02d}"
+
+
+def test_hora_a_minutos():
+    assert hora_a_minutos("07:30") == 450
+    assert hora_a_minutos(" 7:30 ") == 450
+    for invalida in ("25:00", "7h", "12:60", "x10:00y", "10:000", "110:00"):
+        with pytest.raises(ValueError):
+            hora_a_minutos(invalida)
+
+
+def test_vecinos_inmediatos():
+    indice = IndiceHorarios()
+    indice.agregar(horario("H1", "08:00", "09:00"))
+    assert indice.conflictos(horario("N", "09:00", "10:00")) == []
+    assert indice.conflictos(horario("N", "07:00", "08:00")) == []
+    assert indice.conflictos(horario("N", "08:30", "09:30"))
+    assert indice.conflictos(horario("N", "08:00", "09:00", dia="MARTES")) == []
+    tipos = {tipo for tipo, _, _ in indice.conflictos(horario("N", "08:00", "09:00", aula="B2",
+                                                              grupo=("2", "B")))}
+    assert tipos == {'docente'}
+
+
+def test_empalme_con_intervalo_largo_ya_empalmado():
+    # Datos cargados con A 8-12 y B 9-10 ya empalmados: 11:00-11:30 choca con A
+    indice = IndiceHorarios()
+    indice.agregar(horario("A", "08:00", "12:00"))
+    indice.agregar(horario("B", "09:00", "10:00"))
+    assert ('docente', 'E1', 'A') in indice.conflictos(horario("N", "11:00", "11:30"))
+    assert indice.conflictos(horario("N", "12:00", "13:00")) == []
+    assert len(indice.auditar()) == 3  # docente, aula y grupo
+
+
+def test_conflictos_coincide_con_fuerza_bruta():
+    aleatorio = random.Random(7)
+    for _ in range(500):
+        indice = IndiceHorarios()
+        intervalos = []
+        for k in range(aleatorio.randint(0, 8)):
+            inicio = aleatorio.randint(28, 60) * 15
+            fin = inicio + aleatorio.randint(1, 12) * 15
+            intervalos.append((inicio, fin))
+            indice.agregar(horario(str(k), a_hora(inicio), a_hora(fin)))
+        inicio = aleatorio.randint(28, 60) * 15
+        fin = inicio + aleatorio.randint(1, 12) * 15
+        esperado = any(i < fin and inicio < f for i, f in intervalos)
+        assert bool(indice.conflictos(horario("N", a_hora(inicio), a_hora(fin)))) == esperado
+
+
+def test_fines_maximos_se_mantienen_al_insertar():
+    aleatorio = random.Random(11)
+    indice = IndiceHorarios()
+    for k in range(300):
+        inicio = aleatorio.randint(28, 80) * 15
+        indice.agregar(horario(str(k), a_hora(inicio), a_hora(inicio + aleatorio.randint(1, 16) * 15)))
+        for clave, lista in indice.intervalos.items():
+            assert indice.fines_maximos[clave] == list(accumulate((f for _, f, _ in lista), max))
+
+
+def test_agregar_horario_rechaza_empalmes(sistema):
+    assert sistema.agregar_horario("H1", "M1", "E1", "1", "A", "LUNES", "08:00", "10:00", "A1")[0]
+    exito, mensaje = sistema.agregar_horario("H2", "M2", "E2", "1", "A", "LUNES", "09:00", "11:00", "A2")
+    assert not exito
+    assert "grupo" in mensaje
+    assert not sistema.agregar_horario("H3", "M1", "E1", "1", "A", "LUNES", "10:00", "09:00", "A1")[0]
+    assert not sistema.agregar_horario("H1", "M1", "E1", "1", "B", "MARTES", "08:00", "09:00", "A1")[0]
+    assert sistema.agregar_horario("H2", "M2", "E2", "1", "A", "LUNES", "10:00", "11:00", "A2")[0]
+    assert sistema.auditar_conflictos_horarios() == []
@@ -0,0 +1,63 @@
+"""
+Pruebas de la importación masiva desde CSV
+"""
+
+from control_escolar.importacion import importar_csv
+
+
+def escribir_csv(tmp_path, nombre, texto):
+    ruta = tmp_path / nombre
+    ruta.write_text(texto, encoding='utf-8')
+    return str(ruta)
+
+
+def test_importar_alumnos_con_errores_por_linea(sistema, tmp_path):
+    ruta = escribir_csv(tmp_path, "alumnos.csv",
+                        "nombre,apellido,fecha_nacimiento,telefono,matricula,grado,grupo\n"
+                        "Ana,Luz,2010-01-01,1,N1,1,A\n"
+                        "Ana,Luz,2010-01-01,1,N1,1,A\n"
+                        "Ana,Luz,2010-01-01,1,A1,1,A\n"
+                        ",Luz,2010-01-01,1,N3,1,A\n"
+                        "Bo,Mar,2010-01-01,1,N2,1,B\n")
+    resultado = importar_csv(sistema, 'alumnos', ruta)
+
+    assert resultado.importados == 2
+    assert [linea for linea, _ in resultado.errores] == [3, 4, 5]
+    assert "repetida" in resultado.errores[0][1]
+    assert "Ya existe" in resultado.errores[1][1]
+    assert {"N1", "N2"} <= set(sistema.alumnos)
+    assert "N3" not in sistema.alumnos
+
+
+def test_importar_calificaciones_valida_rango_y_duplicados(sistema, tmp_path):
+    sistema.registrar_calificacion("A3", "M1", "2024-1", 90)
+    ruta = escribir_csv(tmp_path, "califs.csv",
+                        "matricula,materia_id,semestre,calificacion\n"
+                        "A1,M1,2024-1,80\n"
+                        "A1,M1,2024-1,81\n"
+                        "A2,M1,2024-1,abc\n"
+                        "A2,M1,2024-1,101\n"
+                        "A3,M1,2024-1,70\n"
+                        "ZZ,M1,2024-1,70\n"
+                        "A2,M1,2024-1,nan\n")
+    resultado = importar_csv(sistema, 'calificaciones', ruta)
+
+    assert resultado.importados == 1
+    assert [linea for linea, _ in resultado.errores] == [3, 4, 5, 6, 7, 8]
+    assert [c.calificacion for c in sistema.obtener_calificaciones_alumno("A1")] == [80.0]
+    assert sistema.obtener_calificaciones_alumno("A2") == []
+
+
+def test_solo_validar_no_modifica(sistema, tmp_path):
+    ruta = escribir_csv(tmp_path, "materias.csv", "id,nombre,grado\nM9,Arte,1\n")
+    resultado = importar_csv(sistema, 'materias', ruta, solo_validar=True)
+    assert resultado.importados == 1
+    assert "M9" not in sistema.materias
+
+
+def test_faltan_columnas(sistema, tmp_path):
+    ruta = escribir_csv(tmp_path, "docentes.csv", "nombre,apellido\nA,B\n")
+    resultado = importar_csv(sistema, 'docentes', ruta)
+    assert resultado.importados == 0
+    assert resultado.errores[0][0] == 1
+    assert "Faltan columnas" in resultado.errores[0][1]
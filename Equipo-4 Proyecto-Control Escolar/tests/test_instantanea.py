@@ -0,0 +1,43 @@
+"""
+Pruebas de las instantáneas de solo lectura (copia al escribir)
+"""
+
+import pytest
+
+from control_escolar.reportes import reporte_rendimiento
+
+
+def test_instantanea_no_ve_cambios_posteriores(sistema):
+    sistema.registrar_calificacion("A1", "M1", "2024-1", 90)
+    foto = sistema.instantanea()
+
+    sistema.dar_alta_alumno("Ana", "A4", "2010-01-01", "555", "A4", "1", "A")
+    sistema.dar_baja_alumno("A2")
+    sistema.registrar_calificacion("A3", "M1", "2024-1", 50)
+
+    assert "A4" not in foto.alumnos
+    assert foto.alumnos["A2"].activo
+    assert not sistema.alumnos["A2"].activo
+    assert len(foto.calificaciones) == 1
+    assert reporte_rendimiento(foto, materia_id="M1")['cantidad'] == 1
+    assert reporte_rendimiento(sistema, materia_id="M1")['cantidad'] == 2
+    assert len(foto.exportar_datos()['alumnos']) == 4
+
+
+def test_instantanea_es_de_solo_lectura(sistema):
+    foto = sistema.instantanea()
+
+    with pytest.raises(TypeError):
+        foto.alumnos["X"] = None
+    with pytest.raises(TypeError):
+        foto.almacen_calificaciones.agregar(None, "A1", "M1", "2024-1", 80)
+
+
+def test_sin_instantanea_no_se_copia(sistema):
+    alumnos = sistema.alumnos
+    sistema.dar_alta_alumno("Ana", "A4", "2010-01-01", "555", "A4", "1", "A")
+    assert sistema.alumnos is alumnos
+
+    sistema.instantanea()
+    sistema.dar_alta_alumno("Ana", "A5", "2010-01-01", "555", "A5", "1", "A")
+    assert sistema.alumnos is not alumnos
@@ -0,0 +1,50 @@
+"""
+Pruebas de la instrumentación de tiempos
+"""
+
+import json
+
+import pytest
+
+from control_escolar.instrumentacion import LIMITES_MS, REGISTRO, Instrumentacion
+
+
+def test_histograma_y_percentiles():
+    registro = Instrumentacion(activo=True)
+    for ms in (0.2, 0.3, 0.4, 20):
+        registro.registrar("op", ms / 1000)
+
+    fila, = registro.resumen()
+    assert fila['operacion'] == "op"
+    assert fila['llamadas'] == 4
+    assert fila['maximo_ms'] == pytest.approx(20)
+    assert fila['p50_ms'] == 0.5
+    assert fila['p95_ms'] == 50
+    assert sum(c['llamadas'] for c in fila['histograma']) == 4
+    assert len(fila['histograma']) == len(LIMITES_MS) + 1
+
+
+def test_volcar_json(tmp_path):
+    registro = Instrumentacion(activo=True)
+    registro.registrar("op", 0.001)
+    ruta = tmp_path / "metricas.json"
+    registro.volcar_json(str(ruta))
+
+    with open(ruta, encoding='utf-8') as f:
+        assert json.load(f)['operaciones'][0]['llamadas'] == 1
+
+
+def test_sistema_instrumentado_solo_si_esta_activo(sistema):
+    activo = REGISTRO.activo
+    REGISTRO.reiniciar()
+    try:
+        REGISTRO.desactivar()
+        sistema.buscar_alumnos("A")
+        assert REGISTRO.resumen() == []
+
+        REGISTRO.activar()
+        sistema.buscar_alumnos("A")
+        assert [f['operacion'] for f in REGISTRO.resumen()] == ["sistema.buscar_alumnos"]
+    finally:
+        REGISTRO.activo = activo
+        REGISTRO.reiniciar()
@@ -0,0 +1,44 @@
+"""
+Pruebas de los mapas de bits de ocupación semanal
+"""
+
+import pytest
+
+from control_escolar.ocupacion import mascara_intervalo
+
+
+def test_mascara_intervalo():
+    assert mascara_intervalo("LUNES", "09:00", "08:00") == 0
+    lunes = mascara_intervalo("lunes", "08:00", "09:00")
+    assert lunes & mascara_intervalo("LUNES", "08:30", "10:00")
+    assert not lunes & mascara_intervalo("LUNES", "09:00", "10:00")
+    assert not lunes & mascara_intervalo("MARTES", "08:00", "09:00")
+
+
+def test_dias_sin_acento_y_dias_invalidos():
+    assert mascara_intervalo("miercoles", "08:00", "09:00") == mascara_intervalo("MIÉRCOLES", "08:00", "09:00")
+    assert mascara_intervalo(" Sabado ", "08:00", "09:00") == mascara_intervalo("SÁBADO", "08:00", "09:00")
+    with pytest.raises(ValueError):
+        mascara_intervalo("FERIADO", "08:00", "09:00")
+
+
+def test_horario_sin_acento_ocupa_el_mismo_dia(sistema):
+    assert sistema.agregar_horario("H1", "M1", "E1", "1", "A", "miercoles", "08:00", "10:00", "A1")[0]
+    assert sistema.horarios["H1"].dia == "MIÉRCOLES"
+    assert sistema.aulas_libres("MIÉRCOLES", "09:00", "09:30", ["A1", "A2"]) == ["A2"]
+    assert not sistema.agregar_horario("H2", "M2", "E2", "1", "A", "Miércoles", "09:00", "11:00", "A2")[0]
+    assert not sistema.agregar_horario("H3", "M2", "E2", "1", "A", "FERIADO", "09:00", "11:00", "A2")[0]
+    with pytest.raises(ValueError):
+        sistema.franjas_libres_comunes(docentes=["E1"], dias=["FERIADO"])
+
+
+def test_aulas_docentes_y_franjas_libres(sistema):
+    sistema.agregar_horario("H1", "M1", "E1", "1", "A", "LUNES", "08:00", "10:00", "a1")
+    sistema.agregar_horario("H2", "M2", "E2", "2", "B", "LUNES", "09:00", "11:00", "A2")
+
+    assert sistema.aulas_libres("LUNES", "08:00", "09:00") == ["A2"]
+    assert sistema.aulas_libres("LUNES", "11:00", "12:00") == ["A1", "A2"]
+    assert [d.num_empleado for d in sistema.docentes_libres("LUNES", "09:30", "10:00")] == []
+    assert [d.num_empleado for d in sistema.docentes_libres("LUNES", "10:00", "11:00")] == ["E1"]
+    assert sistema.franjas_libres_comunes(docentes=["E1", "E2"], dias=["LUNES"]) == [
+        ("LUNES", "07:00", "08:00"), ("LUNES", "11:00", "20:00")]
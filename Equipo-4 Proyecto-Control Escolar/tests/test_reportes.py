@@ -0,0 +1,79 @@
+"""
+Pruebas del reporte de rendimiento y de los rankings
+"""
+
+import pytest
+
+from control_escolar.reportes import percentil, reporte_rendimiento
+
+
+def test_percentil_interpola():
+    assert percentil([10, 20, 30, 40], 50) == 25
+    assert percentil([10], 95) == 10
+    assert percentil([], 50) == 0.0
+
+
+def test_reporte_y_rankings(sistema):
+    for matricula, valor in (("A1", 95), ("A2", 65), ("A3", 80)):
+        sistema.registrar_calificacion(matricula, "M1", "2024-1", valor)
+
+    reporte = reporte_rendimiento(sistema, semestre="2024-1", grado="1", grupo="A")
+    assert reporte['cantidad'] == 3
+    assert reporte['promedio'] == pytest.approx(80)
+    assert reporte['aprobados'] == 2
+    assert (reporte['minimo'], reporte['maximo']) == (65, 95)
+
+    assert [a.matricula for a, _ in sistema.top_alumnos("1", "A", n=2)] == ["A1", "A3"]
+    assert [a.matricula for a, _ in sistema.en_riesgo("M1", "2024-1", n=1)] == ["A2"]
+
+
+def _promedio(sistema, matricula, **filtros):
+    valores = [c.calificacion for c in sistema.obtener_calificaciones_alumno(matricula)
+               if all(getattr(c, campo) == valor for campo, valor in filtros.items())]
+    return sum(valores) / len(valores) if valores else None
+
+
+def test_rankings_coinciden_con_ordenar_todo(sistema):
+    # Empates en 90 (A4 y A6) y en 60 (A2 y A5); A7 se da de baja y A9 no tiene calificaciones
+    valores = {"A1": (80, 70), "A2": (60, 60), "A3": (100, 70), "A4": (90, 90), "A5": (60, 60),
+               "A6": (90, 90), "A7": (100, 40), "A8": (70, 50), "A9": None}
+    for matricula in ("A4", "A5", "A6", "A7", "A8", "A9"):
+        sistema.dar_alta_alumno("Ana", matricula, "2010-01-01", "555", matricula, "1", "A")
+    for matricula, par in valores.items():
+        if par:
+            sistema.registrar_calificacion(matricula, "M1", "2024-1", par[0])
+            sistema.registrar_calificacion(matricula, "M2", "2024-1", par[1])
+    sistema.registrar_calificacion("A7", "M1", "2024-2", 0)
+    sistema.registrar_calificacion("B1", "M1", "2024-1", 100)
+    sistema.dar_baja_alumno("A7")
+
+    activos = [a for a in sistema.alumnos.values() if a.activo]
+    top = sorted(((a, _promedio(sistema, a.matricula)) for a in activos
+                  if a.grado == "1" and a.grupo == "A" and _promedio(sistema, a.matricula) is not None),
+                 key=lambda par: par[1], reverse=True)
+    riesgo = sorted(((a, _promedio(sistema, a.matricula, materia_id="M1", semestre="2024-1"))
+                     for a in activos
+                     if _promedio(sistema, a.matricula, materia_id="M1", semestre="2024-1") is not None),
+                    key=lambda par: par[1])
+
+    for n in (1, 2, 3, 5, 8, 20):
+        assert [(a.matricula, p) for a, p in sistema.top_alumnos("1", "A", n=n)] == \
+            [(a.matricula, p) for a, p in top[:n]]
+        assert [(a.matricula, p) for a, p in sistema.en_riesgo("M1", "2024-1", n=n)] == \
+            [(a.matricula, p) for a, p in riesgo[:n]]
+
+    assert [a.matricula for a, _ in sistema.top_alumnos("1", "A", n=3)] == ["A4", "A6", "A3"]
+    assert [a.matricula for a, _ in sistema.en_riesgo("M1", "2024-1", n=3)] == ["A2", "A5", "A8"]
+
+
+def test_rankings_vacios(sistema):
+    assert sistema.top_alumnos("1", "A") == []
+    assert sistema.en_riesgo("M1", "2024-1") == []
+
+    sistema.registrar_calificacion("A1", "M1", "2024-1", 90)
+    assert sistema.top_alumnos("3", "Z") == []
+    assert sistema.en_riesgo("M2", "2024-1") == []
+    assert sistema.top_alumnos("1", "A", n=0) == []
+    sistema.dar_baja_alumno("A1")
+    assert sistema.top_alumnos("1", "A") == []
+    assert sistema.en_riesgo("M1", "2024-1") == []
@@ -0,0 +1,155 @@
+"""
+Pruebas del servidor HTTP con hilos y de su cliente
+"""
+
+import socket
+import threading
+
+import pytest
+
+from control_escolar import SistemaControlEscolar
+from control_escolar.servidor import (ClienteControlEscolar, ErrorPeticion, ServidorControlEscolar,
+                                      SistemaRemoto, _alta)
+
+
+@pytest.fixture
+def servidor(sistema):
+    s = ServidorControlEscolar(sistema, ('127.0.0.1', 0))
+    yield s
+    s.server_close()
+
+
+def test_rutas_desconocidas_y_metodos(servidor):
+    assert servidor.atender('GET', '/nada', {}, None)[0] == 404
+    assert servidor.atender('POST', '/grupos', {}, None)[0] == 405
+    assert servidor.atender('GET', '/alumnos/X9', {}, None)[0] == 404
+    assert servidor.atender('GET', '/reportes/top', {'grupo': "A"}, None)[0] == 400
+    assert servidor.atender('GET', '/reportes/top', {'grado': "1", 'grupo': "A", 'n': "x"}, None)[0] == 400
+    consulta = {'dia': "FERIADO", 'inicio': "08:00", 'fin': "09:00"}
+    assert servidor.atender('GET', '/disponibilidad/aulas', consulta, None)[0] == 400
+    consulta = {'dia': "LUNES", 'inicio': "8", 'fin': "09:00"}
+    assert servidor.atender('GET', '/disponibilidad/docentes', consulta, None)[0] == 400
+
+
+def test_estadisticas_con_agrupacion_invalida(servidor):
+    servidor.sistema.registrar_calificacion("A1", "M1", "2024-1", 90)
+    estado, respuesta = servidor.atender('GET', '/reportes/estadisticas', {'por': "planeta"}, None)
+    assert estado == 400 and 'error' in respuesta
+
+    estado, respuesta = servidor.atender('GET', '/reportes/estadisticas', {'por': "grupo"}, None)
+    assert estado == 200 and respuesta['datos']["1-A"]['cantidad'] == 1
+
+
+def test_altas_y_consultas(servidor):
+    alta = {'nombre': "Eli", 'apellido': "Mora", 'fecha_nacimiento': "2010-01-01",
+            'telefono': "555", 'matricula': "A4", 'grado': "1", 'grupo': "A"}
+    assert servidor.atender('POST', '/alumnos', {}, alta)[0] == 201
+    assert servidor.atender('POST', '/alumnos', {}, alta)[0] == 409
+    assert servidor.atender('POST', '/alumnos', {}, {'nombre': "Eli"})[0] == 400
+    assert servidor.atender('POST', '/alumnos', {}, [alta])[0] == 400
+
+    estado, respuesta = servidor.atender('GET', '/grupos/1/A/alumnos', {}, None)
+    assert estado == 200
+    assert [a['matricula'] for a in respuesta['datos']] == ["A1", "A2", "A3", "A4"]
+
+
+def test_campos_invalidos_frente_a_errores_del_sistema(sistema):
+    with pytest.raises(ErrorPeticion) as error:
+        _alta(sistema.agregar_materia, {'id': "M9", 'nivel': "1"})
+    assert error.value.estado == 400
+
+    def falla(id):
+        raise TypeError("error interno")
+
+    # Un TypeError dentro del método no se confunde con campos inválidos
+    with pytest.raises(TypeError):
+        _alta(falla, {'id': "M9"})
+
+
+def test_alta_por_lote(servidor):
+    lote = [{'nombre': "Eli", 'apellido': "Mora", 'fecha_nacimiento': "2010-01-01",
+             'telefono': "555", 'matricula': m, 'grado': "1", 'grupo': "A"} for m in ("N1", "A1", "N1")]
+    estado, respuesta = servidor.atender('POST', '/alumnos/lote', {}, lote)
+    assert estado == 201
+    assert respuesta['registrados'] == 1
+    assert sorted(respuesta['errores']) == [2, 3]
+
+    assert servidor.atender('POST', '/alumnos/lote', {}, lote[1:2])[0] == 409
+    assert servidor.atender('POST', '/alumnos/lote', {}, {'matricula': "N2"})[0] == 400
+
+
+def test_content_length_invalido(servidor):
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    try:
+        with socket.create_connection(servidor.server_address, timeout=5) as conexion:
+            conexion.sendall(b"POST /alumnos HTTP/1.1\r\nContent-Length: diez\r\n\r\n{}")
+            assert conexion.recv(1024).startswith(b"HTTP/1.1 400 Bad Request")
+    finally:
+        servidor.shutdown()
+        hilo.join()
+
+
+def test_cliente_contra_servidor_real(servidor):
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    try:
+        cliente = ClienteControlEscolar("http://127.0.0.1:%d" % servidor.server_address[1], tiempo_espera=5)
+        assert cliente.registrar_calificacion("A1", "M1", "2024-1", 90)[0]
+        assert not cliente.registrar_calificacion("A1", "M1", "2024-1", 90)[0]
+        assert cliente.obtener_promedio_alumno("A1") == 90
+        assert cliente.obtener_alumno("X9") is None
+        assert [a.matricula for a in cliente.obtener_alumnos_por_grupo("2", "B")] == ["B1"]
+        agregados, errores = cliente.dar_alta_alumnos([
+            {'nombre': "Eli", 'apellido': "Mora", 'fecha_nacimiento': "2010-01-01",
+             'telefono': "555", 'matricula': "A1", 'grado': "1", 'grupo': "A"}])
+        assert (agregados, errores) == (0, {1: "Ya existe un alumno con matrícula A1"})
+    finally:
+        servidor.shutdown()
+        hilo.join()
+
+
+def test_dos_replicas_comparten_el_sistema_del_servidor(servidor, ruta_datos):
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    try:
+        url = "http://127.0.0.1:%d" % servidor.server_address[1]
+        una, otra = SistemaRemoto(url, tiempo_espera=5), SistemaRemoto(url, tiempo_espera=5)
+        assert set(una.alumnos) == {"A1", "A2", "A3", "B1"}
+
+        assert una.dar_alta_alumno("Eli", "Mora", "2010-01-01", "555", "A4", "1", "A")[0]
+        assert not otra.dar_alta_alumno("Eli", "Mora", "2010-01-01", "555", "A4", "1", "A")[0]
+        assert "A4" in una.alumnos and "A4" in servidor.sistema.alumnos
+        # La réplica que falló no cambió hasta recargarse
+        assert "A4" not in otra.alumnos
+        otra.cargar_datos()
+        assert "A4" in otra.alumnos
+
+        registradas, errores = otra.registrar_calificaciones_grupo("1", "A", "M1", "2024-1",
+                                                                   {"A1": 90, "B1": 80})
+        assert (registradas, set(errores)) == (1, {"B1"})
+        assert otra.obtener_promedio_alumno("A1") == 90
+
+        # Solo el servidor escribe el archivo
+        otro = SistemaControlEscolar(ruta_datos)
+        assert "A4" in otro.alumnos and len(otro.calificaciones) == 1
+    finally:
+        servidor.shutdown()
+        hilo.join()
+
+
+def test_replica_agrupa_recargas_en_escritura_diferida(servidor):
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    try:
+        replica = SistemaRemoto("http://127.0.0.1:%d" % servidor.server_address[1], tiempo_espera=5)
+        recargas = []
+        replica.eventos.suscribir(recargas.append, entidades=['alumnos'])
+        with replica.escritura_diferida():
+            for matricula in ("N1", "N2", "N3"):
+                replica.dar_alta_alumno("Eli", "Mora", "2010-01-01", "555", matricula, "1", "A")
+        assert len(recargas) == 1
+        assert {"N1", "N2", "N3"} <= set(replica.alumnos)
+    finally:
+        servidor.shutdown()
+        hilo.join()
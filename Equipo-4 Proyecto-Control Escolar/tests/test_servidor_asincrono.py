@@ -0,0 +1,144 @@
+"""
+Pruebas del servidor asyncio con escrituras agrupadas
+"""
+
+import asyncio
+import json
+import time
+
+from control_escolar.servidor_asincrono import ServidorAsincrono
+
+
+def alta(matricula):
+    return {'nombre': "Eli", 'apellido': "Mora", 'fecha_nacimiento': "2010-01-01",
+            'telefono': "555", 'matricula': matricula, 'grado': "1", 'grupo': "A"}
+
+
+def ejecutar(sistema, prueba, ventana=0.01):
+    """Correr prueba(servidor) con el escritor iniciado y detenerlo al final"""
+    async def principal():
+        servidor = ServidorAsincrono(sistema, ventana=ventana)
+        red = await servidor.iniciar('127.0.0.1', 0)
+        try:
+            return await prueba(servidor, red.sockets[0].getsockname()[1])
+        finally:
+            await servidor.detener()
+            red.close()
+            await red.wait_closed()
+    return asyncio.run(principal())
+
+
+def contar_escrituras(sistema, fallar=0, espera=0):
+    """Reemplazar escribir_datos; las primeras `fallar` escrituras lanzan OSError"""
+    escrituras = []
+    original = sistema.escribir_datos
+
+    def escribir(datos, **kwargs):
+        escrituras.append(len(datos['alumnos']))
+        time.sleep(espera)
+        if len(escrituras) <= fallar:
+            raise OSError("disco lleno")
+        return original(datos, **kwargs)
+
+    sistema.escribir_datos = escribir
+    return escrituras
+
+
+def test_altas_concurrentes_se_guardan_en_un_lote(sistema):
+    escrituras = contar_escrituras(sistema)
+
+    async def prueba(servidor, puerto):
+        return await asyncio.gather(*(servidor.atender('POST', '/alumnos', alta(f"N{i}"))
+                                      for i in range(50)))
+
+    resultados = ejecutar(sistema, prueba)
+
+    assert [estado for estado, _ in resultados] == [201] * 50
+    assert escrituras == [54]
+
+
+def test_falla_al_escribir_responde_lo_aplicado(sistema, ruta_datos, capsys):
+    escrituras = contar_escrituras(sistema, fallar=1)
+
+    async def prueba(servidor, puerto):
+        primera = await servidor.atender('POST', '/alumnos', alta("N1"))
+        return primera, await servidor.atender('POST', '/alumnos', alta("N2"))
+
+    (estado, respuesta), segunda = ejecutar(sistema, prueba)
+
+    # La alta quedó aplicada: no se reporta como fallida sino con el error de guardado
+    assert estado == 201 and respuesta['ok']
+    assert "disco lleno" in respuesta['error_guardado']
+    assert segunda[0] == 201 and 'error_guardado' not in segunda[1]
+    assert escrituras == [5, 6]
+    with open(ruta_datos, encoding='utf-8') as f:
+        assert len(json.load(f)['alumnos']) == 6
+    assert "disco lleno" in capsys.readouterr().out
+
+
+def test_detener_reintenta_guardar_lo_pendiente(sistema, ruta_datos):
+    escrituras = contar_escrituras(sistema, fallar=1)
+
+    async def prueba(servidor, puerto):
+        return await servidor.atender('POST', '/alumnos', alta("N1"))
+
+    assert 'error_guardado' in ejecutar(sistema, prueba)[1]
+    assert escrituras == [5, 5]
+    with open(ruta_datos, encoding='utf-8') as f:
+        assert "N1" in [a['matricula'] for a in json.load(f)['alumnos']]
+
+
+def test_detener_durante_la_escritura_responde_lo_aplicado(sistema):
+    escrituras = contar_escrituras(sistema, espera=0.2)
+
+    async def prueba(servidor, puerto):
+        altas = [asyncio.ensure_future(servidor.atender('POST', '/alumnos', alta(f"N{i}")))
+                 for i in range(3)]
+        await asyncio.sleep(0.1)
+        await servidor.detener()
+        return await asyncio.gather(*altas)
+
+    resultados = ejecutar(sistema, prueba)
+
+    assert [estado for estado, _ in resultados] == [201] * 3
+    assert escrituras == [7]
+
+
+def test_detener_responde_a_las_altas_en_espera(sistema):
+    async def prueba(servidor, puerto):
+        altas = [asyncio.ensure_future(servidor.atender('POST', '/alumnos', alta(f"N{i}")))
+                 for i in range(3)]
+        await asyncio.sleep(0.05)
+        await servidor.detener()
+        return await asyncio.gather(*altas), await servidor.atender('POST', '/alumnos', alta("N9"))
+
+    en_espera, despues = ejecutar(sistema, prueba, ventana=10)
+
+    assert [estado for estado, _ in en_espera] == [503] * 3
+    assert despues[0] == 503
+    assert "N0" not in sistema.alumnos
+
+
+def test_content_length_invalido(sistema):
+    async def prueba(servidor, puerto):
+        lector, escritor = await asyncio.open_connection('127.0.0.1', puerto)
+        escritor.write(b"POST /alumnos HTTP/1.1\r\nContent-Length: diez\r\n\r\n{}")
+        respuesta = await lector.read()
+        escritor.close()
+        return respuesta
+
+    assert ejecutar(sistema, prueba).startswith(b"HTTP/1.1 400 Bad Request")
+
+
+def test_peticion_http(sistema):
+    async def prueba(servidor, puerto):
+        lector, escritor = await asyncio.open_connection('127.0.0.1', puerto)
+        escritor.write(b"GET /grupos/2/B/alumnos HTTP/1.1\r\nConnection: close\r\n\r\n")
+        respuesta = await lector.read()
+        escritor.close()
+        return respuesta
+
+    encabezados, _, cuerpo = ejecutar(sistema, prueba).partition(b"\r\n\r\n")
+    assert encabezados.startswith(b"HTTP/1.1 200 OK")
+    assert b"X-Latencia-Ms:" in encabezados
+    assert [a['matricula'] for a in json.loads(cuerpo)['datos']] == ["B1"]
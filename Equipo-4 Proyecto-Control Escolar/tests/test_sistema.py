@@ -0,0 +1,178 @@
+"""
+Pruebas del sistema: altas, bajas, calificaciones y persistencia
+"""
+
+import json
+
+from control_escolar import SistemaControlEscolar
+
+
+def test_alta_y_baja_de_alumno(sistema):
+    assert sistema.dar_alta_alumno("Eli", "Sol", "2010-01-01", "1", "A9", "1", "A")[0]
+    assert not sistema.dar_alta_alumno("Eli", "Sol", "2010-01-01", "1", "A9", "1", "A")[0]
+
+    exito, _ = sistema.dar_baja_alumno("A9")
+    assert exito
+    assert not sistema.alumnos["A9"].activo
+    assert not sistema.dar_baja_alumno("A9")[0]
+    assert not sistema.dar_baja_alumno("NO")[0]
+    assert "A9" not in [a.matricula for a in sistema.obtener_alumnos_por_grupo("1", "A")]
+
+
+def test_registrar_calificacion_valida_y_duplicada(sistema):
+    assert sistema.registrar_calificacion("A1", "M1", "2024-1", 85)[0]
+    exito, mensaje = sistema.registrar_calificacion("A1", "M1", "2024-1", 90)
+    assert not exito
+    assert "Ya existe" in mensaje
+    assert sistema.obtener_promedio_alumno("A1") == 85
+
+
+def test_registrar_calificacion_rechaza_valores_invalidos(sistema):
+    for valor in ("abc", None, -1, 100.5, float('nan')):
+        exito, _ = sistema.registrar_calificacion("A1", "M1", "2024-1", valor)
+        assert not exito
+    assert len(sistema.calificaciones) == 0
+    assert sistema.registrar_calificacion("A1", "M1", "2024-1", "70")[0]
+    assert sistema.obtener_calificaciones_alumno("A1")[0].calificacion == 70.0
+
+
+def test_registrar_calificacion_alumno_o_materia_inexistente(sistema):
+    assert not sistema.registrar_calificacion("ZZ", "M1", "2024-1", 80)[0]
+    assert not sistema.registrar_calificacion("A1", "MX", "2024-1", 80)[0]
+    sistema.dar_baja_alumno("A2")
+    assert not sistema.registrar_calificacion("A2", "M1", "2024-1", 80)[0]
+
+
+def test_datos_se_guardan_y_se_recargan(sistema, ruta_datos):
+    sistema.registrar_calificacion("A1", "M1", "2024-1", 85)
+    sistema.registrar_calificacion("A2", "M1", "2024-1", 60)
+    sistema.dar_baja_alumno("A3")
+
+    otro = SistemaControlEscolar(ruta_datos)
+    assert set(otro.alumnos) == set(sistema.alumnos)
+    assert not otro.alumnos["A3"].activo
+    assert [c.calificacion for c in otro.obtener_calificaciones_alumno("A1")] == [85.0]
+    # El contador de IDs continúa después de recargar
+    assert otro.registrar_calificacion("B1", "M2", "2024-1", 90)[0]
+    ids = sorted(c.id for c in otro.calificaciones.values())
+    assert ids == [1, 2, 3]
+
+
+def test_secuencia_de_ids_se_guarda_y_no_reutiliza_ids(sistema, ruta_datos):
+    sistema.registrar_calificacion("A1", "M1", "2024-1", 85)
+    sistema.registrar_calificacion("A2", "M1", "2024-1", 60)
+    assert sistema.exportar_datos()['secuencias'] == {'calificaciones': 3}
+
+    # Aunque la última calificación ya no esté en el archivo, su ID no se reutiliza
+    with open(ruta_datos, encoding='utf-8') as f:
+        datos = json.load(f)
+    assert datos['secuencias'] == {'calificaciones': 3}
+    datos['calificaciones'] = datos['calificaciones'][:1]
+    with open(ruta_datos, 'w', encoding='utf-8') as f:
+        json.dump(datos, f)
+
+    otro = SistemaControlEscolar(ruta_datos)
+    assert otro.registrar_calificacion("B1", "M2", "2024-1", 90)[0]
+    assert sorted(c.id for c in otro.calificaciones.values()) == [1, 3]
+    assert otro.exportar_datos()['secuencias'] == {'calificaciones': 4}
+
+
+def test_archivo_con_ids_de_texto_se_migra_y_se_conserva(sistema, ruta_datos):
+    with open(ruta_datos, encoding='utf-8') as f:
+        datos = json.load(f)
+    # Formato anterior: IDs de texto y sin secuencias
+    del datos['secuencias']
+    datos['calificaciones'] = [
+        {'id': "A1_M1_2024-1_20240101080000", 'matricula_alumno': "A1", 'materia_id': "M1",
+         'semestre': "2024-1", 'calificacion': 80, 'fecha_registro': "2024-01-01 08:00:00"},
+        {'id': "A2_M1_2024-1_20240101080000", 'matricula_alumno': "A2", 'materia_id': "M1",
+         'semestre': "2024-1", 'calificacion': 70, 'fecha_registro': "2024-01-01 08:00:00"}]
+    with open(ruta_datos, 'w', encoding='utf-8') as f:
+        json.dump(datos, f)
+
+    migrado = SistemaControlEscolar(ruta_datos)
+    assert sorted(c.id for c in migrado.calificaciones.values()) == [1, 2]
+    assert migrado.calificaciones["A2_M1_2024-1_20240101080000"].calificacion == 70.0
+    assert migrado.registrar_calificacion("B1", "M2", "2024-1", 90)[0]
+
+    # Al guardar y recargar se conservan los IDs enteros y los de texto
+    recargado = SistemaControlEscolar(ruta_datos)
+    por_id = {c.id: c for c in recargado.calificaciones.values()}
+    assert sorted(por_id) == [1, 2, 3]
+    assert [por_id[i].id_externo for i in (1, 2, 3)] == [
+        "A1_M1_2024-1_20240101080000", "A2_M1_2024-1_20240101080000", None]
+    assert recargado.calificaciones["A1_M1_2024-1_20240101080000"].id == 1
+    assert recargado.exportar_datos()['secuencias'] == {'calificaciones': 4}
+
+
+def test_escritura_diferida_escribe_una_sola_vez(sistema, ruta_datos):
+    escrituras = []
+    original = sistema.escribir_datos
+    sistema.escribir_datos = lambda datos, **kwargs: (escrituras.append(1), original(datos, **kwargs))
+    with sistema.escritura_diferida():
+        sistema.registrar_calificacion("A1", "M1", "2024-1", 85)
+        sistema.registrar_calificacion("A2", "M1", "2024-1", 75)
+    assert len(escrituras) == 1
+    with open(ruta_datos, encoding='utf-8') as f:
+        assert len(json.load(f)['calificaciones']) == 2
+
+
+def test_calificaciones_de_grupo_valida_cada_alumno(sistema):
+    sistema.registrar_calificacion("A3", "M1", "2024-1", 70)
+    sistema.dar_baja_alumno("A2")
+
+    registradas, errores = sistema.registrar_calificaciones_grupo(
+        "1", "A", "M1", "2024-1",
+        {"A1": "95", "A2": 80, "A3": 90, "B1": 80, "X9": 80, "A4": 80})
+
+    assert registradas == 1
+    assert set(errores) == {"A2", "A3", "B1", "X9", "A4"}
+    assert "dado de baja" in errores["A2"]
+    assert "Ya existe" in errores["A3"]
+    assert sistema.obtener_promedio_alumno("A1") == 95
+
+
+def test_calificaciones_de_grupo_rechaza_valores_y_materia(sistema):
+    registradas, errores = sistema.registrar_calificaciones_grupo(
+        "1", "A", "M1", "2024-1", {"A1": "abc", "A2": 101, "A3": -1})
+    assert registradas == 0
+    assert set(errores) == {"A1", "A2", "A3"}
+    assert len(sistema.calificaciones) == 0
+
+    registradas, errores = sistema.registrar_calificaciones_grupo("1", "A", "M9", "2024-1", {"A1": 90})
+    assert registradas == 0 and "M9" in errores["A1"]
+
+
+def alumno(matricula, **campos):
+    datos = {'nombre': "Eli", 'apellido': "Mora", 'fecha_nacimiento': "2010-01-01",
+             'telefono': "555", 'matricula': matricula, 'grado': "1", 'grupo': "A"}
+    datos.update(campos)
+    return datos
+
+
+def test_alta_masiva_errores_por_numero_de_registro(sistema, ruta_datos):
+    registros = (r for r in [alumno("N1"), alumno("A1"), alumno("N1"), alumno("N1"),
+                             alumno(""), {'matricula': "N2"}, alumno(" N3 ")])
+
+    agregados, errores = sistema.dar_alta_alumnos(registros)
+
+    assert agregados == 2
+    # Las dos repeticiones de N1 conservan cada una su error
+    assert errores == {
+        2: "Ya existe un alumno con matrícula A1",
+        3: "Matrícula N1 repetida en el lote",
+        4: "Matrícula N1 repetida en el lote",
+        5: "Falta la matrícula",
+        6: errores[6],
+    }
+    assert errores[6].startswith("Faltan campos de N2")
+    assert sistema.alumnos["N3"].activo
+    otro = SistemaControlEscolar(ruta_datos)
+    assert {"N1", "N3"} <= set(otro.alumnos)
+
+
+def test_alta_masiva_vacia_no_escribe(sistema):
+    escrituras = []
+    sistema.escribir_datos = lambda datos, **kwargs: escrituras.append(1)
+    assert sistema.dar_alta_alumnos([alumno("A1")]) == (0, {1: "Ya existe un alumno con matrícula A1"})
+    assert escrituras == []